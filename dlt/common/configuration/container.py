@@ -91,11 +91,7 @@ class Container:
         if spec.global_affinity:
             return self.main_context
         else:
-            # thread pool names used in dlt contain originating thread id. use this id over pool id
-            if m := re.match(r"dlt-pool-(\d+)-", threading.current_thread().name):
-                thread_id = int(m.group(1))
-            else:
-                thread_id = threading.get_ident()
+            thread_id = Container._originating_thread_id()
 
             # return main context for main thread
             if thread_id == Container._MAIN_THREAD_ID:
@@ -193,6 +189,14 @@ class Container:
     @staticmethod
     def thread_pool_prefix() -> str:
         """Creates a container friendly pool prefix that contains starting thread id. Container implementation will automatically use it
-        for any thread-affine contexts instead of using id of the pool thread
+        for any thread-affine contexts instead of using id of the pool thread. Pools started from a pool thread keep the id
+        of the originating thread.
         """
-        return f"dlt-pool-{threading.get_ident()}-"
+        return f"dlt-pool-{Container._originating_thread_id()}-"
+
+    @staticmethod
+    def _originating_thread_id() -> int:
+        # thread pool names used in dlt contain originating thread id. use this id over pool id
+        if m := re.match(r"dlt-pool-(\d+)-", threading.current_thread().name):
+            return int(m.group(1))
+        return threading.get_ident()
@@ -1,4 +1,5 @@
 import gzip
+import sys
 import time
 import contextlib
 from typing import ClassVar, Iterator, List, IO, Any, Optional, Type, Generic
@@ -24,10 +25,29 @@ def new_file_id() -> str:
     return uniq_id(5)
 
 
+def estimate_item_bytes(item: TDataItems) -> int:
+    """Estimates in-memory size of data `item`. Uses `nbytes` of arrow tables and batches, memory usage of
+    data frames and shallow size of dictionaries and their values. Lists are estimated item by item.
+    """
+    if isinstance(item, list):
+        return sum(estimate_item_bytes(i) for i in item)
+    if isinstance(item, dict):
+        return sys.getsizeof(item) + sum(sys.getsizeof(v) for v in item.values())
+    if (nbytes := getattr(item, "nbytes", None)) is not None:
+        return int(nbytes)
+    if hasattr(item, "memory_usage"):
+        return int(item.memory_usage(index=False).sum())
+    return sys.getsizeof(item)
+
+
 class BufferedDataWriter(Generic[TWriter]):
     @configspec
     class BufferedDataWriterConfiguration(BaseConfiguration):
         buffer_max_items: int = 5000
+        buffer_max_bytes: Optional[int] = None
+        """Flushes the buffer when estimated in-memory size of buffered items exceeds this value"""
+        total_buffer_max_bytes: Optional[int] = None
+        """Memory budget shared by buffers of all writers in a data item storage. Largest buffers are flushed first when exceeded"""
         file_max_items: Optional[int] = None
         file_max_bytes: Optional[int] = None
         disable_compression: bool = False
@@ -42,6 +62,8 @@ class BufferedDataWriter(Generic[TWriter]):
         file_name_template: str,
         *,
         buffer_max_items: int = 5000,
+        buffer_max_bytes: int = None,
+        total_buffer_max_bytes: int = None,
         file_max_items: int = None,
         file_max_bytes: int = None,
         disable_compression: bool = False,
@@ -58,6 +80,9 @@ class BufferedDataWriter(Generic[TWriter]):
         self.closed_files: List[DataWriterMetrics] = []  # all fully processed files
         # buffered items must be less than max items in file
         self.buffer_max_items = min(buffer_max_items, file_max_items or buffer_max_items)
+        self.buffer_max_bytes = buffer_max_bytes
+        # enforced by data item storage that owns the writer
+        self.total_buffer_max_bytes = total_buffer_max_bytes
         # Explicitly configured max size supersedes destination limit
         self.file_max_bytes = file_max_bytes
         if self.file_max_bytes is None and _caps:
@@ -72,6 +97,8 @@ class BufferedDataWriter(Generic[TWriter]):
         self._file_name: str = None
         self._buffered_items: List[TDataItem] = []
         self._buffered_items_count: int = 0
+        self._buffered_bytes: int = 0
+        self._peak_buffered_bytes: int = 0
         self._writer: TWriter = None
         self._file: IO[Any] = None
         self._created: float = None
@@ -102,22 +129,21 @@ class BufferedDataWriter(Generic[TWriter]):
         # add item to buffer and count new rows
         new_rows_count = self._buffer_items_with_row_count(item)
         self._buffered_items_count += new_rows_count
+        # estimate buffer size only when limited, estimation is not free
+        if self.buffer_max_bytes or self.total_buffer_max_bytes:
+            self._buffered_bytes += estimate_item_bytes(item)
+            if self._buffered_bytes > self._peak_buffered_bytes:
+                self._peak_buffered_bytes = self._buffered_bytes
         # set last modification date
         self._last_modified = time.time()
         # flush if max buffer exceeded, the second path of the expression prevents empty data frames to pile up in the buffer
         if (
             self._buffered_items_count >= self.buffer_max_items
             or len(self._buffered_items) >= self.buffer_max_items
+            or (self.buffer_max_bytes and self._buffered_bytes >= self.buffer_max_bytes)
         ):
             self._flush_items()
-        # rotate the file if max_bytes exceeded
-        if self._file:
-            # rotate on max file size
-            if self.file_max_bytes and self._file.tell() >= self.file_max_bytes:
-                self._rotate_file()
-            # rotate on max items
-            elif self.file_max_items and self._writer.items_count >= self.file_max_items:
-                self._rotate_file()
+        self._rotate_file_if_full()
         return new_rows_count
 
     def write_empty_file(self, columns: TTableSchemaColumns) -> DataWriterMetrics:
@@ -176,10 +202,20 @@ class BufferedDataWriter(Generic[TWriter]):
             self._flush_and_close_file(skip_flush=skip_flush)
             self._closed = True
 
+    def flush(self) -> None:
+        """Writes buffered items to the current file and rotates it if it got too large"""
+        self._flush_items()
+        self._rotate_file_if_full()
+
     @property
     def closed(self) -> bool:
         return self._closed
 
+    @property
+    def buffered_bytes(self) -> int:
+        """Estimated in-memory size of buffered items"""
+        return self._buffered_bytes
+
     @contextlib.contextmanager
     def alternative_spec(self, spec: FileWriterSpec) -> Iterator[FileWriterSpec]:
         """Temporarily changes the writer spec ie. for the moment file is rotated"""
@@ -226,6 +262,16 @@ class BufferedDataWriter(Generic[TWriter]):
                 new_rows_count = 1
         return new_rows_count
 
+    def _rotate_file_if_full(self) -> None:
+        # rotate the file if max_bytes exceeded
+        if self._file:
+            # rotate on max file size
+            if self.file_max_bytes and self._file.tell() >= self.file_max_bytes:
+                self._rotate_file()
+            # rotate on max items
+            elif self.file_max_items and self._writer.items_count >= self.file_max_items:
+                self._rotate_file()
+
     def _rotate_file(self, allow_empty_file: bool = False) -> DataWriterMetrics:
         metrics = self._flush_and_close_file(allow_empty_file)
         self._file_name = (
@@ -251,6 +297,7 @@ class BufferedDataWriter(Generic[TWriter]):
             # reset buffer and counter
             self._buffered_items.clear()
             self._buffered_items_count = 0
+            self._buffered_bytes = 0
 
     def _flush_and_close_file(
         self, allow_empty_file: bool = False, skip_flush: bool = False
@@ -275,6 +322,7 @@ class BufferedDataWriter(Generic[TWriter]):
             self._file.tell(),
             self._created,
             self._last_modified,
+            self._peak_buffered_bytes,
         )
         self.closed_files.append(metrics)
         self._file.close()
@@ -283,6 +331,7 @@ class BufferedDataWriter(Generic[TWriter]):
         self._file_name = None
         self._created = None
         self._last_modified = None
+        self._peak_buffered_bytes = 0
         return metrics
 
     def _ensure_open(self) -> None:
@@ -331,20 +331,53 @@ class ParquetDataWriter(DataWriter):
         self.writer = self._create_writer(self.schema)
 
     def write_data(self, items: Sequence[TDataItem]) -> None:
-        super().write_data(items)
+        from dlt.common.libs.pyarrow import pyarrow
+
+        # rows may be interleaved with arrow tables that were normalized in batches
+        tables: List[pyarrow.Table] = []
+        rows: List[TDataItem] = []
+        for item in items:
+            if isinstance(item, dict):
+                rows.append(item)
+            else:
+                if rows:
+                    tables.append(self._rows_to_table(rows))
+                    rows = []
+                tables.append(self._align_table(item))
+        if rows:
+            tables.append(self._rows_to_table(rows))
+
+        table = tables[0] if len(tables) == 1 else pyarrow.concat_tables(tables)
+        self.items_count += table.num_rows
+        # Write
+        self.writer.write_table(table, row_group_size=self.parquet_row_group_size)
+
+    def _rows_to_table(self, rows: Sequence[TDataItem]) -> "pa.Table":
         from dlt.common.libs.pyarrow import pyarrow
 
         # serialize json types and replace with strings
         for key in self.nested_indices:
-            for row in items:
+            for row in rows:
                 if (value := row.get(key)) is not None:
                     # TODO: make this configurable
                     if value is not None and not isinstance(value, str):
                         row[key] = json.dumps(value)
 
-        table = pyarrow.Table.from_pylist(items, schema=self.schema)
-        # Write
-        self.writer.write_table(table, row_group_size=self.parquet_row_group_size)
+        return pyarrow.Table.from_pylist(rows, schema=self.schema)
+
+    def _align_table(self, table: "pa.Table") -> "pa.Table":
+        """Selects and casts columns of arrow `table` to writer schema. Missing columns are set to null"""
+        from dlt.common.libs.pyarrow import pyarrow
+
+        arrays = [
+            (
+                table[field.name].cast(field.type)
+                if field.name in table.column_names
+                else pyarrow.nulls(table.num_rows, field.type)
+            )
+            for field in self.schema
+        ]
+        return pyarrow.Table.from_arrays(arrays, schema=self.schema)
 
     def close(self) -> None:  # noqa
         if self.writer:
@@ -162,6 +162,10 @@ class DestinationCapabilitiesContext(ContainerInjectableContext):
     max_rows_per_insert: Optional[int] = None
     insert_values_writer_type: str = "default"
     supports_multiple_statements: bool = True
+    explicit_loader_file_formats: Sequence[TLoaderFileFormat] = None
+    """Supported loader file formats used only when requested with `loader_file_format`, never selected automatically"""
+    parametrized_insert_file_formats: Sequence[TLoaderFileFormat] = None
+    """Loader file formats inserted row by row with parametrized, batched INSERT statements"""
     supports_clone_table: bool = False
     """Destination supports CREATE TABLE ... CLONE ... statements"""
 
@@ -235,6 +235,9 @@ class DestinationClientDwhConfiguration(DestinationClientConfiguration):
     """Layout for staging dataset, where %s is replaced with dataset name. placeholder is optional"""
     enable_dataset_name_normalization: bool = True
     """Whether to normalize the dataset name. Affects staging dataset as well."""
+    schema_sync_workers: int = 1
+    """Number of connections used to sync the schema with the destination. If larger than 1, table metadata is fetched in
+    parallel batches and, on destinations without DDL transactions, tables are created and altered concurrently"""
 
     def _bind_dataset_name(
         self: TDestinationDwhClient, dataset_name: str, default_schema_name: str = None
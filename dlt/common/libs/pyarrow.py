@@ -1,3 +1,4 @@
+import threading
 from datetime import datetime, date  # noqa: I251
 from pendulum.tz import UTC
 from typing import (
@@ -10,6 +11,8 @@ from typing import (
     Callable,
     Iterable,
     Iterator,
+    List,
+    NamedTuple,
     Sequence,
     Tuple,
 )
@@ -572,73 +575,154 @@ def concat_batches_and_tables_in_order(
     return pyarrow.concat_tables(tables, promote_options="none")
 
 
+TColumnConverter = Callable[[pyarrow.Field, Sequence[Any]], pyarrow.Array]
+"""Converts a single column of python values into an arrow array of the field type"""
+
+ROW_TUPLES_PLANS_CACHE_SIZE = 256
+"""Max number of column converter plans kept by `row_tuples_to_arrow`"""
+
+
+class _RowTuplesPlan(NamedTuple):
+    arrow_schema: pyarrow.Schema
+    known_columns: List[Tuple[int, pyarrow.Field, TColumnConverter]]
+    """Row index, arrow field and converter of each column with known data type"""
+    unknown_columns: List[Tuple[int, str]]
+    """Row index and name of each column which type must be inferred from data"""
+
+
+_ROW_TUPLES_PLANS: Dict[Tuple[Any, ...], _RowTuplesPlan] = {}
+_ROW_TUPLES_PLANS_LOCK = threading.Lock()
+
+
+def _convert_typed_column(field: pyarrow.Field, values: Sequence[Any]) -> pyarrow.Array:
+    return pyarrow.array(values, type=field.type)
+
+
+def _convert_decimal_column(field: pyarrow.Field, values: Sequence[Any]) -> pyarrow.Array:
+    try:
+        return pyarrow.array(values, type=field.type)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        # decimals and floats are often mixed up in dialects
+        logger.warning(
+            f"Field {field.name} was reflected as decimal type, but rows contain values of other"
+            " types. Additional cast is required which may slow down arrow table generation."
+        )
+    float_array = pyarrow.array(
+        [None if v is None else float(v) for v in values], type=pyarrow.float64()
+    )
+    return float_array.cast(field.type, safe=False)
+
+
+def _convert_json_column(field: pyarrow.Field, values: Sequence[Any]) -> pyarrow.Array:
+    if all(v is None or isinstance(v, str) for v in values):
+        return pyarrow.array(values, type=field.type)
+    logger.warning(
+        f"Field {field.name} was reflected as JSON type and needs to be serialized back to"
+        " string to be placed in arrow table. This will slow data extraction down. You"
+        " should cast JSON field to STRING in your database system ie. by creating and"
+        " extracting an SQL VIEW that selects with cast."
+    )
+    return pyarrow.array(
+        [
+            (
+                v
+                if v is None or isinstance(v, str)
+                else json.dumps(list(v) if isinstance(v, set) else v)
+            )
+            for v in values
+        ],
+        type=field.type,
+    )
+
+
+def _get_column_converter(column: TColumnType) -> TColumnConverter:
+    data_type = column["data_type"]
+    if data_type in ("decimal", "wei"):
+        return _convert_decimal_column
+    if data_type == "json":
+        return _convert_json_column
+    return _convert_typed_column
+
+
+def _get_row_tuples_plan(
+    caps: DestinationCapabilitiesContext, columns: TTableSchemaColumns, tz: str
+) -> _RowTuplesPlan:
+    """Gets a cached plan that maps row tuple positions to arrow fields and column converters.
+    Consecutive chunks of the same table share the plan.
+    """
+    # only precisions are taken from caps when arrow schema is generated
+    caps_key = (
+        (caps.timestamp_precision, caps.decimal_precision, caps.wei_precision) if caps else None
+    )
+    key = (
+        caps_key,
+        tz,
+        tuple(
+            (
+                name,
+                col.get("data_type"),
+                col.get("nullable"),
+                col.get("timezone"),
+                col.get("precision"),
+                col.get("scale"),
+            )
+            for name, col in columns.items()
+        ),
+    )
+    with _ROW_TUPLES_PLANS_LOCK:
+        plan = _ROW_TUPLES_PLANS.get(key)
+    if plan is not None:
+        return plan
+
+    arrow_schema = columns_to_arrow(columns, caps, tz)
+    known_columns: List[Tuple[int, pyarrow.Field, TColumnConverter]] = []
+    unknown_columns: List[Tuple[int, str]] = []
+    for idx, (name, col) in enumerate(columns.items()):
+        if col.get("data_type") is None:
+            unknown_columns.append((idx, name))
+        else:
+            known_columns.append((idx, arrow_schema.field(name), _get_column_converter(col)))
+
+    plan = _RowTuplesPlan(arrow_schema, known_columns, unknown_columns)
+    with _ROW_TUPLES_PLANS_LOCK:
+        if len(_ROW_TUPLES_PLANS) >= ROW_TUPLES_PLANS_CACHE_SIZE:
+            _ROW_TUPLES_PLANS.clear()
+        _ROW_TUPLES_PLANS[key] = plan
+    return plan
+
+
 def row_tuples_to_arrow(
     rows: Sequence[Any], caps: DestinationCapabilitiesContext, columns: TTableSchemaColumns, tz: str
 ) -> Any:
     """Converts the rows to an arrow table using the columns schema.
     Columns missing `data_type` will be inferred from the row data.
     Columns with object types not supported by arrow are excluded from the resulting table.
+
+    Rows are pivoted into python columns and each column with known data type is converted
+    directly into an arrow array of its type. All values in the chunk are validated, not only the
+    first row.
     """
     from dlt.common.libs.pyarrow import pyarrow as pa
-    import numpy as np
 
-    try:
-        from pandas._libs import lib
-
-        pivoted_rows = lib.to_object_array_tuples(rows).T
-    except ImportError:
-        logger.info(
-            "Pandas not installed, reverting to numpy.asarray to create a table which is slower"
-        )
-        pivoted_rows = np.asarray(rows, dtype="object", order="k").T  # type: ignore[call-overload]
+    plan = _get_row_tuples_plan(caps, columns, tz)
+    if rows:
+        pivoted_rows: List[Sequence[Any]] = list(zip(*rows))
+    else:
+        pivoted_rows = [()] * len(columns)
 
-    columnar = {
-        col: dat.ravel() for col, dat in zip(columns, np.vsplit(pivoted_rows, len(pivoted_rows)))
-    }
     columnar_known_types = {
-        col["name"]: columnar[col["name"]]
-        for col in columns.values()
-        if col.get("data_type") is not None
-    }
-    columnar_unknown_types = {
-        col["name"]: columnar[col["name"]]
-        for col in columns.values()
-        if col.get("data_type") is None
+        field.name: converter(field, pivoted_rows[idx])
+        for idx, field, converter in plan.known_columns
     }
+    arrow_schema = plan.arrow_schema
 
-    arrow_schema = columns_to_arrow(columns, caps, tz)
-
-    for idx in range(0, len(arrow_schema.names)):
-        field = arrow_schema.field(idx)
-        py_type = type(rows[0][idx])
-        # cast double / float ndarrays to decimals if type mismatch, looks like decimals and floats are often mixed up in dialects
-        if pa.types.is_decimal(field.type) and issubclass(py_type, (str, float)):
-            logger.warning(
-                f"Field {field.name} was reflected as decimal type, but rows contains"
-                f" {py_type.__name__}. Additional cast is required which may slow down arrow table"
-                " generation."
-            )
-            float_array = pa.array(columnar_known_types[field.name], type=pa.float64())
-            columnar_known_types[field.name] = float_array.cast(field.type, safe=False)
-        if issubclass(py_type, (dict, list, set)):
-            logger.warning(
-                f"Field {field.name} was reflected as JSON type and needs to be serialized back to"
-                " string to be placed in arrow table. This will slow data extraction down. You"
-                " should cast JSON field to STRING in your database system ie. by creating and"
-                " extracting an SQL VIEW that selects with cast."
-            )
-            json_str_array = pa.array(
-                [None if s is None else json.dumps(s) if not issubclass(type(s), set) else json.dumps(list(s)) for s in columnar_known_types[field.name]]
-            )
-            columnar_known_types[field.name] = json_str_array
-
-    # If there are unknown type columns, first create a table to infer their types
-    if columnar_unknown_types:
+    # If there are unknown type columns, infer their types from data
+    if plan.unknown_columns:
         new_schema_fields = []
-        for key in list(columnar_unknown_types):
+        for idx, key in plan.unknown_columns:
             arrow_col: Optional[pa.Array] = None
             try:
-                arrow_col = pa.array(columnar_unknown_types[key])
+                arrow_col = pa.array(pivoted_rows[idx])
                 if pa.types.is_null(arrow_col.type):
                     logger.warning(
                         f"Column {key} contains only NULL values and data type could not be"
@@ -651,7 +735,7 @@ def row_tuples_to_arrow(
                 # E.g. dataclasses -> dict, UUID -> str
                 try:
                     arrow_col = pa.array(
-                        map_nested_in_place(custom_encode, list(columnar_unknown_types[key]))
+                        map_nested_in_place(custom_encode, list(pivoted_rows[idx]))
                     )
                     logger.warning(
                         f"Column {key} contains a data type which is not supported by pyarrow and"
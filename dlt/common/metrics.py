@@ -8,6 +8,8 @@ class DataWriterMetrics(NamedTuple):
     file_size: int
     created: float
     last_modified: float
+    peak_buffer_bytes: int = 0
+    """Peak estimated in-memory size of items buffered while writing the file"""
 
     def __add__(self, other: Tuple[object, ...], /) -> Tuple[object, ...]:
         if isinstance(other, DataWriterMetrics):
@@ -18,6 +20,7 @@ class DataWriterMetrics(NamedTuple):
                 self.file_size + other.file_size,
                 min(self.created, other.created),
                 max(self.last_modified, other.last_modified),
+                max(self.peak_buffer_bytes, other.peak_buffer_bytes),
             )
         return NotImplemented
 
@@ -50,11 +53,24 @@ class ExtractMetrics(StepMetrics):
     """Hints passed to the resources"""
 
 
+class NormalizeWorkerMetrics(NamedTuple):
+    worker_id: str
+    """Identifier of the worker process"""
+    units_count: int
+    """Number of work units (files or parts of files) normalized by the worker"""
+    busy_seconds: float
+    """Time the worker spent normalizing work units"""
+    utilization: float
+    """Fraction of the package normalization time that the worker was busy"""
+
+
 class NormalizeMetrics(StepMetrics):
     job_metrics: Dict[str, DataWriterMetrics]
     """Metrics collected per job id during writing of job file"""
     table_metrics: Dict[str, DataWriterMetrics]
     """Job metrics aggregated by table"""
+    worker_metrics: Dict[str, NormalizeWorkerMetrics]
+    """Utilization of normalize workers by worker id"""
 
 
 class LoadJobMetrics(NamedTuple):
@@ -67,5 +83,20 @@ class LoadJobMetrics(NamedTuple):
     remote_url: Optional[str]
 
 
+class LoadSchedulerMetrics(NamedTuple):
+    jobs_count: int
+    """Number of jobs started"""
+    slots: int
+    """Maximum number of jobs running in parallel"""
+    queue_wait_seconds: float
+    """Average time a job waited in new jobs before it was started"""
+    max_queue_wait_seconds: float
+    """Longest time a job waited in new jobs before it was started"""
+    utilization: float
+    """Fraction of the slots that were occupied by running jobs during package loading"""
+
+
 class LoadMetrics(StepMetrics):
     job_metrics: Dict[str, LoadJobMetrics]
+    scheduler_metrics: LoadSchedulerMetrics
+    """Queue wait time and slot utilization of the load jobs scheduler"""
@@ -3,8 +3,13 @@ from typing import Dict, List, Mapping, Optional, Sequence, Tuple, cast, TypedDi
 from dlt.common.destination.utils import resolve_merge_strategy
 from dlt.common.json import json
 from dlt.common.normalizers.exceptions import InvalidJsonNormalizer
+from dlt.common.normalizers.naming import NamingConvention
 from dlt.common.normalizers.typing import TJSONNormalizer, TRowIdType
-from dlt.common.normalizers.utils import generate_dlt_id, DLT_ID_LENGTH_BYTES
+from dlt.common.normalizers.utils import (
+    generate_dlt_id,
+    get_nested_row_hashes,
+    DLT_ID_LENGTH_BYTES,
+)
 
 from dlt.common.typing import DictStrAny, TDataItem, StrAny
 from dlt.common.schema import Schema
@@ -31,6 +36,9 @@ from dlt.common.normalizers.json import (
 )
 from dlt.common.validation import validate_dict
 
+IDENTIFIER_CACHE_MAX_SIZE = 1024 * 16
+"""Max number of entries in each of the identifier and nested type caches, least recently used are evicted"""
+
 
 class RelationalNormalizerConfigPropagation(TypedDict, total=False):
     root: Optional[Dict[TColumnName, TColumnName]]
@@ -102,16 +110,8 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
 
         def norm_row_dicts(dict_row: StrAny, __r_lvl: int, path: Tuple[str, ...] = ()) -> None:
             for k, v in dict_row.items():
-                if k.strip():
-                    norm_k = self._normalize_identifier(self.schema, k)
-                else:
-                    # for empty keys in the data use _
-                    norm_k = self.EMPTY_KEY_IDENTIFIER
-                # if norm_k != k:
-                #     print(f"{k} -> {norm_k}")
-                nested_name = (
-                    norm_k if path == () else self._shorten_fragments(self.schema, *path, norm_k)
-                )
+                # normalized key and full nested name are cached together for given path
+                norm_k, nested_name = self._normalize_path_fragment(self.naming, path, k)
                 # for lists and dicts we must check if type is possibly nested
                 if isinstance(v, (dict, list)):
                     if not self._is_nested_type(self.schema, table, nested_name, __r_lvl):
@@ -122,7 +122,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
                         else:
                             # pass the list to out_rec_list
                             out_rec_list[
-                                path + (self._normalize_table_identifier(self.schema, k),)
+                                path + (self._normalize_table_identifier(self.naming, k),)
                             ] = v
                         continue
                     else:
@@ -142,9 +142,11 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         Excludes dlt system columns.
         Can be used as deterministic row identifier.
         """
-        row_filtered = {k: v for k, v in row.items() if not k.startswith(DLT_NAME_PREFIX)}
         if subset is not None:
-            row_filtered = {k: v for k, v in row.items() if k in subset}
+            # serialize only the key columns, keys are sorted when dumping
+            row_filtered = {k: row[k] for k in subset if k in row}
+        else:
+            row_filtered = {k: v for k, v in row.items() if not k.startswith(DLT_NAME_PREFIX)}
         row_str = json.dumps(row_filtered, sort_keys=True)
         return digest128(row_str, DLT_ID_LENGTH_BYTES)
 
@@ -173,6 +175,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         parent_row_id: str,
         pos: int,
         is_root: bool = False,
+        nested_row_hash: str = None,
     ) -> str:
         if is_root:  # root table
             row_id_type = self._get_root_row_id_type(self.schema, table)
@@ -188,7 +191,9 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         else:  # nested table
             row_id_type, is_nested = self._get_nested_row_id_type(self.schema, table)
             if row_id_type == "row_hash":
-                row_id = DataItemNormalizer._get_nested_row_hash(parent_row_id, table, pos)
+                row_id = nested_row_hash or DataItemNormalizer._get_nested_row_hash(
+                    parent_row_id, table, pos
+                )
                 # link to parent table
                 if is_nested:
                     self._link_row(flattened_row, parent_row_id, pos)
@@ -227,13 +232,25 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         parent_row_id: Optional[str] = None,
         _r_lvl: int = 0,
     ) -> TNormalizedRowIterator:
-        table = self._shorten_fragments(self.schema, *parent_path, *ident_path)
+        table = self._shorten_fragments(self.naming, *parent_path, *ident_path)
+        # compute hashes of all nested rows at once
+        row_hashes: Sequence[str] = ()
+        if parent_row_id and self._get_nested_row_id_type(self.schema, table)[0] == "row_hash":
+            row_hashes = get_nested_row_hashes([parent_row_id] * len(seq), table, range(len(seq)))
 
         for idx, v in enumerate(seq):
+            row_hash = row_hashes[idx] if row_hashes else None
             if isinstance(v, dict):
                 # found dict element in seq
                 yield from self._normalize_row(
-                    v, extend, ident_path, parent_path, parent_row_id, idx, _r_lvl
+                    v,
+                    extend,
+                    ident_path,
+                    parent_path,
+                    parent_row_id,
+                    idx,
+                    _r_lvl,
+                    row_hash=row_hash,
                 )
             elif isinstance(v, list):
                 # to normalize lists of lists, we must create a tracking intermediary table by creating a mock row
@@ -245,13 +262,16 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
                     parent_row_id,
                     idx,
                     _r_lvl - 1,
+                    row_hash=row_hash,
                 )
             else:
                 # found non-dict in seq, so wrap it
                 wrap_v = wrap_in_dict(self.c_value, v)
                 DataItemNormalizer._extend_row(extend, wrap_v)
-                self._add_row_id(table, wrap_v, wrap_v, parent_row_id, idx)
-                yield (table, self._shorten_fragments(self.schema, *parent_path)), wrap_v
+                self._add_row_id(
+                    table, wrap_v, wrap_v, parent_row_id, idx, nested_row_hash=row_hash
+                )
+                yield (table, self._shorten_fragments(self.naming, *parent_path)), wrap_v
 
     def _normalize_row(
         self,
@@ -263,9 +283,9 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         pos: Optional[int] = None,
         _r_lvl: int = 0,
         is_root: bool = False,
+        row_hash: str = None,
     ) -> TNormalizedRowIterator:
-        schema = self.schema
-        table = self._shorten_fragments(schema, *parent_path, *ident_path)
+        table = self._shorten_fragments(self.naming, *parent_path, *ident_path)
         # flatten current row and extract all lists to recur into
         flattened_row, lists = self._flatten(table, dict_row, _r_lvl)
         # always extend row
@@ -273,14 +293,16 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         # infer record hash or leave existing primary key if present
         row_id = flattened_row.get(self.c_dlt_id, None)
         if not row_id:
-            row_id = self._add_row_id(table, dict_row, flattened_row, parent_row_id, pos, is_root)
+            row_id = self._add_row_id(
+                table, dict_row, flattened_row, parent_row_id, pos, is_root, row_hash
+            )
 
         # find fields to propagate to nested tables in config
         extend.update(self._get_propagated_values(table, flattened_row, is_root))
 
         # yield parent table first
         should_descend = yield (
-            (table, self._shorten_fragments(schema, *parent_path)),
+            (table, self._shorten_fragments(self.naming, *parent_path)),
             flattened_row,
         )
         if should_descend is False:
@@ -361,7 +383,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         # identify load id if loaded data must be processed after loading incrementally
         row[self.c_dlt_load_id] = load_id
         # get table name and nesting level
-        root_table_name = self._normalize_table_identifier(self.schema, table_name)
+        root_table_name = self._normalize_table_identifier(self.naming, table_name)
         max_nesting = self._get_table_nesting_level(self.schema, root_table_name, self.max_nesting)
 
         yield from self._normalize_row(
@@ -430,20 +452,43 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
     #
     # Cached helper methods for all operations that are called often
     #
-    @staticmethod
-    @lru_cache(maxsize=None)
-    def _shorten_fragments(schema: Schema, *idents: str) -> str:
-        return schema.naming.shorten_fragments(*idents)
+    @classmethod
+    def get_identifier_cache_info(cls) -> Dict[str, Dict[str, int]]:
+        """Returns hits, misses, max size and current size of identifier and nested type caches.
+        Caches are shared by all instances of the normalizer.
+        """
+        caches = {
+            "normalize_path_fragment": cls._normalize_path_fragment,
+            "shorten_fragments": cls._shorten_fragments,
+            "normalize_table_identifier": cls._normalize_table_identifier,
+            "is_nested_type": cls._is_nested_type,
+        }
+        return {name: f.cache_info()._asdict() for name, f in caches.items()}
+
+    @classmethod
+    @lru_cache(maxsize=IDENTIFIER_CACHE_MAX_SIZE)
+    def _normalize_path_fragment(
+        cls, naming: NamingConvention, path: Tuple[str, ...], key: str
+    ) -> Tuple[str, str]:
+        """Normalizes `key` of a dict found at `path` and returns it together with full nested name"""
+        if key.strip():
+            norm_k = naming.normalize_path(key)
+        else:
+            # for empty keys in the data use _
+            norm_k = cls.EMPTY_KEY_IDENTIFIER
+        if path == ():
+            return norm_k, norm_k
+        return norm_k, naming.shorten_fragments(*path, norm_k)
 
     @staticmethod
-    @lru_cache(maxsize=None)
-    def _normalize_table_identifier(schema: Schema, table_name: str) -> str:
-        return schema.naming.normalize_table_identifier(table_name)
+    @lru_cache(maxsize=IDENTIFIER_CACHE_MAX_SIZE)
+    def _shorten_fragments(naming: NamingConvention, *idents: str) -> str:
+        return naming.shorten_fragments(*idents)
 
     @staticmethod
-    @lru_cache(maxsize=None)
-    def _normalize_identifier(schema: Schema, identifier: str) -> str:
-        return schema.naming.normalize_path(identifier)
+    @lru_cache(maxsize=IDENTIFIER_CACHE_MAX_SIZE)
+    def _normalize_table_identifier(naming: NamingConvention, table_name: str) -> str:
+        return naming.normalize_table_identifier(table_name)
 
     @staticmethod
     @lru_cache(maxsize=None)
@@ -470,7 +515,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         return get_columns_names_with_prop(table, "primary_key", include_incomplete=True)
 
     @staticmethod
-    @lru_cache(maxsize=None)
+    @lru_cache(maxsize=IDENTIFIER_CACHE_MAX_SIZE)
     def _is_nested_type(
         schema: Schema,
         table_name: str,
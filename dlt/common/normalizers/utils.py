@@ -1,5 +1,7 @@
 import os
-from typing import List
+import base64
+import hashlib
+from typing import Any, List, Sequence
 
 from dlt.common import known_env
 from dlt.common.utils import uniq_id_base64, many_uniq_ids_base64
@@ -14,3 +16,38 @@ def generate_dlt_ids(n_ids: int) -> List[str]:
 
 def generate_dlt_id() -> str:
     return uniq_id_base64(DLT_ID_LENGTH_BYTES)
+
+
+def get_nested_row_hashes(
+    parent_row_ids: Sequence[str], nested_table: str, list_idxs: Sequence[int]
+) -> List[str]:
+    """Computes row ids of nested rows from triples of parent row id, nested table name and position in
+    the list. Ids are identical to those computed one by one with `digest128(f"{parent_row_id}_{nested_table}_{list_idx}")`.
+
+    Hash of the `parent_row_id` and `nested_table` prefix is computed once for consecutive rows of the same
+    parent and all digests are base64 encoded together.
+    """
+    shake_128 = hashlib.shake_128
+    table_suffix = f"_{nested_table}_"
+    # pad digests so they are aligned to base64 3 byte groups
+    padding = b"\0" * (-DLT_ID_LENGTH_BYTES % 3)
+    digests: List[bytes] = []
+    prev_parent_row_id: str = None
+    prefix_hash: Any = None
+    for parent_row_id, list_idx in zip(parent_row_ids, list_idxs):
+        if parent_row_id != prev_parent_row_id:
+            prefix_hash = shake_128((parent_row_id + table_suffix).encode("utf-8"))
+            prev_parent_row_id = parent_row_id
+        row_hash = prefix_hash.copy()
+        row_hash.update(str(list_idx).encode("ascii"))
+        digests.append(row_hash.digest(DLT_ID_LENGTH_BYTES) + padding)
+    return _encode_digests(digests, DLT_ID_LENGTH_BYTES + len(padding))
+
+
+def _encode_digests(digests: List[bytes], padded_length: int) -> List[str]:
+    """Base64 encodes padded `digests` at once and splits them into ids without `=` padding"""
+    encoded = base64.b64encode(b"".join(digests)).decode("ascii")
+    step = padded_length // 3 * 4
+    # number of base64 characters that encode the digest without padding
+    id_length = (DLT_ID_LENGTH_BYTES * 4 + 2) // 3
+    return [encoded[start : start + id_length] for start in range(0, len(encoded), step)]
@@ -2,13 +2,15 @@ import threading
 import signal
 from contextlib import contextmanager
 from threading import Event
-from typing import Any, Iterator
+from typing import Any, Iterator, Set
 
 from dlt.common import logger
 from dlt.common.exceptions import SignalReceivedException
 
 _received_signal: int = 0
 exit_event = Event()
+# events of threads sleeping with a custom wake event
+_wake_events: Set[Event] = set()
 
 
 def signal_receiver(sig: int, frame: Any) -> None:
@@ -22,7 +24,7 @@ def signal_receiver(sig: int, frame: Any) -> None:
 
     _received_signal = sig
     # awake all threads sleeping on event
-    exit_event.set()
+    wake_all()
 
     logger.info("Sleeping threads signalled")
 
@@ -37,13 +39,25 @@ def signal_received() -> bool:
     return True if _received_signal else False
 
 
-def sleep(sleep_seconds: float) -> None:
-    """A signal-aware version of sleep function. Will raise SignalReceivedException if signal was received during sleep period."""
+def sleep(sleep_seconds: float, wake_event: Event = None) -> None:
+    """A signal-aware version of sleep function. Will raise SignalReceivedException if signal was received during sleep period.
+
+    If `wake_event` is passed, sleep also ends when it is set. The caller is responsible for clearing it.
+    """
     # do not allow sleeping if signal was received
     raise_if_signalled()
     # sleep or wait for signal
-    exit_event.clear()
-    exit_event.wait(sleep_seconds)
+    if wake_event is None:
+        exit_event.clear()
+        exit_event.wait(sleep_seconds)
+    else:
+        _wake_events.add(wake_event)
+        try:
+            # signal may be received before the event was registered
+            raise_if_signalled()
+            wake_event.wait(sleep_seconds)
+        finally:
+            _wake_events.discard(wake_event)
     # if signal then raise
     raise_if_signalled()
 
@@ -51,6 +65,8 @@ def sleep(sleep_seconds: float) -> None:
 def wake_all() -> None:
     """Wakes all threads sleeping on event"""
     exit_event.set()
+    for wake_event in list(_wake_events):
+        wake_event.set()
 
 
 @contextmanager
@@ -1,3 +1,4 @@
+import re
 from copy import copy, deepcopy
 from typing import (
     Callable,
@@ -8,6 +9,7 @@ from typing import (
     Optional,
     Sequence,
     Tuple,
+    Type,
     Any,
     cast,
 )
@@ -106,6 +108,19 @@ class Schema:
     _compiled_includes: Dict[str, Sequence[REPattern]]
     # type detections
     _type_detections: Sequence[TTypeDetections]
+    # per table coercion plans: map (column name, python type) into (data type, python data type)
+    # python data type is None if value can be passed without coercion
+    _coercion_plans: Dict[str, Dict[Tuple[str, Type[Any]], Tuple[TDataType, Optional[TDataType]]]]
+    # per table filter plans: map field name into keep (True) or drop (False) decision
+    _filter_plans: Dict[str, Dict[str, bool]]
+    # map column name into column props inferred from default hints
+    _inferred_hints: Dict[str, TColumnSchema]
+    # map column name into preferred data type
+    _inferred_preferred_types: Dict[str, Optional[TDataType]]
+    # map parent table name into names of nested tables
+    _nested_tables: Dict[str, List[str]]
+    # map resource name into names of tables with resource hint
+    _resource_tables: Dict[str, List[str]]
 
     # normalizers config
     _normalizers_config: TNormalizersConfig
@@ -177,36 +192,37 @@ class Schema:
             # most of the schema do not use them
             return row
 
-        def _exclude(
-            path: str, excludes: Sequence[REPattern], includes: Sequence[REPattern]
-        ) -> bool:
-            is_included = False
-            is_excluded = any(exclude.search(path) for exclude in excludes)
-            if is_excluded:
-                # we may have exception if explicitly included
-                is_included = any(include.search(path) for include in includes)
-            return is_excluded and not is_included
+        # decision depends only on table and field name so it is evaluated once and kept in the plan
+        filter_plan = self._filter_plans.get(table_name)
+        if filter_plan is None:
+            filter_plan = self._filter_plans[table_name] = {}
+        for field_name in list(row.keys()):
+            keep = filter_plan.get(field_name)
+            if keep is None:
+                keep = filter_plan[field_name] = not self._is_field_excluded(table_name, field_name)
+            if not keep:
+                # TODO: copy to new instance
+                del row[field_name]  # type: ignore
+        return row
 
+    def _is_field_excluded(self, table_name: str, field_name: str) -> bool:
         # break table name in components
         branch = self.naming.break_path(table_name)
 
-        # check if any of the rows is excluded by rules in any of the tables
+        # check if field is excluded by rules in any of the tables
         for i in range(len(branch), 0, -1):  # stop is exclusive in `range`
             # start at the top level table
             c_t = self.naming.make_path(*branch[:i])
             excludes = self._compiled_excludes.get(c_t)
             # only if there's possibility to exclude, continue
             if excludes:
-                includes = self._compiled_includes.get(c_t) or []
-                for field_name in list(row.keys()):
-                    path = self.naming.make_path(*branch[i:], field_name)
-                    if _exclude(path, excludes, includes):
-                        # TODO: copy to new instance
-                        del row[field_name]  # type: ignore
-            # if row is empty, do not process further
-            if not row:
-                break
-        return row
+                path = self.naming.make_path(*branch[i:], field_name)
+                if any(exclude.search(path) for exclude in excludes):
+                    # we may have exception if explicitly included
+                    includes = self._compiled_includes.get(c_t) or []
+                    if not any(include.search(path) for include in includes):
+                        return True
+        return False
 
     def coerce_row(
         self, table_name: str, parent_table: str, row: StrAny
@@ -227,6 +243,10 @@ class Schema:
         if not table:
             table = utils.new_table(table_name, parent_table)
         table_columns = table["columns"]
+        # coercions resolved for existing columns, invalidated when table is updated
+        coercion_plan = self._coercion_plans.get(table_name)
+        if coercion_plan is None:
+            coercion_plan = self._coercion_plans[table_name] = {}
 
         new_row: DictStrAny = {}
         for col_name, v in row.items():
@@ -234,17 +254,38 @@ class Schema:
             if v is None:
                 # just check if column is nullable if it exists
                 self._coerce_null_value(table_columns, table_name, col_name)
-            else:
-                new_col_name, new_col_def, new_v = self._coerce_non_null_value(
-                    table_columns, table_name, col_name, v
+                continue
+            # fast path for columns and python types already seen
+            planned_coercion = coercion_plan.get((col_name, type(v)))
+            if planned_coercion is not None:
+                col_type, py_type = planned_coercion
+                if py_type is None:
+                    new_row[col_name] = v
+                    continue
+                try:
+                    coerced_v = coerce_value(col_type, py_type, v)
+                    # variants must be processed in regular path
+                    if not callable(coerced_v):
+                        new_row[col_name] = coerced_v
+                        continue
+                except (ValueError, SyntaxError):
+                    # regular path will create a variant column
+                    pass
+
+            new_col_name, new_col_def, new_v = self._coerce_non_null_value(
+                table_columns, table_name, col_name, v
+            )
+            new_row[new_col_name] = new_v
+            if new_col_def:
+                if not updated_table_partial:
+                    # create partial table with only the new columns
+                    updated_table_partial = copy(table)
+                    updated_table_partial["columns"] = {}
+                updated_table_partial["columns"][new_col_name] = new_col_def
+            elif new_col_name == col_name:
+                self._add_to_coercion_plan(
+                    coercion_plan, col_name, table_columns[col_name]["data_type"], v
                 )
-                new_row[new_col_name] = new_v
-                if new_col_def:
-                    if not updated_table_partial:
-                        # create partial table with only the new columns
-                        updated_table_partial = copy(table)
-                        updated_table_partial["columns"] = {}
-                    updated_table_partial["columns"][new_col_name] = new_col_def
 
         return new_row, updated_table_partial
 
@@ -425,13 +466,19 @@ class Schema:
             # add the whole new table to SchemaTables
             assert not from_diff, "Cannot update the whole table from diff"
             self._schema_tables[table_name] = partial_table
+            self._index_table(partial_table)
         else:
+            resource = table.get("resource")
             if from_diff:
                 partial_table = utils.merge_diff(table, partial_table)
             else:
                 # merge tables performing additional checks
                 partial_table = utils.merge_table(self.name, table, partial_table)
+            if table.get("resource") != resource:
+                # keep resource tables in schema order
+                self._reindex_tables()
 
+        self._coercion_plans.pop(table_name, None)
         self.data_item_normalizer.extend_table(table_name)
         return partial_table
 
@@ -454,6 +501,8 @@ class Schema:
             table = self.get_table(table_name)
             if table and (not seen_data_only or utils.has_table_seen_data(table)):
                 result.append(self._schema_tables.pop(table_name))
+                self._coercion_plans.pop(table_name, None)
+                self._unindex_table(table)
         return result
 
     def filter_row_with_hint(
@@ -570,7 +619,7 @@ class Schema:
             and (
                 (
                     include_incomplete
-                    or len(self.get_table_columns(t["name"], include_incomplete)) > 0
+                    or any(utils.is_complete_column(c) for c in t["columns"].values())
                 )
                 and (not seen_data_only or utils.has_table_seen_data(t))
             )
@@ -598,14 +647,20 @@ class Schema:
         return [t["name"] for t in self.dlt_tables()]
 
     def get_preferred_type(self, col_name: str) -> Optional[TDataType]:
-        return next((m[1] for m in self._compiled_preferred_types if m[0].search(col_name)), None)
+        try:
+            return self._inferred_preferred_types[col_name]
+        except KeyError:
+            preferred_type = self._inferred_preferred_types[col_name] = next(
+                (m[1] for m in self._compiled_preferred_types if m[0].search(col_name)), None
+            )
+            return preferred_type
 
     def is_new_table(self, table_name: str) -> bool:
         """Returns true if this table does not exist OR is incomplete (has only incomplete columns) and therefore new"""
-        return (table_name not in self.tables) or (
+        return (table_name not in self._schema_tables) or (
             not [
                 c
-                for c in self.tables[table_name]["columns"].values()
+                for c in self._schema_tables[table_name]["columns"].values()
                 if utils.is_complete_column(c)
             ]
         )
@@ -618,7 +673,7 @@ class Schema:
         Returns:
             int: Current schema version
         """
-        return utils.bump_version_if_modified(self.to_dict())[0]
+        return self.to_dict()["version"]
 
     @property
     def stored_version(self) -> int:
@@ -632,12 +687,12 @@ class Schema:
     @property
     def version_hash(self) -> str:
         """Current version hash of the schema, recomputed from the actual content"""
-        return utils.bump_version_if_modified(self.to_dict())[1]
+        return self.to_dict()["version_hash"]
 
     @property
     def previous_hashes(self) -> Sequence[str]:
         """Current version hash of the schema, recomputed from the actual content"""
-        return utils.bump_version_if_modified(self.to_dict())[3]
+        return self.to_dict()["previous_hashes"]
 
     @property
     def stored_version_hash(self) -> str:
@@ -666,6 +721,16 @@ class Schema:
         """Dictionary of schema tables"""
         return self._schema_tables
 
+    @property
+    def nested_tables(self) -> utils.TTablesIndex:
+        """Index of nested tables: maps table name into names of its nested tables. Do not modify."""
+        return self._nested_tables
+
+    @property
+    def resource_tables(self) -> utils.TTablesIndex:
+        """Index of resource tables: maps resource name into names of tables with `resource` hint. Do not modify."""
+        return self._resource_tables
+
     @property
     def settings(self) -> TSchemaSettings:
         return self._settings
@@ -777,23 +842,30 @@ class Schema:
         column_schema = TColumnSchema(
             name=k,
             data_type=data_type or self._infer_column_type(v, k),
-            nullable=not self._infer_hint("not_null", k),
         )
-        # check other preferred hints that are available
-        for hint in self._compiled_hints:
-            # already processed
-            if hint == "not_null":
-                continue
-            column_prop = utils.hint_to_column_prop(hint)
-            hint_value = self._infer_hint(hint, k)
-            # set only non-default values
-            if not utils.has_default_column_prop_value(column_prop, hint_value):
-                column_schema[column_prop] = hint_value
-
+        column_schema.update(self._infer_column_hints(k))
         if is_variant:
             column_schema["variant"] = is_variant
         return column_schema
 
+    def _infer_column_hints(self, col_name: str) -> TColumnSchema:
+        """Infers column props from default hints. Result depends only on column name so it is cached"""
+        column_hints = self._inferred_hints.get(col_name)
+        if column_hints is None:
+            column_hints = TColumnSchema(nullable=not self._infer_hint("not_null", col_name))
+            # check other preferred hints that are available
+            for hint in self._compiled_hints:
+                # already processed
+                if hint == "not_null":
+                    continue
+                column_prop = utils.hint_to_column_prop(hint)
+                hint_value = self._infer_hint(hint, col_name)
+                # set only non-default values
+                if not utils.has_default_column_prop_value(column_prop, hint_value):
+                    column_hints[column_prop] = hint_value
+            self._inferred_hints[col_name] = column_hints
+        return column_hints
+
     def _coerce_null_value(
         self, table_columns: TTableSchemaColumns, table_name: str, col_name: str
     ) -> None:
@@ -883,6 +955,24 @@ class Schema:
 
         return col_name, new_column, coerced_v
 
+    @staticmethod
+    def _add_to_coercion_plan(
+        coercion_plan: Dict[Tuple[str, Type[Any]], Tuple[TDataType, Optional[TDataType]]],
+        col_name: str,
+        col_type: TDataType,
+        v: Any,
+    ) -> None:
+        """Stores coercion of python type of `v` into existing column so it can be reused for next rows"""
+        # variants are resolved per value so they are always processed in regular path
+        if callable(v):
+            return
+        py_type = py_type_to_sc_type(type(v))
+        # see `coerce_value`: json values and enums are modified even if types are identical
+        if col_type == py_type and py_type != "json" and not hasattr(v, "value"):
+            coercion_plan[(col_name, type(v))] = (col_type, None)
+        else:
+            coercion_plan[(col_name, type(v))] = (col_type, py_type)
+
     def _infer_column_type(self, v: Any, col_name: str, skip_preferred: bool = False) -> TDataType:
         tv = type(v)
         # try to autodetect data type
@@ -983,6 +1073,33 @@ class Schema:
             utils.loads_table(), self.naming
         )
 
+    def _index_table(self, table: TTableSchema) -> None:
+        table_name = table["name"]
+        if parent_table_name := table.get("parent"):
+            nested_tables = self._nested_tables.setdefault(parent_table_name, [])
+            if table_name not in nested_tables:
+                nested_tables.append(table_name)
+        if resource := table.get("resource"):
+            resource_tables = self._resource_tables.setdefault(resource, [])
+            if table_name not in resource_tables:
+                resource_tables.append(table_name)
+
+    def _unindex_table(self, table: TTableSchema) -> None:
+        # nested tables of the dropped table stay indexed as they are still in the schema
+        table_name = table["name"]
+        for index, key in (
+            (self._nested_tables, table.get("parent")),
+            (self._resource_tables, table.get("resource")),
+        ):
+            if key and (table_names := index.get(key)) and table_name in table_names:
+                table_names.remove(table_name)
+                if not table_names:
+                    del index[key]
+
+    def _reindex_tables(self) -> None:
+        self._nested_tables = utils.index_nested_tables(self._schema_tables)
+        self._resource_tables = utils.index_tables_by_resource(self._schema_tables)
+
     def _add_standard_hints(self) -> None:
         default_hints = utils.default_hints()
         if default_hints:
@@ -1116,6 +1233,7 @@ class Schema:
         self._schema_tables = self._verify_update_normalizers(
             normalizers_config, to_naming, from_naming
         )
+        self._reindex_tables()
         self._normalizers_config = normalizers_config
         self.naming = to_naming
         # name normalization functions
@@ -1163,6 +1281,12 @@ class Schema:
         self._compiled_excludes: Dict[str, Sequence[REPattern]] = {}
         self._compiled_includes: Dict[str, Sequence[REPattern]] = {}
         self._type_detections: Sequence[TTypeDetections] = None
+        self._coercion_plans = {}
+        self._filter_plans = {}
+        self._inferred_hints = {}
+        self._inferred_preferred_types = {}
+        self._nested_tables = {}
+        self._resource_tables = {}
 
         self._normalizers_config = None
         self.naming = None
@@ -1206,13 +1330,21 @@ class Schema:
         self._schema_name = name
 
     def _compile_settings(self) -> None:
+        # tables may have been replaced
+        self._coercion_plans = {}
+        # hints and preferred types may have changed
+        self._inferred_hints = {}
+        self._inferred_preferred_types = {}
+        # filters may have changed
+        self._filter_plans = {}
+        self._reindex_tables()
         # if self._settings:
         for pattern, dt in self._settings.get("preferred_types", {}).items():
             # add tuples to be searched in coercions
             self._compiled_preferred_types.append((utils.compile_simple_regex(pattern), dt))
         for hint_name, hint_list in self._settings.get("default_hints", {}).items():
             # compile hints which are column matching regexes
-            self._compiled_hints[hint_name] = list(map(utils.compile_simple_regex, hint_list))
+            self._compiled_hints[hint_name] = self._compile_hint_regexes(hint_list)
         if self._schema_tables:
             for table in self._schema_tables.values():
                 if "filters" in table:
@@ -1227,5 +1359,17 @@ class Schema:
         # look for auto-detections in settings and then normalizer
         self._type_detections = self._settings.get("detections") or self._normalizers_config.get("detections") or []  # type: ignore
 
+    @staticmethod
+    def _compile_hint_regexes(hint_list: Sequence[TSimpleRegex]) -> List[REPattern]:
+        """Compiles hint regexes into a single alternation so column name is matched once. Falls back
+        to a list of separate regexes if they cannot be combined ie. when they use inline flags.
+        """
+        if len(hint_list) > 1:
+            try:
+                return [utils.compile_simple_regexes(hint_list)]
+            except re.error:
+                pass
+        return list(map(utils.compile_simple_regex, hint_list))
+
     def __repr__(self) -> str:
         return f"Schema {self.name} at {id(self)}"
@@ -4,7 +4,19 @@ import hashlib
 import warnings
 import yaml
 from copy import deepcopy, copy
-from typing import Dict, List, Sequence, Tuple, Type, Any, cast, Iterable, Optional, Union
+from typing import (
+    Dict,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    Type,
+    Any,
+    cast,
+    Iterable,
+    Optional,
+    Union,
+)
 
 from dlt.common.pendulum import pendulum
 from dlt.common.time import ensure_pendulum_datetime
@@ -60,6 +72,9 @@ from dlt.common.warnings import Dlt100DeprecationWarning
 RE_NON_ALPHANUMERIC_UNDERSCORE = re.compile(r"[^a-zA-Z\d_]")
 DEFAULT_WRITE_DISPOSITION: TWriteDisposition = "append"
 
+TTablesIndex = Mapping[str, Sequence[str]]
+"""Maps a parent table or resource name into names of its tables, ordered as they were added to the schema"""
+
 
 def is_valid_schema_name(name: str) -> bool:
     """Schema name must be a valid python identifier and have max len of 64"""
@@ -800,17 +815,24 @@ def get_root_table(tables: TSchemaTables, table_name: str) -> TTableSchema:
     return table
 
 
-def get_nested_tables(tables: TSchemaTables, table_name: str) -> List[TTableSchema]:
+def get_nested_tables(
+    tables: TSchemaTables, table_name: str, nested_tables: TTablesIndex = None
+) -> List[TTableSchema]:
     """Get nested tables for table name and return a list of tables ordered by ancestry so the nested tables are always after their parents
 
     Note that this function follows only NESTED TABLE reference typically expressed on _dlt_parent_id (PARENT_KEY) to _dlt_id (ROW_KEY).
+    If `nested_tables` index (see `Schema.nested_tables`) is passed, only indexed tables are visited instead of all `tables`
     """
     chain: List[TTableSchema] = []
 
     def _child(t: TTableSchema) -> None:
         name = t["name"]
         chain.append(t)
-        for candidate in tables.values():
+        if nested_tables is None:
+            candidates: Iterable[TTableSchema] = tables.values()
+        else:
+            candidates = (tables[n] for n in nested_tables.get(name, ()) if n in tables)
+        for candidate in candidates:
             if is_nested_table(candidate) and candidate.get("parent") == name:
                 _child(candidate)
 
@@ -818,18 +840,45 @@ def get_nested_tables(tables: TSchemaTables, table_name: str) -> List[TTableSche
     return chain
 
 
+def index_nested_tables(tables: TSchemaTables) -> Dict[str, List[str]]:
+    """Maps table names into names of their nested tables"""
+    index: Dict[str, List[str]] = {}
+    for table in tables.values():
+        if is_nested_table(table):
+            index.setdefault(table["parent"], []).append(table["name"])
+    return index
+
+
+def index_tables_by_resource(tables: TSchemaTables) -> Dict[str, List[str]]:
+    """Maps resource names into names of tables with `resource` hint"""
+    index: Dict[str, List[str]] = {}
+    for table in tables.values():
+        if resource := table.get("resource"):
+            index.setdefault(resource, []).append(table["name"])
+    return index
+
+
 def group_tables_by_resource(
-    tables: TSchemaTables, pattern: Optional[REPattern] = None
+    tables: TSchemaTables,
+    pattern: Optional[REPattern] = None,
+    nested_tables: TTablesIndex = None,
+    resource_tables: TTablesIndex = None,
 ) -> Dict[str, List[TTableSchema]]:
     """Create a dict of resources and their associated tables and descendant tables
     If `pattern` is supplied, the result is filtered to only resource names matching the pattern.
+    Tables are looked up in `nested_tables` and `resource_tables` indexes (see `Schema`) if passed.
     """
+    if resource_tables is None:
+        resource_tables = index_tables_by_resource(tables)
     result: Dict[str, List[TTableSchema]] = {}
-    for table in tables.values():
-        resource = table.get("resource")
-        if resource and (pattern is None or pattern.match(resource)):
-            resource_tables = result.setdefault(resource, [])
-            resource_tables.extend(get_nested_tables(tables, table["name"]))
+    for resource, table_names in resource_tables.items():
+        if pattern is not None and not pattern.match(resource):
+            continue
+        for table_name in table_names:
+            if table_name in tables and tables[table_name].get("resource") == resource:
+                result.setdefault(resource, []).extend(
+                    get_nested_tables(tables, table_name, nested_tables)
+                )
     return result
 
 
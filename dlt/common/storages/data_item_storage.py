@@ -17,6 +17,8 @@ class DataItemStorage(ABC):
         self.writer_spec = writer_spec
         self.writer_cls = DataWriter.writer_class_from_spec(writer_spec)
         self.buffered_writers: Dict[str, BufferedDataWriter[DataWriter]] = {}
+        # estimated size of items buffered in all writers
+        self._buffered_bytes: int = 0
         super().__init__(*args)
 
     def _get_writer(
@@ -41,8 +43,14 @@ class DataItemStorage(ABC):
         columns: TTableSchemaColumns,
     ) -> int:
         writer = self._get_writer(load_id, schema_name, table_name)
+        buffered_bytes = writer.buffered_bytes
         # write item(s)
-        return writer.write_data_item(item, columns)
+        rows_count = writer.write_data_item(item, columns)
+        if writer.total_buffer_max_bytes:
+            self._buffered_bytes += writer.buffered_bytes - buffered_bytes
+            if self._buffered_bytes > writer.total_buffer_max_bytes:
+                self._flush_largest_buffers(writer.total_buffer_max_bytes)
+        return rows_count
 
     def write_empty_items_file(
         self, load_id: str, schema_name: str, table_name: str, columns: TTableSchemaColumns
@@ -99,6 +107,25 @@ class DataItemStorage(ABC):
             if name.startswith(load_id):
                 writer.closed_files.clear()
 
+    def _flush_largest_buffers(self, total_buffer_max_bytes: int) -> None:
+        """Flushes buffers of the writers, largest first, until buffered items take
+        less than half of `total_buffer_max_bytes`
+        """
+        # writers may be flushed or closed outside of the storage so we recompute the total
+        writers = [
+            w for w in self.buffered_writers.values() if not w.closed and w.buffered_bytes > 0
+        ]
+        self._buffered_bytes = sum(w.buffered_bytes for w in writers)
+        if self._buffered_bytes <= total_buffer_max_bytes:
+            return
+        # flush to low watermark so we do not flush on each written item
+        low_watermark = total_buffer_max_bytes // 2
+        for writer in sorted(writers, key=lambda w: w.buffered_bytes, reverse=True):
+            if self._buffered_bytes <= low_watermark:
+                break
+            self._buffered_bytes -= writer.buffered_bytes
+            writer.flush()
+
     @abstractmethod
     def _get_data_item_path_template(self, load_id: str, schema_name: str, table_name: str) -> str:
         """Returns a file template for item writer. note: use %s for file id to create required template format"""
@@ -298,6 +298,47 @@ class LoadPackageInfo(SupportsHumanize, _LoadPackageInfo):
         return self.asstr(verbosity=0)
 
 
+class PackageJobsIndex:
+    """In-memory index of jobs in a load package by state and by table name"""
+
+    def __init__(self) -> None:
+        self.jobs: Dict[TPackageJobState, Dict[str, ParsedLoadJobFileName]] = {
+            state: {} for state in WORKING_FOLDERS
+        }
+        self.tables: Dict[str, Dict[str, TPackageJobState]] = {}
+
+    def add(self, state: TPackageJobState, job: ParsedLoadJobFileName) -> None:
+        file_name = job.file_name()
+        self.jobs[state][file_name] = job
+        self.tables.setdefault(job.table_name, {})[file_name] = state
+
+    def remove(self, state: TPackageJobState, file_name: str) -> None:
+        job = self.jobs[state].pop(file_name, None)
+        if job is not None:
+            table_jobs = self.tables[job.table_name]
+            del table_jobs[file_name]
+            if not table_jobs:
+                del self.tables[job.table_name]
+
+    def move(
+        self,
+        source_state: TPackageJobState,
+        dest_state: TPackageJobState,
+        file_name: str,
+        new_file_name: str = None,
+    ) -> None:
+        self.remove(source_state, file_name)
+        self.add(dest_state, ParsedLoadJobFileName.parse(new_file_name or file_name))
+
+    def jobs_for_table(
+        self, table_name: str
+    ) -> Sequence[Tuple[TPackageJobState, ParsedLoadJobFileName]]:
+        return [
+            (state, self.jobs[state][file_name])
+            for file_name, state in self.tables.get(table_name, {}).items()
+        ]
+
+
 class PackageStorage:
     NEW_JOBS_FOLDER: ClassVar[TPackageJobState] = "new_jobs"
     FAILED_JOBS_FOLDER: ClassVar[TPackageJobState] = "failed_jobs"
@@ -322,6 +363,8 @@ class PackageStorage:
         """Creates storage that manages load packages with root at `storage` and initial package state `initial_state`"""
         self.storage = storage
         self.initial_state = initial_state
+        # in-memory indexes of jobs in packages, see `index_jobs`
+        self._jobs_indexes: Dict[str, PackageJobsIndex] = {}
 
     #
     # List jobs
@@ -349,12 +392,16 @@ class PackageStorage:
         return sorted(loads)
 
     def list_new_jobs(self, load_id: str) -> Sequence[str]:
+        if index := self._jobs_indexes.get(load_id):
+            return self._list_indexed_jobs(load_id, index, PackageStorage.NEW_JOBS_FOLDER)
         new_jobs = self.storage.list_folder_files(
             self.get_job_state_folder_path(load_id, PackageStorage.NEW_JOBS_FOLDER)
         )
         return new_jobs
 
     def list_started_jobs(self, load_id: str) -> Sequence[str]:
+        if index := self._jobs_indexes.get(load_id):
+            return self._list_indexed_jobs(load_id, index, PackageStorage.STARTED_JOBS_FOLDER)
         return self.storage.list_folder_files(
             self.get_job_state_folder_path(load_id, PackageStorage.STARTED_JOBS_FOLDER)
         )
@@ -371,6 +418,8 @@ class PackageStorage:
     def list_job_with_states_for_table(
         self, load_id: str, table_name: str
     ) -> Sequence[Tuple[TPackageJobState, ParsedLoadJobFileName]]:
+        if index := self._jobs_indexes.get(load_id):
+            return index.jobs_for_table(table_name)
         return self.filter_jobs_for_table(self.list_all_jobs_with_states(load_id), table_name)
 
     def list_all_jobs_with_states(
@@ -409,6 +458,27 @@ class PackageStorage:
             os.path.join(package_path, PackageStorage.PACKAGE_COMPLETED_FILE_NAME)
         )
 
+    #
+    # Index jobs
+    #
+
+    def index_jobs(self, load_id: str) -> None:
+        """Reads all jobs of package `load_id` from storage into an in-memory index. Until the index is dropped
+        with `drop_jobs_index`, jobs are listed from the index and job moves done via this instance keep it up to date.
+
+        NOTE: jobs added to the package folders bypassing this instance will not be visible. Index is rebuilt
+        from storage on each call so the storage stays the source of truth ie. when resuming interrupted load.
+        """
+        index = PackageJobsIndex()
+        for state, jobs in self._list_load_package_jobs(load_id).items():
+            for job in jobs:
+                index.add(state, job)
+        self._jobs_indexes[load_id] = index
+
+    def drop_jobs_index(self, load_id: str) -> None:
+        """Drops in-memory index of jobs in package `load_id` if it exists"""
+        self._jobs_indexes.pop(load_id, None)
+
     #
     # Move jobs
     #
@@ -417,9 +487,12 @@ class PackageStorage:
         self, load_id: str, job_file_path: str, job_state: TPackageJobState = "new_jobs"
     ) -> None:
         """Adds new job by moving the `job_file_path` into `new_jobs` of package `load_id`"""
-        self.storage.atomic_import(
+        imported_path = self.storage.atomic_import(
             job_file_path, self.get_job_state_folder_path(load_id, job_state)
         )
+        if index := self._jobs_indexes.get(load_id):
+            file_name = FileStorage.get_file_name_from_file_path(imported_path)
+            index.add(job_state, ParsedLoadJobFileName.parse(file_name))
 
     def start_job(self, load_id: str, file_name: str) -> str:
         return self._move_job(
@@ -507,6 +580,9 @@ class PackageStorage:
                 self.get_job_state_folder_path(load_id, PackageStorage.COMPLETED_JOBS_FOLDER),
                 recursively=True,
             )
+            if index := self._jobs_indexes.get(load_id):
+                for file_name in list(index.jobs[PackageStorage.COMPLETED_JOBS_FOLDER]):
+                    index.remove(PackageStorage.COMPLETED_JOBS_FOLDER, file_name)
 
     def delete_package(self, load_id: str, not_exists_ok: bool = False) -> None:
         package_path = self.get_package_path(load_id)
@@ -515,6 +591,7 @@ class PackageStorage:
                 return
             raise LoadPackageNotFound(load_id)
         self.storage.delete_folder(package_path, recursively=True)
+        self.drop_jobs_index(load_id)
 
     def load_schema(self, load_id: str) -> Schema:
         return Schema.from_dict(self._load_schema(load_id))
@@ -573,6 +650,13 @@ class PackageStorage:
         self, load_id: str
     ) -> Dict[TPackageJobState, List[ParsedLoadJobFileName]]:
         """Gets all jobs in a package and returns them as lists assigned to a particular state."""
+        if index := self._jobs_indexes.get(load_id):
+            return {state: list(jobs.values()) for state, jobs in index.jobs.items()}
+        return self._list_load_package_jobs(load_id)
+
+    def _list_load_package_jobs(
+        self, load_id: str
+    ) -> Dict[TPackageJobState, List[ParsedLoadJobFileName]]:
         package_path = self.get_package_path(load_id)
         if not self.storage.has_folder(package_path):
             raise LoadPackageNotFound(load_id)
@@ -706,8 +790,16 @@ class PackageStorage:
         self.storage.atomic_rename(
             self.get_job_file_path(load_id, source_folder, file_name), dest_path
         )
+        if index := self._jobs_indexes.get(load_id):
+            index.move(source_folder, dest_folder, file_name, new_file_name)
         return self.storage.make_full_path(dest_path)
 
+    def _list_indexed_jobs(
+        self, load_id: str, index: PackageJobsIndex, state: TPackageJobState
+    ) -> List[str]:
+        state_path = self.get_job_state_folder_path(load_id, state)
+        return [os.path.join(state_path, file_name) for file_name in index.jobs[state]]
+
     def _load_schema(self, load_id: str) -> DictStrAny:
         schema_path = os.path.join(load_id, PackageStorage.SCHEMA_FILE_NAME)
         return json.loads(self.storage.load(schema_path))  # type: ignore[no-any-return]
@@ -172,6 +172,7 @@ class LoadStorage(VersionedStorage):
         # move to completed
         completed_path = self.get_loaded_package_path(load_id)
         self.storage.rename_tree(self.get_normalized_package_path(load_id), completed_path)
+        self.normalized_packages.drop_jobs_index(load_id)
 
     def maybe_remove_completed_jobs(self, load_id: str) -> None:
         """Deletes completed jobs if delete_completed_jobs config flag is set. If package has failed jobs, nothing gets deleted."""
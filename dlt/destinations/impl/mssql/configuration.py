@@ -95,6 +95,8 @@ class MsSqlClientConfiguration(DestinationClientDwhWithStagingConfiguration):
 
     create_indexes: bool = False
     has_case_sensitive_identifiers: bool = False
+    insert_batch_size: int = 10000
+    """Number of rows bound in a single batch when loading `typed-jsonl` or `parquet` files"""
 
     def fingerprint(self) -> str:
         """Returns a fingerprint of host part of a connection string"""
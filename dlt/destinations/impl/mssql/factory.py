@@ -84,7 +84,10 @@ class mssql(Destination[MsSqlClientConfiguration, "MsSqlJobClient"]):
     def _raw_capabilities(self) -> DestinationCapabilitiesContext:
         caps = DestinationCapabilitiesContext()
         caps.preferred_loader_file_format = "insert_values"
-        caps.supported_loader_file_formats = ["insert_values"]
+        caps.supported_loader_file_formats = ["insert_values", "typed-jsonl", "parquet"]
+        # load local typed-jsonl and parquet files with pyodbc fast_executemany
+        caps.parametrized_insert_file_formats = ["typed-jsonl", "parquet"]
+        caps.explicit_loader_file_formats = ["typed-jsonl", "parquet"]
         caps.preferred_staging_file_format = None
         caps.supported_staging_file_formats = []
         caps.type_mapper = MsSqlTypeMapper
@@ -95,6 +95,7 @@ class MsSqlJobClient(InsertValuesJobClient):
         self.sql_client = sql_client
         self.active_hints = HINT_TO_MSSQL_ATTR if self.config.create_indexes else {}
         self.type_mapper = capabilities.get_type_mapper()
+        self.insert_batch_size = self.config.insert_batch_size
 
     def _create_merge_followup_jobs(
         self, table_chain: Sequence[PreparedTableSchema]
@@ -162,6 +162,18 @@ class PyOdbcMsSqlClient(SqlClientBase[pyodbc.Connection], DBTransaction):
         except pyodbc.Error as outer:
             raise outer
 
+    @raise_database_error
+    def execute_batch(self, query: str, batch: Sequence[Sequence[Any]]) -> None:
+        if not batch:
+            return
+        curr = self._conn.cursor()
+        try:
+            # bind all rows in a single round trip
+            curr.fast_executemany = True
+            curr.executemany(query.replace("%s", "?"), batch)
+        finally:
+            curr.close()
+
     @classmethod
     def _make_database_exception(cls, ex: Exception) -> Exception:
         if isinstance(ex, pyodbc.ProgrammingError):
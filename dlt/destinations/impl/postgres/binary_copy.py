@@ -0,0 +1,221 @@
+"""Encodes arrow record batches into postgres binary COPY format
+
+https://www.postgresql.org/docs/current/sql-copy.html#id-1.9.3.55.9.4
+"""
+import re
+import struct
+from itertools import chain, repeat
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from dlt.common import Decimal
+from dlt.common.json import json
+from dlt.common.exceptions import TerminalValueError
+from dlt.common.libs.pyarrow import pyarrow as pa
+import numpy as np
+
+COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+COPY_TRAILER = struct.pack(">h", -1)
+NULL_FIELD = struct.pack(">i", -1)
+# postgres dates and timestamps are relative to 2000-01-01
+POSTGRES_EPOCH_DAYS = 10957
+POSTGRES_EPOCH_MICROSECONDS = POSTGRES_EPOCH_DAYS * 86400 * 1000000
+
+NUMERIC_POSITIVE = 0x0000
+NUMERIC_NEGATIVE = 0x4000
+NUMERIC_NAN = 0xC000
+
+_INT32 = struct.Struct(">i")
+_NUMERIC_HEADER = struct.Struct(">hhHh")
+
+TFieldEncoder = Callable[[pa.Array], List[bytes]]
+
+
+def _encode_fixed(array: pa.Array, values: Any, dtype: str) -> List[bytes]:
+    """Packs numpy `values` of `dtype` into fields prefixed with length, nulls are taken from `array`"""
+    width = np.dtype(dtype).itemsize
+    packed = np.empty(len(values), dtype=[("len", ">i4"), ("value", dtype)])
+    packed["len"] = width
+    packed["value"] = values
+    buf = packed.tobytes()
+    step = 4 + width
+    fields = [buf[i : i + step] for i in range(0, len(buf), step)]
+    if array.null_count:
+        for i in np.flatnonzero(~array.is_valid().to_numpy(zero_copy_only=False)):
+            fields[i] = NULL_FIELD
+    return fields
+
+
+def _encode_varlen(values: Iterable[Optional[bytes]]) -> List[bytes]:
+    pack = _INT32.pack
+    return [NULL_FIELD if v is None else pack(len(v)) + v for v in values]
+
+
+def _to_numpy(array: pa.Array, to_type: pa.DataType) -> Any:
+    array = array.cast(to_type)
+    if array.null_count:
+        # null values are replaced with NULL_FIELD
+        array = array.fill_null(pa.scalar(0).cast(to_type))
+    return array.to_numpy(zero_copy_only=False)
+
+
+def _fixed_encoder(arrow_type: pa.DataType, dtype: str) -> TFieldEncoder:
+    def _encode(array: pa.Array) -> List[bytes]:
+        return _encode_fixed(array, _to_numpy(array, arrow_type), dtype)
+
+    return _encode
+
+
+def _encode_date(array: pa.Array) -> List[bytes]:
+    days = _to_numpy(array.cast(pa.date32()), pa.int32())
+    return _encode_fixed(array, days - POSTGRES_EPOCH_DAYS, ">i4")
+
+
+def _encode_timestamp(array: pa.Array) -> List[bytes]:
+    # naive and tz-aware timestamps are stored as UTC
+    microseconds = array.cast(pa.timestamp("us", tz=array.type.tz), safe=False)
+    return _encode_fixed(
+        array, _to_numpy(microseconds, pa.int64()) - POSTGRES_EPOCH_MICROSECONDS, ">i8"
+    )
+
+
+def _encode_time(array: pa.Array) -> List[bytes]:
+    microseconds = array.cast(pa.time64("us"), safe=False)
+    return _encode_fixed(array, _to_numpy(microseconds, pa.int64()), ">i8")
+
+
+def _encode_text(array: pa.Array) -> List[bytes]:
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        array = array.cast(pa.string())
+    return _encode_varlen(array.cast(pa.binary()).to_pylist())
+
+
+def _encode_binary(array: pa.Array) -> List[bytes]:
+    return _encode_varlen(array.cast(pa.binary()).to_pylist())
+
+
+def _encode_jsonb(array: pa.Array) -> List[bytes]:
+    # jsonb binary format is a version byte followed by json text
+    if pa.types.is_string(array.type) or pa.types.is_large_string(array.type):
+        values = array.cast(pa.binary()).to_pylist()
+    else:
+        values = [None if v is None else json.dumpb(v) for v in array.to_pylist()]
+    return _encode_varlen(None if v is None else b"\x01" + v for v in values)
+
+
+def encode_numeric(value: Decimal) -> bytes:
+    """Encodes `value` as postgres numeric: base 10000 digits with weight of the first digit, sign and scale"""
+    if value.is_nan():
+        return _NUMERIC_HEADER.pack(0, 0, NUMERIC_NAN, 0)
+    if value.is_infinite():
+        raise TerminalValueError(f"Infinite decimal {value} cannot be stored in postgres numeric")
+    sign = NUMERIC_NEGATIVE if value.is_signed() else NUMERIC_POSITIVE
+    int_part, _, frac_part = format(abs(value), "f").partition(".")
+    dscale = len(frac_part)
+    # align digits to groups of 4 around decimal point
+    int_part = int_part.zfill((len(int_part) + 3) // 4 * 4)
+    frac_part = frac_part.ljust((len(frac_part) + 3) // 4 * 4, "0")
+    digits = [int(int_part[i : i + 4]) for i in range(0, len(int_part), 4)]
+    weight = len(digits) - 1
+    digits.extend(int(frac_part[i : i + 4]) for i in range(0, len(frac_part), 4))
+    # strip leading and trailing zero digits
+    leading = 0
+    while leading < len(digits) and digits[leading] == 0:
+        leading += 1
+    digits = digits[leading:]
+    weight -= leading
+    while digits and digits[-1] == 0:
+        digits.pop()
+    if not digits:
+        weight = 0
+    return _NUMERIC_HEADER.pack(len(digits), weight, sign, dscale) + struct.pack(
+        f">{len(digits)}h", *digits
+    )
+
+
+def _encode_numeric(array: pa.Array) -> List[bytes]:
+    return _encode_varlen(
+        None if v is None else encode_numeric(v if isinstance(v, Decimal) else Decimal(str(v)))
+        for v in array.to_pylist()
+    )
+
+
+_FIELD_ENCODERS: Dict[str, TFieldEncoder] = {
+    "smallint": _fixed_encoder(pa.int16(), ">i2"),
+    "integer": _fixed_encoder(pa.int32(), ">i4"),
+    "bigint": _fixed_encoder(pa.int64(), ">i8"),
+    "double precision": _fixed_encoder(pa.float64(), ">f8"),
+    "boolean": _fixed_encoder(pa.bool_(), "?"),
+    "date": _encode_date,
+    # both variants are stored as microseconds since postgres epoch
+    "timestamp": _encode_timestamp,
+    "timestamp with time zone": _encode_timestamp,
+    "timestamp without time zone": _encode_timestamp,
+    "time": _encode_time,
+    "time without time zone": _encode_time,
+    "varchar": _encode_text,
+    "character varying": _encode_text,
+    "text": _encode_text,
+    "jsonb": _encode_jsonb,
+    "bytea": _encode_binary,
+    "numeric": _encode_numeric,
+}
+
+
+def normalize_db_type(db_type: str) -> str:
+    """Removes precision and modifiers from `db_type` ie. timestamp (3) with time zone -> timestamp with time zone"""
+    return " ".join(re.sub(r"\(.*?\)", " ", db_type).lower().split())
+
+
+def get_field_encoder(db_type: str) -> TFieldEncoder:
+    """Returns encoder of arrow arrays into fields of postgres `db_type` as generated by postgres type mapper"""
+    try:
+        return _FIELD_ENCODERS[normalize_db_type(db_type)]
+    except KeyError:
+        raise TerminalValueError(
+            f"Postgres type {db_type} is not supported by binary COPY, use csv file format to load"
+            " this table"
+        )
+
+
+def encode_record_batch(batch: pa.RecordBatch, encoders: Sequence[TFieldEncoder]) -> bytes:
+    """Encodes all rows of `batch`, each column with encoder at the same position"""
+    columns = [encode(column) for encode, column in zip(encoders, batch.columns)]
+    tuple_header = struct.pack(">h", batch.num_columns)
+    return b"".join(chain.from_iterable(zip(repeat(tuple_header, batch.num_rows), *columns)))
+
+
+def iter_copy_data(
+    batches: Iterable[pa.RecordBatch], encoders: Sequence[TFieldEncoder]
+) -> Iterator[bytes]:
+    """Yields complete binary COPY data: header, encoded `batches` and trailer"""
+    yield COPY_HEADER
+    for batch in batches:
+        if batch.num_rows:
+            yield encode_record_batch(batch, encoders)
+    yield COPY_TRAILER
+
+
+class CopyDataStream:
+    """Read only file-like object that streams chunks of COPY data ie. into `copy_expert`"""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._chunk = b""
+        self._offset = 0
+
+    def read(self, size: int = -1) -> bytes:
+        while self._offset >= len(self._chunk):
+            self._chunk = next(self._chunks, None)
+            self._offset = 0
+            if self._chunk is None:
+                self._chunk = b""
+                return b""
+        if size < 0:
+            size = len(self._chunk) - self._offset
+        data = self._chunk[self._offset : self._offset + size]
+        self._offset += len(data)
+        return data
+
+    def readline(self, size: int = -1) -> bytes:
+        # required by copy_expert file interface, binary data has no lines
+        return self.read(size)
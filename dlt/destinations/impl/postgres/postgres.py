@@ -145,6 +145,62 @@ class PostgresCsvCopyJob(RunnableLoadJob, HasFollowupJobs):
                     cursor.copy_expert(copy_sql, f, size=8192)
 
 
+class PostgresParquetCopyJob(RunnableLoadJob, HasFollowupJobs):
+    """Streams record batches of a parquet file into `COPY ... FROM STDIN` in postgres binary format"""
+
+    BATCH_SIZE = 64 * 1024
+    """Number of rows encoded at once"""
+    COPY_BUFFER_SIZE = 1024 * 1024
+    """Size of the data chunks sent to the server"""
+
+    def __init__(self, file_path: str) -> None:
+        super().__init__(file_path)
+        self._job_client: PostgresClient = None
+
+    def run(self) -> None:
+        from dlt.common.libs.pyarrow import pyarrow
+        from dlt.destinations.impl.postgres.binary_copy import (
+            CopyDataStream,
+            get_field_encoder,
+            iter_copy_data,
+        )
+
+        sql_client = self._job_client.sql_client
+        table_name = self.load_table_name
+        table_columns = self._load_table["columns"]
+
+        with FileStorage.open_zipsafe_ro(self._file_path, "rb") as f:
+            parquet_file = pyarrow.parquet.ParquetFile(f)
+            column_names = parquet_file.schema_arrow.names
+            unknown_columns = set(column_names).difference(table_columns)
+            if unknown_columns:
+                raise DestinationInvalidFileFormat(
+                    "postgres",
+                    "parquet",
+                    self._file_path,
+                    f"Following columns {unknown_columns} cannot be matched to columns"
+                    f" {list(table_columns)} of table {table_name}.",
+                )
+            # encoders must produce exactly the binary representation of destination column type
+            encoders = [
+                get_field_encoder(
+                    self._job_client.type_mapper.to_destination_type(
+                        table_columns[name], self._load_table
+                    )
+                )
+                for name in column_names
+            ]
+            headers = ",".join(sql_client.escape_column_name(name) for name in column_names)
+            qualified_table_name = sql_client.make_qualified_table_name(table_name)
+            copy_sql = f"COPY {qualified_table_name} ({headers}) FROM STDIN WITH (FORMAT BINARY)"
+            copy_data = CopyDataStream(
+                iter_copy_data(parquet_file.iter_batches(batch_size=self.BATCH_SIZE), encoders)
+            )
+            with sql_client.begin_transaction():
+                with sql_client.native_connection.cursor() as cursor:
+                    cursor.copy_expert(copy_sql, copy_data, size=self.COPY_BUFFER_SIZE)
+
+
 class PostgresClient(InsertValuesJobClient):
     def __init__(
         self,
@@ -170,6 +226,14 @@ class PostgresClient(InsertValuesJobClient):
         job = super().create_load_job(table, file_path, load_id, restore)
         if not job and file_path.endswith("csv"):
             job = PostgresCsvCopyJob(file_path)
+        if not job and file_path.endswith("parquet"):
+            from dlt.destinations.impl.postgres.binary_copy import get_field_encoder
+
+            # fail the job right away if any of the columns cannot be encoded
+            for column in table["columns"].values():
+                if column.get("data_type"):
+                    get_field_encoder(self.type_mapper.to_destination_type(column, table))
+            job = PostgresParquetCopyJob(file_path)
         return job
 
     def _get_column_def_sql(self, c: TColumnSchema, table: PreparedTableSchema = None) -> str:
@@ -48,7 +48,10 @@ class synapse(Destination[SynapseClientConfiguration, "SynapseClient"]):
         caps = DestinationCapabilitiesContext()
 
         caps.preferred_loader_file_format = "insert_values"
-        caps.supported_loader_file_formats = ["insert_values"]
+        caps.supported_loader_file_formats = ["insert_values", "typed-jsonl", "parquet"]
+        # load local typed-jsonl and parquet files with pyodbc fast_executemany
+        caps.parametrized_insert_file_formats = ["typed-jsonl", "parquet"]
+        caps.explicit_loader_file_formats = ["typed-jsonl", "parquet"]
         caps.preferred_staging_file_format = "parquet"
         caps.supported_staging_file_formats = ["parquet"]
         caps.type_mapper = SynapseTypeMapper
@@ -1,4 +1,4 @@
-from typing import Any, Iterator, List
+from typing import Any, Iterator, List, Sequence
 
 from dlt.common.destination.reference import (
     PreparedTableSchema,
@@ -6,6 +6,7 @@ from dlt.common.destination.reference import (
     HasFollowupJobs,
     LoadJob,
 )
+from dlt.common.json import json, PY_DATETIME_DECODERS
 from dlt.common.storages import FileStorage
 from dlt.common.utils import chunks
 
@@ -96,7 +97,73 @@ class InsertValuesLoadJob(RunnableLoadJob, HasFollowupJobs):
             yield insert_sql
 
 
+class ParametrizedInsertLoadJob(RunnableLoadJob, HasFollowupJobs):
+    """Loads `typed-jsonl` or `parquet` file with a parametrized INSERT executed for batches of
+    rows. Values are bound by the driver so the destination does not parse any literals.
+    """
+
+    def __init__(self, file_path: str, batch_size: int) -> None:
+        super().__init__(file_path)
+        self._job_client: "SqlJobClientBase" = None
+        self.batch_size = batch_size
+
+    def run(self) -> None:
+        self._sql_client = self._job_client.sql_client
+        insert_sql = None
+        with self._sql_client.begin_transaction():
+            for column_names, batch in self._iter_batches():
+                if insert_sql is None:
+                    insert_sql = self._make_insert_sql(column_names)
+                self._sql_client.execute_batch(insert_sql, batch)
+
+    def _make_insert_sql(self, column_names: Sequence[str]) -> str:
+        qualified_table_name = self._sql_client.make_qualified_table_name(self.load_table_name)
+        columns = ",".join(self._sql_client.escape_column_name(name) for name in column_names)
+        placeholders = ",".join(["%s"] * len(column_names))
+        return f"INSERT INTO {qualified_table_name}({columns}) VALUES ({placeholders});"
+
+    def _iter_batches(self) -> Iterator[Any]:
+        if self._file_path.endswith("parquet"):
+            yield from self._iter_parquet_batches()
+        else:
+            yield from self._iter_jsonl_batches()
+
+    def _iter_parquet_batches(self) -> Iterator[Any]:
+        from dlt.common.libs.pyarrow import ParquetFile
+
+        with ParquetFile(self._file_path) as reader:
+            column_names = reader.schema_arrow.names
+            for batch in reader.iter_batches(batch_size=self.batch_size):
+                columns = [column.to_pylist() for column in batch.columns]
+                yield column_names, list(zip(*columns))
+
+    def _iter_jsonl_batches(self) -> Iterator[Any]:
+        # file may contain only a subset of table columns, missing values are NULL
+        column_names = list(self._load_table["columns"])
+        batch: List[Sequence[Any]] = []
+        with FileStorage.open_zipsafe_ro(self._file_path, "rb") as f:
+            for line in f:
+                # Decode date/time to py datetime objects, drivers may not handle pendulum
+                for item in json.typed_loadb(line, decoders=PY_DATETIME_DECODERS):
+                    batch.append(tuple(_to_param(item.get(name)) for name in column_names))
+                    if len(batch) >= self.batch_size:
+                        yield column_names, batch
+                        batch = []
+        if batch:
+            yield column_names, batch
+
+
+def _to_param(value: Any) -> Any:
+    # json columns are stored as serialized strings
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
 class InsertValuesJobClient(SqlJobClientWithStagingDataset):
+    insert_batch_size: int = 10000
+    """Number of rows bound in a single batch by parametrized inserts"""
+
     def create_load_job(
         self, table: PreparedTableSchema, file_path: str, load_id: str, restore: bool = False
     ) -> LoadJob:
@@ -105,4 +172,10 @@ class InsertValuesJobClient(SqlJobClientWithStagingDataset):
             # this is using sql_client internally and will raise a right exception
             if file_path.endswith("insert_values"):
                 job = InsertValuesLoadJob(file_path)
+            elif self._is_parametrized_insert_file(file_path):
+                job = ParametrizedInsertLoadJob(file_path, self.insert_batch_size)
         return job
+
+    def _is_parametrized_insert_file(self, file_path: str) -> bool:
+        file_formats = self.capabilities.parametrized_insert_file_formats or ()
+        return any(file_path.endswith("." + file_format) for file_format in file_formats)
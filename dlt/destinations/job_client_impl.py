@@ -1,4 +1,5 @@
 import os
+import math
 from abc import abstractmethod
 import base64
 import contextlib
@@ -6,7 +7,9 @@ from copy import copy
 from types import TracebackType
 from typing import (
     Any,
+    Callable,
     ClassVar,
+    Dict,
     List,
     Optional,
     Sequence,
@@ -20,8 +23,11 @@ import zlib
 import re
 from contextlib import contextmanager
 from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
 
 from dlt.common import pendulum, logger
+from dlt.common.configuration.container import Container
 from dlt.common.json import json
 from dlt.common.schema.typing import (
     C_DLT_LOAD_ID,
@@ -38,6 +44,7 @@ from dlt.common.schema.utils import (
     version_table,
 )
 from dlt.common.storages import FileStorage
+from dlt.common.utils import chunks
 from dlt.common.storages.load_package import LoadJobInfo, ParsedLoadJobFileName
 from dlt.common.schema import TColumnSchema, Schema, TTableSchemaColumns, TSchemaTables
 from dlt.common.destination.reference import (
@@ -496,11 +503,20 @@ WHERE """
         return fields
 
     def _execute_schema_update_sql(self, only_tables: Iterable[str]) -> TSchemaTables:
-        sql_scripts, schema_update = self._build_schema_update_sql(only_tables)
-        # Stay within max query size when doing DDL.
-        # Some DB backends use bytes not characters, so decrease the limit by half,
-        # assuming most of the characters in DDL encoded into single bytes.
-        self.sql_client.execute_many(sql_scripts)
+        table_sql, schema_update = self._build_schema_update_sql_by_table(only_tables)
+        if self._can_execute_ddl_concurrently() and len(table_sql) > 1:
+            # statements of different tables are independent, each table is migrated on its own connection
+            self._run_on_parallel_clients(
+                lambda client, sql_scripts: client.sql_client.execute_many(sql_scripts),
+                list(table_sql.values()),
+            )
+        else:
+            # Stay within max query size when doing DDL.
+            # Some DB backends use bytes not characters, so decrease the limit by half,
+            # assuming most of the characters in DDL encoded into single bytes.
+            self.sql_client.execute_many(
+                [sql for sql_scripts in table_sql.values() for sql in sql_scripts]
+            )
         self._update_schema_in_storage(self.schema)
         return schema_update
 
@@ -519,9 +535,16 @@ WHERE """
         Returns:
             Tuple[List[str], TSchemaTables]: Tuple with a list of CREATE/ALTER scripts, and a list of all tables with columns that will be added.
         """
-        sql_updates = []
+        table_sql, schema_update = self._build_schema_update_sql_by_table(only_tables)
+        return [sql for sql_scripts in table_sql.values() for sql in sql_scripts], schema_update
+
+    def _build_schema_update_sql_by_table(
+        self, only_tables: Iterable[str]
+    ) -> Tuple[Dict[str, List[str]], TSchemaTables]:
+        """Same as `_build_schema_update_sql` but CREATE/ALTER scripts are grouped by table name"""
+        table_sql: Dict[str, List[str]] = {}
         schema_update: TSchemaTables = {}
-        for table_name, storage_columns in self.get_storage_tables(
+        for table_name, storage_columns in self._get_storage_tables_for_update(
             only_tables or self.schema.tables.keys()
         ):
             # this will skip incomplete columns
@@ -531,17 +554,79 @@ WHERE """
                 # build and add sql to execute
                 self._check_table_update_hints(table_name, new_columns, generate_alter)
                 sql_statements = self._get_table_update_sql(table_name, new_columns, generate_alter)
-                for sql in sql_statements:
-                    if not sql.endswith(";"):
-                        sql += ";"
-                    sql_updates.append(sql)
+                table_sql[table_name] = [
+                    sql if sql.endswith(";") else sql + ";" for sql in sql_statements
+                ]
                 # create a schema update for particular table
                 partial_table = copy(self.prepare_load_table(table_name))
                 # keep only new columns
                 partial_table["columns"] = {c["name"]: c for c in new_columns}
                 schema_update[table_name] = partial_table
 
-        return sql_updates, schema_update
+        return table_sql, schema_update
+
+    def _get_storage_tables_for_update(
+        self, table_names: Iterable[str]
+    ) -> Iterable[Tuple[str, TTableSchemaColumns]]:
+        """Gets storage tables, in parallel batches over several connections if `schema_sync_workers` > 1"""
+        table_names = list(table_names)
+        workers = self._schema_sync_workers()
+        if workers <= 1 or len(table_names) <= 1:
+            return self.get_storage_tables(table_names)
+        batch_size = min(
+            math.ceil(len(table_names) / workers), max(self.INFO_TABLES_QUERY_THRESHOLD, 1)
+        )
+        batches = list(chunks(table_names, batch_size))
+        if len(batches) == 1:
+            return self.get_storage_tables(table_names)
+        storage_tables: List[Tuple[str, TTableSchemaColumns]] = []
+        for batch_tables in self._run_on_parallel_clients(
+            lambda client, batch: list(client.get_storage_tables(batch)), batches
+        ):
+            storage_tables.extend(batch_tables)
+        return storage_tables
+
+    def _schema_sync_workers(self) -> int:
+        return getattr(self.config, "schema_sync_workers", None) or 1
+
+    def _can_execute_ddl_concurrently(self) -> bool:
+        """DDL is executed concurrently only in auto commit mode, when destination does not have DDL transactions"""
+        return self._schema_sync_workers() > 1 and not self.capabilities.supports_ddl_transactions
+
+    def _run_on_parallel_clients(
+        self,
+        f: Callable[["SqlJobClientBase", Any], Any],
+        items: Sequence[Any],
+    ) -> List[Any]:
+        """Calls `f` for each of `items` in a thread pool where each thread works on a copy of this client with
+        its own connection. Results are returned in order of `items`.
+        """
+        workers = min(self._schema_sync_workers(), len(items))
+        clients: "Queue[SqlJobClientBase]" = Queue()
+        opened: List[SqlJobClientBase] = []
+
+        def _run(item: Any) -> Any:
+            client = clients.get()
+            try:
+                return f(client, item)
+            finally:
+                clients.put(client)
+
+        try:
+            for _ in range(workers):
+                # shallow copy shares config and schema, the sql client gets a new connection
+                client = copy(self)
+                client.sql_client = copy(self.sql_client)
+                client.sql_client.open_connection()
+                opened.append(client)
+                clients.put(client)
+            with ThreadPoolExecutor(
+                workers, thread_name_prefix=Container.thread_pool_prefix() + "schema_sync"
+            ) as pool:
+                return list(pool.map(_run, items))
+        finally:
+            for client in opened:
+                client.sql_client.close_connection()
 
     def _make_add_column_sql(
         self, new_columns: Sequence[TColumnSchema], table: PreparedTableSchema = None
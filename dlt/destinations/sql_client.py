@@ -88,6 +88,12 @@ class SqlClientBase(ABC, Generic[TNativeConn]):
     def begin_transaction(self) -> ContextManager[DBTransaction]:
         pass
 
+    def __copy__(self) -> "SqlClientBase[TNativeConn]":
+        # copy instance dict directly, `__getattr__` must not be called on uninitialized instance
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        return clone
+
     def __getattr__(self, name: str) -> Any:
         # pass unresolved attrs to native connections
         if not self.native_connection:
@@ -196,6 +202,13 @@ SELECT 1
                     ret.append(result)
         return ret
 
+    def execute_batch(self, query: str, batch: Sequence[Sequence[Any]]) -> None:
+        """Executes parametrized `query` once for each sequence of arguments in `batch`. Default
+        implementation executes rows one by one, clients should use batch execution of the driver.
+        """
+        for args in batch:
+            self.execute_sql(query, *args)
+
     def catalog_name(self, escape: bool = True) -> Optional[str]:
         # default is no catalogue component of the name, which typically means that
         # connection is scoped to a current database
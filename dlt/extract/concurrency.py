@@ -1,11 +1,15 @@
 import asyncio
+from collections import deque
 from concurrent.futures import (
     ThreadPoolExecutor,
-    as_completed,
+    TimeoutError as FutureTimeoutError,
     wait as wait_for_futures,
 )
-from threading import Thread
-from typing import Awaitable, Dict, Optional
+from functools import partial
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition, Thread
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 
 from dlt.common.exceptions import PipelineException
 from dlt.common.configuration.container import Container
@@ -24,19 +28,49 @@ class FuturesPool:
     """Worker pool for pipe items that can be resolved asynchronously.
 
     Items can be either asyncio coroutines or regular callables which will be executed in a thread pool.
+
+    Done futures are put into a ready queue by their done callbacks so resolving them does not scan the pool
+    and waiting for them blocks on a condition. Ready futures are resolved round robin across pipes and in
+    insertion order within a pipe.
+
+    In `native_async` mode awaitables run as tasks on an event loop owned by the thread that uses the pool and
+    callables are bridged into the same loop with `run_in_executor`. The loop runs only while the pool is
+    waiting for or polling the futures so there are no cross-thread handoffs for awaitables. If another loop
+    already runs in that thread, the pool falls back to the background loop.
     """
 
     def __init__(
-        self, workers: int = 5, poll_interval: float = 0.01, max_parallel_items: int = 20
+        self,
+        workers: int = 5,
+        poll_interval: float = 0.01,
+        max_parallel_items: int = 20,
+        native_async: bool = False,
     ) -> None:
         self.futures: Dict[TItemFuture, FuturePipeItem] = {}
         self._thread_pool: ThreadPoolExecutor = None
         self._async_pool: asyncio.AbstractEventLoop = None
         self._async_pool_thread: Thread = None
+        self._native_loop: asyncio.AbstractEventLoop = None
+        # future completed by done callbacks to stop the native loop
+        self._native_waiter: "asyncio.Future[None]" = None
+        self.native_async = native_async
         self.workers = workers
         self.poll_interval = poll_interval
         self.max_parallel_items = max_parallel_items
         self.used_slots: int = 0
+        # guards slots and ready queue which are modified by done callbacks in worker threads
+        self._ready_condition = Condition()
+        self._submit_seq = count()
+        # done futures per pipe name ordered by insertion
+        self._ready: Dict[str, List[Tuple[int, TItemFuture]]] = {}
+        # pipes with done futures in round robin order
+        self._ready_pipes: Deque[str] = deque()
+        self.ready_count: int = 0
+        """Number of done futures waiting to be resolved"""
+        self.max_ready_count: int = 0
+        """Max depth of ready queue observed"""
+        self.resolved_counts: Dict[str, int] = {}
+        """Number of resolved futures per pipe name"""
 
     def __len__(self) -> int:
         return len(self.futures)
@@ -81,9 +115,73 @@ class FuturesPool:
         # start or return async pool
         return self._async_pool
 
-    def _vacate_slot(self, _: TItemFuture) -> None:
-        # Used as callback to free up slot when future is done
-        self.used_slots -= 1
+    def _ensure_native_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        # lazily create event loop in the current thread, None if native mode is not available
+        if self._native_loop:
+            return self._native_loop
+        if not self.native_async:
+            return None
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # no loop runs in the current thread
+            self._native_loop = asyncio.new_event_loop()
+            return self._native_loop
+        # we cannot run nested loops, use background loop
+        self.native_async = False
+        return None
+
+    def _run_native_loop(self, predicate: Callable[[], bool], timeout: float = None) -> bool:
+        """Runs native loop until `predicate` is True or `timeout` passes. Returns the predicate value"""
+        loop = self._native_loop
+        deadline = None if timeout is None else loop.time() + timeout
+        while not predicate():
+            if deadline is not None and loop.time() >= deadline:
+                return False
+            self._native_waiter = waiter = loop.create_future()
+            timeout_handle = loop.call_at(deadline, waiter.cancel) if deadline is not None else None
+            try:
+                loop.run_until_complete(waiter)
+            except asyncio.CancelledError:
+                pass
+            finally:
+                self._native_waiter = None
+                if timeout_handle:
+                    timeout_handle.cancel()
+        return True
+
+    def _tick_native_loop(self) -> None:
+        # run a single iteration of the native loop so pending tasks progress
+        if self._native_loop and self.used_slots > 0:
+            self._native_loop.call_soon(self._native_loop.stop)
+            self._native_loop.run_forever()
+
+    def _on_future_done(self, seq: int, pipe_name: str, future: TItemFuture) -> None:
+        # Used as callback to free up slot and queue the future when it is done
+        with self._ready_condition:
+            self.used_slots -= 1
+            if not future.cancelled():
+                ready = self._ready.setdefault(pipe_name, [])
+                if not ready:
+                    self._ready_pipes.append(pipe_name)
+                heappush(ready, (seq, future))
+                self.ready_count += 1
+                self.max_ready_count = max(self.max_ready_count, self.ready_count)
+            self._ready_condition.notify_all()
+        # native loop calls back in its own thread, wake it up
+        if self._native_waiter is not None and not self._native_waiter.done():
+            self._native_waiter.set_result(None)
+
+    def _pop_ready_future(self) -> TItemFuture:
+        # must be called with condition acquired
+        pipe_name = self._ready_pipes.popleft()
+        ready = self._ready[pipe_name]
+        _, future = heappop(ready)
+        if ready:
+            # move pipe to the end of the queue so other pipes are resolved first
+            self._ready_pipes.append(pipe_name)
+        self.ready_count -= 1
+        return future
 
     def submit(self, pipe_item: ResolvablePipeItem) -> TItemFuture:
         """Submit an item to the pool.
@@ -108,7 +206,14 @@ class FuturesPool:
 
         # submit to thread pool or async pool
         item = pipe_item.item
-        if isinstance(item, Awaitable):
+        if loop := self._ensure_native_loop():
+            if isinstance(item, Awaitable):
+                future = asyncio.ensure_future(item, loop=loop)
+            elif callable(item):
+                future = loop.run_in_executor(self._ensure_thread_pool(), item)
+            else:
+                raise ValueError(f"Unsupported item type: {type(item)}")
+        elif isinstance(item, Awaitable):
             future = asyncio.run_coroutine_threadsafe(item, self._ensure_async_pool())
         elif callable(item):
             future = self._ensure_thread_pool().submit(item)
@@ -117,12 +222,15 @@ class FuturesPool:
 
         # Future is not removed from self.futures until it's been consumed by the
         # pipe iterator. But we always want to vacate a slot so new jobs can be submitted
-        future.add_done_callback(self._vacate_slot)
-        self.used_slots += 1
-
+        with self._ready_condition:
+            self.used_slots += 1
         self.futures[future] = FuturePipeItem(
             future, pipe_item.step, pipe_item.pipe, pipe_item.meta
         )
+        # callback is called immediately if future is already done (or scheduled on the native loop)
+        future.add_done_callback(
+            partial(self._on_future_done, next(self._submit_seq), pipe_item.pipe.name)
+        )
         return future
 
     def sleep(self) -> None:
@@ -130,6 +238,7 @@ class FuturesPool:
 
     def _resolve_future(self, future: TItemFuture) -> Optional[ResolvablePipeItem]:
         future, step, pipe, meta = self.futures.pop(future)
+        self.resolved_counts[pipe.name] = self.resolved_counts.get(pipe.name, 0) + 1
 
         if ex := future.exception():
             if isinstance(ex, StopAsyncIteration):
@@ -150,10 +259,6 @@ class FuturesPool:
         else:
             return ResolvablePipeItem(item, step, pipe, meta)
 
-    def _next_done_future(self) -> Optional[TItemFuture]:
-        """Get the done future in the pool (if any). This does not block."""
-        return next((fut for fut in self.futures if fut.done() and not fut.cancelled()), None)
-
     def resolve_next_future(
         self, use_configured_timeout: bool = False
     ) -> Optional[ResolvablePipeItem]:
@@ -169,44 +274,45 @@ class FuturesPool:
         if not self.futures:
             return None
 
-        if (future := self._next_done_future()) is not None:
-            # When there are multiple already done futures from the same pipe we return results in insertion order
-            return self._resolve_future(future)
-        for future in as_completed(
-            self.futures, timeout=self.poll_interval if use_configured_timeout else None
-        ):
-            if future.cancelled():
-                # Get the next not-cancelled future
-                continue
-
-            return self._resolve_future(future)
+        timeout = self.poll_interval if use_configured_timeout else None
+        if self._native_loop:
+            if not self._run_native_loop(
+                lambda: self.ready_count > 0 or self.used_slots == 0, timeout
+            ):
+                raise FutureTimeoutError()
 
-        return None
+        with self._ready_condition:
+            # wait until a future is done or no future can be done anymore
+            if not self._ready_condition.wait_for(
+                lambda: self.ready_count > 0 or self.used_slots == 0,
+                timeout=timeout,
+            ):
+                raise FutureTimeoutError()
+            if self.ready_count == 0:
+                return None
+            # When there are multiple already done futures from the same pipe we return results in insertion order
+            future = self._pop_ready_future()
+        return self._resolve_future(future)
 
     def resolve_next_future_no_wait(self) -> Optional[ResolvablePipeItem]:
         """Resolve the first done future in the pool.
         This does not block and returns None if no future is done.
         """
-        # Get next done future
-        future = self._next_done_future()
-        if not future:
-            return None
-
+        if self.ready_count == 0:
+            self._tick_native_loop()
+        with self._ready_condition:
+            if self.ready_count == 0:
+                return None
+            future = self._pop_ready_future()
         return self._resolve_future(future)
 
     def _wait_for_free_slot(self) -> None:
         """Wait until any future in the pool is completed to ensure there's a free slot."""
-        if self.free_slots >= 1:
+        if self._native_loop:
+            self._run_native_loop(lambda: self.free_slots >= 1)
             return
-
-        for future in as_completed(self.futures):
-            if future.cancelled():
-                # Get the next not-cancelled future
-                continue
-            if self.free_slots == 0:
-                # Future was already completed so slot was not freed
-                continue
-            return  # Return when first future completes
+        with self._ready_condition:
+            self._ready_condition.wait_for(lambda: self.free_slots >= 1)
 
     def close(self) -> None:
         # Cancel all futures
@@ -217,6 +323,15 @@ class FuturesPool:
         def stop_background_loop(loop: asyncio.AbstractEventLoop) -> None:
             loop.stop()
 
+        if self._native_loop:
+            # let cancelled tasks finish and close all async generators in the loop
+            pending = [f for f in self.futures if not f.done()]
+            if pending:
+                self._native_loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)  # type: ignore[arg-type]
+                )
+            self._native_loop.run_until_complete(self._native_loop.shutdown_asyncgens())
+
         if self._async_pool:
             # wait for all async generators to be closed
             future = asyncio.run_coroutine_threadsafe(
@@ -234,4 +349,13 @@ class FuturesPool:
             self._thread_pool.shutdown(wait=True)
             self._thread_pool = None
 
+        if self._native_loop:
+            # close after thread pool so executor callbacks do not see a closed loop
+            self._native_loop.close()
+            self._native_loop = None
+
         self.futures.clear()
+        with self._ready_condition:
+            self._ready.clear()
+            self._ready_pipes.clear()
+            self.ready_count = 0
@@ -1,5 +1,6 @@
 import contextlib
 from collections.abc import Sequence as C_Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import copy
 import itertools
 from typing import Iterator, List, Dict, Any, Optional
@@ -46,6 +47,7 @@ from dlt.extract.resource import DltResource
 from dlt.extract.storage import ExtractStorage
 from dlt.extract.extractors import ObjectExtractor, ArrowExtractor, Extractor
 from dlt.extract.utils import get_data_item_format
+from dlt.extract.items import PipeItem
 
 
 def data_to_sources(
@@ -184,6 +186,8 @@ def describe_extract_data(data: Any) -> List[ExtractDataInfo]:
 class Extract(WithStepInfo[ExtractMetrics, ExtractInfo]):
     original_data: Any
     """Original data from which the extracted DltSource was created. Will be used to describe in extract info"""
+    write_batch_size: int = 100
+    """Number of pipe items written in one batch by the writer thread in native async mode"""
 
     def __init__(
         self,
@@ -275,7 +279,11 @@ class Extract(WithStepInfo[ExtractMetrics, ExtractInfo]):
         # find REPLACE resources that did not yield any pipe items and create empty jobs for them
         # NOTE: do not include tables that have never seen data
         data_tables = {t["name"]: t for t in schema.data_tables(seen_data_only=True)}
-        tables_by_resources = utils.group_tables_by_resource(data_tables)
+        tables_by_resources = utils.group_tables_by_resource(
+            data_tables,
+            nested_tables=schema.nested_tables,
+            resource_tables=schema.resource_tables,
+        )
         for resource in source.resources.selected.values():
             if resource.write_disposition != "replace" or resource.name in resources_with_items:
                 continue
@@ -294,7 +302,11 @@ class Extract(WithStepInfo[ExtractMetrics, ExtractInfo]):
         )
         # get all possible tables
         data_tables = {t["name"]: t for t in schema.data_tables()}
-        tables_by_resources = utils.group_tables_by_resource(data_tables)
+        tables_by_resources = utils.group_tables_by_resource(
+            data_tables,
+            nested_tables=schema.nested_tables,
+            resource_tables=schema.resource_tables,
+        )
         for resource_name in resources_with_empty:
             if resource := source.resources.selected.get(resource_name):
                 if tables := tables_by_resources.get("resource_name"):
@@ -335,26 +347,58 @@ class Extract(WithStepInfo[ExtractMetrics, ExtractInfo]):
                     max_parallel_items=max_parallel_items,
                     workers=workers,
                 ) as pipes:
-                    left_gens = total_gens = len(pipes._sources)
-                    collector.update("Resources", 0, total_gens)
-                    for pipe_item in pipes:
-                        curr_gens = len(pipes._sources)
-                        if left_gens > curr_gens:
-                            delta = left_gens - curr_gens
-                            left_gens -= delta
-                            collector.update("Resources", delta)
-                        signals.raise_if_signalled()
-                        resource = source.resources[pipe_item.pipe.name]
-                        item_format = get_data_item_format(pipe_item.item)
-                        extractors[item_format].write_items(
-                            resource, pipe_item.item, pipe_item.meta
+                    # in native async mode the event loop runs in this thread so writing is moved out of it
+                    write_pool: ThreadPoolExecutor = None
+                    if pipes.native_async:
+                        write_pool = ThreadPoolExecutor(
+                            1, thread_name_prefix=Container.thread_pool_prefix() + "extract_writer"
                         )
+                    write_future: Future[None] = None
+                    write_batch: List[PipeItem] = []
+                    try:
+                        left_gens = total_gens = len(pipes._sources)
+                        collector.update("Resources", 0, total_gens)
+                        for pipe_item in pipes:
+                            curr_gens = len(pipes._sources)
+                            if left_gens > curr_gens:
+                                delta = left_gens - curr_gens
+                                left_gens -= delta
+                                collector.update("Resources", delta)
+                            signals.raise_if_signalled()
+                            if write_pool is None:
+                                self._write_pipe_items(source, extractors, [pipe_item])
+                                continue
+                            write_batch.append(pipe_item)
+                            if len(write_batch) >= self.write_batch_size:
+                                # wait for previous batch so items are written in order
+                                if write_future:
+                                    write_future.result()
+                                write_future = write_pool.submit(
+                                    self._write_pipe_items, source, extractors, write_batch
+                                )
+                                write_batch = []
+                        if write_future:
+                            write_future.result()
+                        if write_batch:
+                            self._write_pipe_items(source, extractors, write_batch)
+                    finally:
+                        if write_pool:
+                            write_pool.shutdown(wait=True)
 
                     self._write_empty_files(source, extractors)
                     if left_gens > 0:
                         # go to 100%
                         collector.update("Resources", left_gens)
 
+    @staticmethod
+    def _write_pipe_items(
+        source: DltSource, extractors: Dict[TDataItemFormat, Extractor], pipe_items: List[PipeItem]
+    ) -> None:
+        for pipe_item in pipe_items:
+            resource = source.resources[pipe_item.pipe.name]
+            item_format = get_data_item_format(pipe_item.item)
+            extractors[item_format].write_items(resource, pipe_item.item, pipe_item.meta)
+
     @contextlib.contextmanager
     def manage_writers(self, load_id: str, source: DltSource) -> Iterator[ExtractStorage]:
         self._step_info_start_load_id(load_id)
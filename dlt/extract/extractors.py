@@ -37,6 +37,10 @@ except MissingDependencyException:
     pandas = None
 
 
+DYNAMIC_TABLE_NAMES_CACHE_SIZE = 1024
+"""Max number of normalized dynamic table names cached by an extractor"""
+
+
 class MaterializedEmptyList(List[Any]):
     """A list variant that will materialize tables even if empty list was yielded"""
 
@@ -119,6 +123,8 @@ class Extractor:
         self._table_contracts: Dict[str, TSchemaContractDict] = {}
         self._filtered_tables: Set[str] = set()
         self._filtered_columns: Dict[str, Dict[str, TSchemaEvolutionMode]] = {}
+        self._dynamic_table_names: Dict[str, str] = {}
+        """Cache of normalized table names returned by table name hint functions"""
         self._caps = _caps or DestinationCapabilitiesContext.generic_capabilities()
 
     def write_items(self, resource: DltResource, items: TDataItems, meta: Any) -> None:
@@ -154,7 +160,16 @@ class Extractor:
         return self.naming.normalize_table_identifier(table_name)
 
     def _get_dynamic_table_name(self, resource: DltResource, item: TDataItem) -> str:
-        return self.naming.normalize_table_identifier(resource._table_name_hint_fun(item))
+        return self._normalize_dynamic_table_name(resource._table_name_hint_fun(item))
+
+    def _normalize_dynamic_table_name(self, table_name: str) -> str:
+        if (norm_table_name := self._dynamic_table_names.get(table_name)) is None:
+            if len(self._dynamic_table_names) >= DYNAMIC_TABLE_NAMES_CACHE_SIZE:
+                self._dynamic_table_names.clear()
+            norm_table_name = self._dynamic_table_names[table_name] = (
+                self.naming.normalize_table_identifier(table_name)
+            )
+        return norm_table_name
 
     def _write_item(
         self,
@@ -195,20 +210,50 @@ class Extractor:
         if not isinstance(items, list):
             items = [items]
 
+        # partition items by table name in one pass, order of items within a table is preserved
+        table_name_hint_fun = resource._table_name_hint_fun
+        tables_items: Dict[str, List[TDataItem]] = {}
         for item in items:
-            table_name = self._get_dynamic_table_name(resource, item)
+            table_name = self._normalize_dynamic_table_name(table_name_hint_fun(item))
+            if (table_items := tables_items.get(table_name)) is None:
+                table_items = tables_items[table_name] = []
+            table_items.append(item)
+
+        for table_name, table_items in tables_items.items():
             if table_name in self._filtered_tables:
                 continue
-            if table_name not in self._table_contracts or resource._table_has_other_dynamic_hints:
-                item = self._compute_and_update_table(
-                    resource, table_name, item, TableNameMeta(table_name)
-                )
+            table_items = self._compute_and_update_dynamic_table(resource, table_name, table_items)
+            if not table_items:
+                continue
             # write to storage with inferred table name
-            if table_name not in self._filtered_tables:
-                if isinstance(meta, ImportFileMeta):
+            if isinstance(meta, ImportFileMeta):
+                for _ in table_items:
                     self._import_item(table_name, resource.name, meta)
-                else:
-                    self._write_item(table_name, resource.name, item)
+            else:
+                self._write_item(table_name, resource.name, table_items)
+
+    def _compute_and_update_dynamic_table(
+        self, resource: DltResource, table_name: str, items: List[TDataItem]
+    ) -> List[TDataItem]:
+        """Computes and updates table with dynamic name for a group of `items` belonging to it. Returns
+        items that should be written
+        """
+        meta = TableNameMeta(table_name)
+        if resource._table_has_other_dynamic_hints:
+            # other hints depend on data so they must be evaluated for each item
+            computed_items: List[TDataItem] = []
+            for item in items:
+                item = self._compute_and_update_table(resource, table_name, item, meta)
+                if table_name in self._filtered_tables:
+                    break
+                computed_items.append(item)
+            return computed_items
+        if table_name not in self._table_contracts:
+            # table schema is computed once from the first item
+            self._compute_and_update_table(resource, table_name, items[0], meta)
+            if table_name in self._filtered_tables:
+                return []
+        return items
 
     def _write_to_static_table(
         self, resource: DltResource, table_name: str, items: TDataItems, meta: Any
@@ -339,6 +384,18 @@ class ArrowExtractor(Extractor):
         self._reset_contracts_cache()
         super()._write_to_static_table(resource, table_name, items, meta)
 
+    def _compute_and_update_dynamic_table(
+        self, resource: DltResource, table_name: str, items: List[TDataItem]
+    ) -> List[TDataItem]:
+        # contract cache not supported for arrow tables, compute the table from all items in the group
+        self._reset_contracts_cache()
+        items = self._compute_and_update_table(
+            resource, table_name, items, TableNameMeta(table_name)
+        )
+        if table_name in self._filtered_tables:
+            return []
+        return items
+
     def _apply_contract_filters(
         self, item: "TAnyArrowItem", resource: DltResource, static_table_name: Optional[str]
     ) -> "TAnyArrowItem":
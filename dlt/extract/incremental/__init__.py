@@ -514,11 +514,19 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
 
         transformer = self._get_transformer(rows)
         if isinstance(rows, list):
-            rows = [
-                item
-                for item in (self._transform_item(transformer, row) for row in rows)
-                if item is not None
-            ]
+            batch = None
+            if isinstance(transformer, JsonIncremental):
+                batch = transformer.transform_batch(rows)
+            if batch is not None:
+                rows, self.start_out_of_range, self.end_out_of_range = batch
+                if self.can_close() and not self._bound_pipe.has_parent:
+                    self._bound_pipe.close()
+            else:
+                rows = [
+                    item
+                    for item in (self._transform_item(transformer, row) for row in rows)
+                    if item is not None
+                ]
         else:
             rows = self._transform_item(transformer, rows)
 
@@ -1,3 +1,4 @@
+import operator
 from datetime import datetime  # noqa: I251
 from typing import Any, Optional, Set, Tuple, List, Type
 
@@ -255,6 +256,126 @@ class JsonIncremental(IncrementalTransform):
 
         return row, False, False
 
+    def transform_batch(
+        self, rows: List[TDataItem]
+    ) -> Optional[Tuple[List[TDataItem], bool, bool]]:
+        """Filters a list of rows at once with the same semantics as calling the instance on each row.
+
+        Cursor values are extracted in a single pass and compared with start and end values over the whole list,
+        new last value is computed with a single `last_value_func` call and unique hashes are computed only for rows
+        equal to start value. Out of range flags are set if any of the rows was out of range.
+
+        Returns:
+            Tuple (rows, start_out_of_range, end_out_of_range) or None if rows must be processed one by one ie.
+            for custom `last_value_func`, items that are not dicts or values that cannot be compared.
+        """
+        if self.last_value_func is max:
+            is_after = operator.gt
+        elif self.last_value_func is min:
+            is_after = operator.lt
+        else:
+            return None
+
+        if self._compiled_cursor_path:
+            if None in rows:
+                return None
+            # raises on missing values if requested
+            values = [self.find_cursor_value(row) for row in rows]
+        else:
+            cursor_path = self.cursor_path
+            try:
+                values = [row.get(cursor_path) for row in rows]
+            except AttributeError:
+                # not a dict
+                return None
+        has_missing = None in values
+        if has_missing and self.on_cursor_value_missing == "raise":
+            # raise exception for the first row without cursor value
+            self.find_cursor_value(rows[values.index(None)])
+
+        last_value = self.last_value
+        if isinstance(last_value, datetime) and last_value.tzinfo is not None:
+            values = [
+                (
+                    pendulum.instance(value).in_tz("UTC")
+                    if isinstance(value, datetime) and value.tzinfo is None
+                    else value
+                )
+                for value in values
+            ]
+        elif last_value is None and any(isinstance(value, datetime) for value in values):
+            # tz awareness of datetimes is aligned to the first row
+            return None
+
+        start_value = self.start_value
+        end_value = self.end_value
+        try:
+            # rows after or equal end value are out of range
+            end_mask = (
+                [v is not None and not is_after(end_value, v) for v in values]
+                if end_value is not None
+                else None
+            )
+            # rows before start value are out of range, rows equal to it may be already processed
+            start_mask = (
+                [v is not None and not is_after(v, start_value) for v in values]
+                if start_value is not None
+                else None
+            )
+        except TypeError:
+            # let row by row processing raise exception with full information
+            return None
+
+        if not (has_missing or (end_mask and any(end_mask)) or (start_mask and any(start_mask))):
+            # all rows are in range
+            in_range = value_rows = rows
+            in_range_values = values
+            start_out_of_range = end_out_of_range = False
+        else:
+            keep_missing = self.on_cursor_value_missing == "include"
+            dedup = not self.deduplication_disabled
+            in_range = []
+            value_rows = []
+            in_range_values = []
+            start_out_of_range = end_out_of_range = False
+            for i, value in enumerate(values):
+                row = rows[i]
+                if value is None:
+                    # rows without cursor value do not change the state
+                    if keep_missing:
+                        in_range.append(row)
+                    continue
+                if end_mask and end_mask[i]:
+                    end_out_of_range = True
+                    continue
+                if start_mask and start_mask[i]:
+                    if value != start_value or (
+                        dedup
+                        and self.compute_unique_value(row, self.primary_key)
+                        in self.start_unique_hashes
+                    ):
+                        start_out_of_range = True
+                        continue
+                in_range.append(row)
+                value_rows.append(row)
+                in_range_values.append(value)
+
+        if in_range_values:
+            try:
+                batch_value = self.last_value_func(in_range_values)
+                is_new_value = last_value is None or is_after(batch_value, last_value)
+            except TypeError:
+                return None
+            if is_new_value:
+                # store rows with new last value to compute hashes after processing full batch
+                self.last_value = last_value = batch_value
+                self.last_rows = []
+                self.unique_hashes = set()
+            self.last_rows.extend(
+                row for row, value in zip(value_rows, in_range_values) if value == last_value
+            )
+        return in_range, start_out_of_range, end_out_of_range
+
 
 class ArrowIncremental(IncrementalTransform):
     _dlt_index = "_dlt_index"
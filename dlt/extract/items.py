@@ -17,6 +17,7 @@ from typing import (
     NamedTuple,
     Generator,
 )
+import asyncio
 from concurrent.futures import Future
 
 from dlt.common.typing import TAny, TDataItem, TDataItems
@@ -32,7 +33,7 @@ TFunHintTemplate = Callable[[TDataItem], TDynHintType]
 TTableHintTemplate = Union[TDynHintType, TFunHintTemplate[TDynHintType]]
 
 if TYPE_CHECKING:
-    TItemFuture = Future[TPipedDataItems]
+    TItemFuture = Union[Future[TPipedDataItems], asyncio.Future[TPipedDataItems]]
 else:
     TItemFuture = Future
 
@@ -52,6 +52,8 @@ class PipeIterator(Iterator[PipeItem]):
         futures_poll_interval: float = 0.01
         copy_on_fork: bool = False
         next_item_mode: str = "round_robin"
+        native_async: bool = False
+        """Run awaitables and async generators on an event loop in the iterating thread"""
         __section__: ClassVar[str] = known_sections.EXTRACT
 
     def __init__(
@@ -61,6 +63,7 @@ class PipeIterator(Iterator[PipeItem]):
         futures_poll_interval: float,
         sources: List[SourcePipeItem],
         next_item_mode: TPipeNextItemMode,
+        native_async: bool = False,
     ) -> None:
         self._sources = sources
         self._next_item_mode: TPipeNextItemMode = next_item_mode
@@ -70,6 +73,7 @@ class PipeIterator(Iterator[PipeItem]):
             workers=workers,
             poll_interval=futures_poll_interval,
             max_parallel_items=max_parallel_items,
+            native_async=native_async,
         )
 
     @classmethod
@@ -82,6 +86,7 @@ class PipeIterator(Iterator[PipeItem]):
         workers: int = 5,
         futures_poll_interval: float = 0.01,
         next_item_mode: TPipeNextItemMode = "round_robin",
+        native_async: bool = False,
     ) -> "PipeIterator":
         # join all dependent pipes
         if pipe.parent:
@@ -95,7 +100,14 @@ class PipeIterator(Iterator[PipeItem]):
 
         # create extractor
         sources = [SourcePipeItem(pipe.gen, 0, pipe, None)]
-        return cls(max_parallel_items, workers, futures_poll_interval, sources, next_item_mode)
+        return cls(
+            max_parallel_items,
+            workers,
+            futures_poll_interval,
+            sources,
+            next_item_mode,
+            native_async,
+        )
 
     @classmethod
     @with_config(spec=PipeIteratorConfiguration)
@@ -109,6 +121,7 @@ class PipeIterator(Iterator[PipeItem]):
         futures_poll_interval: float = 0.01,
         copy_on_fork: bool = False,
         next_item_mode: TPipeNextItemMode = "round_robin",
+        native_async: bool = False,
     ) -> "PipeIterator":
         # print(f"max_parallel_items: {max_parallel_items} workers: {workers}")
         sources: List[SourcePipeItem] = []
@@ -141,7 +154,19 @@ class PipeIterator(Iterator[PipeItem]):
             _fork_pipeline(pipe)
 
         # create extractor
-        return cls(max_parallel_items, workers, futures_poll_interval, sources, next_item_mode)
+        return cls(
+            max_parallel_items,
+            workers,
+            futures_poll_interval,
+            sources,
+            next_item_mode,
+            native_async,
+        )
+
+    @property
+    def native_async(self) -> bool:
+        """True if awaitables are evaluated on an event loop in the iterating thread"""
+        return self._futures_pool.native_async
 
     def __next__(self) -> PipeItem:
         pipe_item: Union[ResolvablePipeItem, SourcePipeItem] = None
@@ -1,17 +1,18 @@
 import contextlib
 from functools import reduce
 from typing import Dict, List, Optional, Tuple, Set, Iterator, Iterable, Sequence
-from concurrent.futures import Executor
+from concurrent.futures import Executor, Future
 import os
+import threading
+import time
 
 from dlt.common import logger
 from dlt.common.exceptions import TerminalException
-from dlt.common.metrics import LoadJobMetrics
-from dlt.common.runtime.signals import sleep
+from dlt.common.metrics import LoadJobMetrics, LoadSchedulerMetrics
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.pipeline import LoadInfo, LoadMetrics, SupportsPipeline, WithStepInfo
-from dlt.common.schema.utils import get_root_table
+from dlt.common.schema.utils import get_nested_tables, get_root_table
 from dlt.common.storages.load_storage import (
     LoadPackageInfo,
     ParsedLoadJobFileName,
@@ -91,9 +92,15 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
         self._loaded_packages: List[LoadPackageInfo] = []
         self._job_metrics: Dict[str, LoadJobMetrics] = {}
+        self._scheduler_metrics: LoadSchedulerMetrics = None
         self._run_loop_sleep_duration: float = (
-            1.0  # amount of time to sleep between querying completed jobs
+            1.0  # max amount of time to wait for a job to finish before querying completed jobs
         )
+        # set when any of the running jobs finishes so the load loop wakes up immediately
+        self._job_finished = threading.Event()
+        # time when new job (by file name) was first seen, used to measure queue wait time
+        self._job_queued_at: Dict[str, float] = {}
+        self._queue_wait_times: List[float] = []
         super().__init__()
 
     def create_storage(self, is_storage_owner: bool) -> LoadStorage:
@@ -218,11 +225,14 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             # set job vars
             job.set_run_vars(load_id=load_id, schema=schema, load_table=load_table)
             # submit to pool
-            self.pool.submit(Load.w_run_job, *(id(self), job, is_staging_destination_job, use_staging_dataset, schema))  # type: ignore
+            future: Future[None] = self.pool.submit(Load.w_run_job, *(id(self), job, is_staging_destination_job, use_staging_dataset, schema))  # type: ignore
+            future.add_done_callback(self._on_job_finished)
 
         # sanity check: otherwise a job in an actionable state is expected
         else:
             assert job.state() in ("completed", "failed", "retry")
+            # job is already in final state and may be completed right away
+            self._job_finished.set()
 
         return job
 
@@ -247,6 +257,9 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             with self.maybe_with_staging_dataset(client, use_staging_dataset):
                 job.run_managed(active_job_client)
 
+    def _on_job_finished(self, future: "Future[None]") -> None:
+        self._job_finished.set()
+
     def start_new_jobs(
         self, load_id: str, schema: Schema, running_jobs: Sequence[LoadJob]
     ) -> Sequence[LoadJob]:
@@ -262,9 +275,14 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         if available_slots <= 0:
             return []
 
+        new_jobs = self.load_storage.list_new_jobs(load_id)
+        now = time.time()
+        for file in new_jobs:
+            self._job_queued_at.setdefault(file, now)
+
         # get a list of jobs eligible to be started
         load_files = filter_new_jobs(
-            self.load_storage.list_new_jobs(load_id),
+            new_jobs,
             caps,
             self.config,
             running_jobs,
@@ -274,6 +292,7 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         logger.info(f"Will load additional {len(load_files)}, creating jobs")
         started_jobs: List[LoadJob] = []
         for file in load_files:
+            self._queue_wait_times.append(now - self._job_queued_at.pop(file, now))
             job = self.submit_job(file, load_id, schema)
             started_jobs.append(job)
 
@@ -323,9 +342,16 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                     schema.tables, starting_job.job_file_info().table_name
                 )
                 # if all tables of chain completed, create follow up jobs
-                all_jobs_states = self.load_storage.normalized_packages.list_all_jobs_with_states(
-                    load_id
-                )
+                package_storage = self.load_storage.normalized_packages
+                all_jobs_states = [
+                    job_state
+                    for table in get_nested_tables(
+                        schema.tables, root_job_table["name"], schema.nested_tables
+                    )
+                    for job_state in package_storage.list_job_with_states_for_table(
+                        load_id, table["name"]
+                    )
+                ]
                 if table_chain := get_completed_table_chain(
                     schema, all_jobs_states, root_job_table, starting_job.job_file_info().job_id()
                 ):
@@ -489,7 +515,12 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         # TODO: job metrics must be persisted
         self._step_info_complete_load_id(
             load_id,
-            metrics={"started_at": None, "finished_at": None, "job_metrics": self._job_metrics},
+            metrics={
+                "started_at": None,
+                "finished_at": None,
+                "job_metrics": self._job_metrics,
+                "scheduler_metrics": self._scheduler_metrics,
+            },
         )
         # delete jobs only now
         self.load_storage.maybe_remove_completed_jobs(load_id)
@@ -510,6 +541,14 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             )
 
     def load_single_package(self, load_id: str, schema: Schema) -> None:
+        # jobs are moved only by the loader so we keep them in memory instead of listing package folders
+        self.load_storage.normalized_packages.index_jobs(load_id)
+        try:
+            self._load_single_package(load_id, schema)
+        finally:
+            self.load_storage.normalized_packages.drop_jobs_index(load_id)
+
+    def _load_single_package(self, load_id: str, schema: Schema) -> None:
         new_jobs = self.get_new_jobs_info(load_id)
 
         # get dropped and truncated tables that were added in the extract step if refresh was requested
@@ -563,15 +602,35 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             # collect all unfinished jobs
             running_jobs: List[LoadJob] = self.resume_started_jobs(load_id, schema)
 
+        caps = self.destination.capabilities(
+            self.destination.configuration(self.initial_client_config)
+        )
+        slots = get_available_worker_slots(self.config, caps, [])
+        self._job_queued_at = {}
+        self._queue_wait_times = []
+        started_at = last_check_at = time.time()
+        busy_slot_seconds = 0.0
+
         # loop until all jobs are processed
         pending_exception: Optional[LoadClientJobException] = None
+        # retried jobs are spooled again together, after the run loop sleep duration
+        retry_at: Optional[float] = None
         while True:
             try:
+                now = time.time()
+                busy_slot_seconds += len(running_jobs) * (now - last_check_at)
+                last_check_at = now
+                # jobs that finish from now on will wake up the loop
+                self._job_finished.clear()
                 # we continuously spool new jobs and complete finished ones
+                checked_jobs = running_jobs
                 running_jobs, finalized_jobs, new_pending_exception = self.complete_jobs(
                     load_id, running_jobs, schema
                 )
                 pending_exception = pending_exception or new_pending_exception
+                # jobs that are neither running nor finalized were retried
+                if retry_at is None and len(checked_jobs) > len(running_jobs) + len(finalized_jobs):
+                    retry_at = now + self._run_loop_sleep_duration
 
                 # do not spool new jobs if there was a signal or an exception was encountered
                 # we inform the users how many jobs remain when shutting down, but only if the count of running jobs
@@ -587,7 +646,8 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                             f"Exception for job {pending_exception.job_id} received, draining"
                             f" running jobs.{len(running_jobs)} to go."
                         )
-                else:
+                elif retry_at is None or now >= retry_at:
+                    retry_at = None
                     running_jobs += self.start_new_jobs(load_id, schema, running_jobs)
 
                 if len(running_jobs) == 0:
@@ -595,17 +655,36 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                     # we can raise it now
                     if pending_exception:
                         raise pending_exception
-                    break
-                # this will raise on signal
-                sleep(self._run_loop_sleep_duration)
+                    if retry_at is None:
+                        break
+                # wait until any of the running jobs finishes or retried jobs are due, this will raise on signal
+                sleep_duration = self._run_loop_sleep_duration
+                if retry_at is not None:
+                    sleep_duration = max(0.0, min(sleep_duration, retry_at - now))
+                signals.sleep(sleep_duration, self._job_finished)
             except LoadClientJobFailed:
                 # the package is completed and skipped
+                self._update_scheduler_metrics(slots, started_at, busy_slot_seconds)
                 self.complete_package(load_id, schema, True)
                 raise
 
         # no new jobs, load package done
+        self._update_scheduler_metrics(slots, started_at, busy_slot_seconds)
         self.complete_package(load_id, schema, False)
 
+    def _update_scheduler_metrics(
+        self, slots: int, started_at: float, busy_slot_seconds: float
+    ) -> None:
+        elapsed = time.time() - started_at
+        wait_times = self._queue_wait_times
+        self._scheduler_metrics = LoadSchedulerMetrics(
+            jobs_count=len(wait_times),
+            slots=slots,
+            queue_wait_seconds=sum(wait_times) / len(wait_times) if wait_times else 0.0,
+            max_queue_wait_seconds=max(wait_times, default=0.0),
+            utilization=busy_slot_seconds / (slots * elapsed) if slots and elapsed else 0.0,
+        )
+
     def run(self, pool: Optional[Executor]) -> TRunMetrics:
         # store pool
         self.pool = pool or NullExecutor()
@@ -38,7 +38,7 @@ def get_completed_table_chain(
     # make sure all the jobs for the table chain is completed
     for table in map(
         lambda t: fill_hints_from_parent_and_clone_table(schema.tables, t),
-        get_nested_tables(schema.tables, top_merged_table["name"]),
+        get_nested_tables(schema.tables, top_merged_table["name"], schema.nested_tables),
     ):
         table_jobs = PackageStorage.filter_jobs_for_table(all_jobs, table["name"])
         # skip tables that never seen data
@@ -213,7 +213,7 @@ def _extend_tables_with_table_chain(
         )
         for table in map(
             lambda t: fill_hints_from_parent_and_clone_table(schema.tables, t),
-            get_nested_tables(schema.tables, top_job_table["name"]),
+            get_nested_tables(schema.tables, top_job_table["name"], schema.nested_tables),
         ):
             chain_table_name = table["name"]
             table_has_job = chain_table_name in tables_with_jobs
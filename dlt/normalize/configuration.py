@@ -17,6 +17,8 @@ class ItemsNormalizerConfiguration(BaseConfiguration):
     """When true, items to be normalized will have `_dlt_id` column added with a unique ID for each row."""
     add_dlt_load_id: bool = False
     """When true, items to be normalized will have `_dlt_load_id` column added with the current load ID."""
+    arrow_batches: bool = False
+    """When true, chunks of json items that fit the existing schema are normalized in batches with pyarrow. Applies to json items written to parquet files."""
 
 
 @configspec
@@ -27,6 +29,8 @@ class NormalizeConfiguration(PoolRunnerConfiguration):
     _schema_storage_config: SchemaStorageConfiguration = None
     _normalize_storage_config: NormalizeStorageConfiguration = None
     _load_storage_config: LoadStorageConfiguration = None
+    split_file_min_bytes: Optional[int] = 16 * 1024 * 1024
+    """Extracted json files bigger than this (uncompressed) are split into several work units that are normalized in parallel. Compressed files are decompressed once before splitting. Set to None to disable"""
 
     json_normalizer: ItemsNormalizerConfiguration = ItemsNormalizerConfiguration(
         add_dlt_id=True, add_dlt_load_id=True
@@ -1,4 +1,5 @@
-from typing import List, Dict, Set, Any
+import os
+from typing import IO, Any, Dict, Iterator, List, Set, Tuple
 from abc import abstractmethod
 
 from dlt.common import logger
@@ -14,14 +15,19 @@ from dlt.common.schema.typing import (
     TTableSchemaColumns,
     TSchemaContractDict,
 )
-from dlt.common.schema.utils import dlt_id_column, has_table_seen_data
+from dlt.common.schema.utils import (
+    dlt_id_column,
+    has_table_seen_data,
+    is_complete_column,
+    is_nullable_column,
+)
 from dlt.common.storages import NormalizeStorage
 from dlt.common.storages.data_item_storage import DataItemStorage
 from dlt.common.storages.load_package import ParsedLoadJobFileName
 from dlt.common.typing import DictStrAny, TDataItem
 from dlt.common.schema import TSchemaUpdate, Schema
 from dlt.common.exceptions import MissingDependencyException
-from dlt.common.normalizers.utils import generate_dlt_ids
+from dlt.common.normalizers.utils import generate_dlt_ids, get_nested_row_hashes
 
 from dlt.normalize.configuration import NormalizeConfiguration
 
@@ -192,14 +198,20 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         self,
         extracted_items_file: str,
         root_table_name: str,
+        part: int = 0,
+        parts: int = 1,
     ) -> List[TSchemaUpdate]:
+        """Normalizes items in `extracted_items_file`. If `parts` > 1 only lines that start in the
+        `part`-th of `parts` equal byte ranges of the (uncompressed) file are normalized.
+        """
         schema_updates: List[TSchemaUpdate] = []
         with self.normalize_storage.extracted_packages.storage.open_file(
             extracted_items_file, "rb"
         ) as f:
             # enumerate jsonl file line by line
             line: bytes = None
-            for line_no, line in enumerate(f):
+            lines = _read_lines_part(f, part, parts) if parts > 1 else f
+            for line_no, line in enumerate(lines):
                 items: List[TDataItem] = json.loadb(line)
                 partial_update = self._normalize_chunk(
                     root_table_name, items, may_have_pua(line), skip_write=False
@@ -207,7 +219,7 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                 schema_updates.append(partial_update)
                 logger.debug(f"Processed {line_no+1} lines from file {extracted_items_file}")
             # empty json files are when replace write disposition is used in order to truncate table(s)
-            if line is None and root_table_name in self.schema.tables:
+            if line is None and parts == 1 and root_table_name in self.schema.tables:
                 # TODO: we should push the truncate jobs via package state
                 # not as empty jobs. empty jobs should be reserved for
                 # materializing schemas and other edge cases ie. empty parquet files
@@ -231,6 +243,293 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         return schema_updates
 
 
+def _read_lines_part(f: IO[bytes], part: int, parts: int) -> Iterator[bytes]:
+    """Yields lines of seekable `f` that start in the `part`-th of `parts` equal byte ranges"""
+    size = f.seek(0, os.SEEK_END)
+    start, end = size * part // parts, size * (part + 1) // parts
+    if start > 0:
+        # line started before the range belongs to the previous part
+        f.seek(start - 1)
+        f.readline()
+    else:
+        f.seek(0)
+    while f.tell() < end:
+        line = f.readline()
+        if not line:
+            break
+        yield line
+
+
+class NotArrowBatchable(Exception):
+    """Raised when chunk of json items cannot be normalized in batch and must be normalized row by row"""
+
+
+class ArrowJsonLItemsNormalizer(JsonLItemsNormalizer):
+    """Normalizes chunks of json items in batches with pyarrow. Chunks are converted into struct arrays,
+    nested dicts are flattened as struct columns and lists are exploded into nested tables with pyarrow
+    compute. Row ids of nested tables are hashed in python, batched per nested table, as pyarrow has no
+    digest kernel. Resulting arrow tables are passed to the parquet writer.
+
+    Only chunks that fit the existing schema are batched. Chunks that would add tables or columns,
+    create variants, hit schema contract or exclude filters, contain custom encoded values or cannot
+    be represented in arrow are normalized row by row with `JsonLItemsNormalizer`.
+    """
+
+    def __init__(
+        self,
+        item_storage: DataItemStorage,
+        normalize_storage: NormalizeStorage,
+        schema: Schema,
+        load_id: str,
+        config: NormalizeConfiguration,
+    ) -> None:
+        super().__init__(item_storage, normalize_storage, schema, load_id, config)
+        self.arrow_chunks_count = 0
+        self.row_chunks_count = 0
+
+    def _normalize_chunk(
+        self, root_table_name: str, items: List[TDataItem], may_have_pua: bool, skip_write: bool
+    ) -> TSchemaUpdate:
+        if not skip_write and not may_have_pua:
+            try:
+                tables = self._normalize_chunk_arrow(root_table_name, items)
+            except NotArrowBatchable as ex:
+                logger.debug(
+                    f"Chunk with {len(items)} items of table {root_table_name} will be normalized"
+                    f" row by row: {ex}"
+                )
+            else:
+                self._write_tables(tables)
+                self.arrow_chunks_count += 1
+                return {}
+        self.row_chunks_count += 1
+        return super()._normalize_chunk(root_table_name, items, may_have_pua, skip_write)
+
+    def _write_tables(self, tables: Dict[str, Dict[str, Any]]) -> None:
+        schema = self.schema
+        for table_name, arrays in tables.items():
+            columns = self._column_schemas.get(table_name)
+            if not columns:
+                columns = self._column_schemas[table_name] = schema.get_table_columns(table_name)
+            self.item_storage.write_data_item(
+                self.load_id, schema.name, table_name, pa.Table.from_pydict(arrays), columns
+            )
+
+    def _normalize_chunk_arrow(
+        self, root_table_name: str, items: List[TDataItem]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Normalizes `items` into dictionary of table name -> normalized column name -> arrow array. Raises
+        NotArrowBatchable if any of the tables, columns or values does not fit the schema"""
+        schema = self.schema
+        data_normalizer = schema.data_item_normalizer
+        if not isinstance(data_normalizer, RelationalNormalizer):
+            raise NotArrowBatchable("only relational normalizer is supported")
+        if schema._compiled_excludes:
+            raise NotArrowBatchable("schema has exclude filters")
+        if self._filtered_tables or self._filtered_tables_columns:
+            raise NotArrowBatchable("schema contract filters tables or columns")
+        root_table_name = data_normalizer._normalize_table_identifier(
+            schema.naming, root_table_name
+        )
+        if root_table_name not in schema.tables:
+            raise NotArrowBatchable(f"table {root_table_name} is new")
+        if data_normalizer._get_root_row_id_type(schema, root_table_name) != "random":
+            raise NotArrowBatchable("root table requires row hash")
+        propagation = data_normalizer.propagation_config or {}
+        propagated_tables = propagation.get("tables") or {}
+        if set(propagated_tables.keys()) - {root_table_name}:
+            raise NotArrowBatchable("values are propagated from nested tables")
+
+        try:
+            arrays = self._items_to_arrays(items)
+        except (pa.ArrowException, OverflowError, TypeError, ValueError) as ex:
+            raise NotArrowBatchable(f"items cannot be converted to arrow: {ex}")
+        num_rows = len(items)
+        r_lvl = data_normalizer._get_table_nesting_level(
+            schema, root_table_name, data_normalizer.max_nesting
+        )
+        columns, lists = self._flatten_arrays(root_table_name, arrays, r_lvl)
+        if data_normalizer.c_dlt_id in columns:
+            raise NotArrowBatchable("items contain row ids")
+        columns[data_normalizer.c_dlt_load_id] = pa.repeat(self.load_id, num_rows)
+        row_ids = pa.array(generate_dlt_ids(num_rows))
+        columns[data_normalizer.c_dlt_id] = row_ids
+
+        # values propagated from root table to all nested tables
+        mappings = dict(propagation.get("root") or {})
+        mappings.update(propagated_tables.get(root_table_name) or {})
+        extend: Dict[str, Any] = {
+            prop_as: columns[prop_from]
+            for prop_from, prop_as in mappings.items()
+            if prop_from in columns
+        }
+
+        tables = {root_table_name: self._verify_columns(root_table_name, columns)}
+        root_idx = pa.array(range(num_rows), pa.int64())
+        for list_path, list_array in lists.items():
+            self._normalize_list(
+                list_array,
+                list_path,
+                (root_table_name,),
+                row_ids,
+                root_idx,
+                extend,
+                r_lvl - 1,
+                tables,
+            )
+        return tables
+
+    @staticmethod
+    def _items_to_arrays(items: List[TDataItem]) -> Dict[str, Any]:
+        # pyarrow infers struct fields from keys of all items
+        array = pa.array(items)
+        if not pa.types.is_struct(array.type) or array.null_count > 0:
+            raise NotArrowBatchable("only dict items are supported")
+        return {array.type.field(idx).name: child for idx, child in enumerate(array.flatten())}
+
+    def _flatten_arrays(
+        self, table_name: str, arrays: Dict[str, Any], r_lvl: int
+    ) -> Tuple[Dict[str, Any], Dict[Tuple[str, ...], Any]]:
+        """Flattens struct arrays like `RelationalNormalizer._flatten` flattens dicts. Returns columns with
+        normalized names and list arrays that will become nested tables"""
+        schema = self.schema
+        data_normalizer: RelationalNormalizer = schema.data_item_normalizer  # type: ignore[assignment]
+        naming = schema.naming
+        columns: Dict[str, Any] = {}
+        lists: Dict[Tuple[str, ...], Any] = {}
+
+        def _flatten(arrays_: Dict[str, Any], r_lvl_: int, path: Tuple[str, ...]) -> None:
+            for key, array in arrays_.items():
+                norm_k, nested_name = data_normalizer._normalize_path_fragment(naming, path, key)
+                array_type = array.type
+                is_struct = pa.types.is_struct(array_type)
+                if is_struct or pa.types.is_list(array_type) or pa.types.is_large_list(array_type):
+                    if data_normalizer._is_nested_type(schema, table_name, nested_name, r_lvl_):
+                        raise NotArrowBatchable(f"{nested_name} in table {table_name} is json")
+                    if is_struct:
+                        _flatten(
+                            {
+                                array_type.field(idx).name: child
+                                for idx, child in enumerate(array.flatten())
+                            },
+                            r_lvl_ - 1,
+                            path + (norm_k,),
+                        )
+                    else:
+                        lists[
+                            path + (data_normalizer._normalize_table_identifier(naming, key),)
+                        ] = array
+                    continue
+                if nested_name in columns:
+                    raise NotArrowBatchable(f"{nested_name} in table {table_name} collides")
+                columns[nested_name] = array
+
+        _flatten(arrays, r_lvl, ())
+        return columns, lists
+
+    def _normalize_list(
+        self,
+        list_array: Any,
+        ident_path: Tuple[str, ...],
+        parent_path: Tuple[str, ...],
+        parent_row_ids: Any,
+        root_idx: Any,
+        extend: Dict[str, Any],
+        r_lvl: int,
+        tables: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Explodes `list_array` into nested table like `RelationalNormalizer._normalize_list`"""
+        schema = self.schema
+        data_normalizer: RelationalNormalizer = schema.data_item_normalizer  # type: ignore[assignment]
+        table_name = data_normalizer._shorten_fragments(schema.naming, *parent_path, *ident_path)
+        values = pa.compute.list_flatten(list_array)
+        if len(values) == 0:
+            return
+        if values.null_count > 0:
+            raise NotArrowBatchable(f"list elements of {table_name} contain nulls")
+        if table_name in tables:
+            raise NotArrowBatchable(f"table {table_name} collides")
+        if data_normalizer._get_nested_row_id_type(schema, table_name) != ("row_hash", True):
+            raise NotArrowBatchable(f"nested table {table_name} does not link to parent")
+
+        # compute parent row and position in the list for each element
+        parent_idx = pa.compute.list_parent_indices(list_array)
+        lengths = pa.compute.fill_null(pa.compute.list_value_length(list_array), 0).cast(pa.int64())
+        starts = pa.compute.subtract(pa.compute.cumulative_sum(lengths), lengths)
+        list_idx = pa.compute.subtract(
+            pa.array(range(len(values)), pa.int64()), starts.take(parent_idx)
+        )
+        row_parent_ids = parent_row_ids.take(parent_idx)
+        row_root_idx = root_idx.take(parent_idx)
+        row_ids = pa.array(
+            get_nested_row_hashes(row_parent_ids.to_pylist(), table_name, list_idx.to_pylist())
+        )
+
+        values_type = values.type
+        if pa.types.is_struct(values_type):
+            columns, lists = self._flatten_arrays(
+                table_name,
+                {values_type.field(idx).name: child for idx, child in enumerate(values.flatten())},
+                r_lvl,
+            )
+            if data_normalizer.c_dlt_id in columns:
+                raise NotArrowBatchable(f"nested table {table_name} contains row ids")
+        elif pa.types.is_list(values_type) or pa.types.is_large_list(values_type):
+            raise NotArrowBatchable(f"{table_name} contains lists of lists")
+        else:
+            columns, lists = {data_normalizer.c_value: values}, {}
+        for prop_as, prop_array in extend.items():
+            columns[prop_as] = prop_array.take(row_root_idx)
+        columns[data_normalizer.c_dlt_parent_id] = row_parent_ids
+        columns[data_normalizer.c_dlt_list_idx] = list_idx
+        columns[data_normalizer.c_dlt_id] = row_ids
+        tables[table_name] = self._verify_columns(table_name, columns)
+
+        for list_path, nested_list_array in lists.items():
+            self._normalize_list(
+                nested_list_array,
+                list_path,
+                parent_path + ident_path,
+                row_ids,
+                row_root_idx,
+                extend,
+                r_lvl - 1,
+                tables,
+            )
+
+    def _verify_columns(self, table_name: str, columns: Dict[str, Any]) -> Dict[str, Any]:
+        """Checks if `columns` fit existing table schema without coercion. Drops columns with all nulls"""
+        table = self.schema.tables.get(table_name)
+        if not table:
+            raise NotArrowBatchable(f"table {table_name} is new")
+        table_columns = table["columns"]
+        verified: Dict[str, Any] = {}
+        for name, array in columns.items():
+            column = table_columns.get(name)
+            has_values = array.null_count < len(array)
+            if column is None:
+                if has_values:
+                    raise NotArrowBatchable(f"column {name} in table {table_name} is new")
+                continue
+            if array.null_count > 0 and not is_nullable_column(column):
+                raise NotArrowBatchable(f"column {name} in table {table_name} is not nullable")
+            if not has_values:
+                continue
+            if not is_complete_column(column):
+                raise NotArrowBatchable(f"column {name} in table {table_name} is incomplete")
+            try:
+                data_type = pyarrow.get_column_type_from_py_arrow(array.type)["data_type"]
+            except ValueError:
+                data_type = None
+            if data_type != column["data_type"]:
+                raise NotArrowBatchable(
+                    f"column {name} in table {table_name} requires coercion to"
+                    f" {column['data_type']}"
+                )
+            verified[name] = array
+        return verified
+
+
 class ArrowItemsNormalizer(ItemsNormalizer):
     REWRITE_ROW_GROUPS = 1
 
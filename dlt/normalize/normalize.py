@@ -1,11 +1,11 @@
 import os
 import itertools
-from typing import List, Dict, Sequence, Optional, Callable
-from concurrent.futures import Future, Executor
+from collections import deque
+from typing import Deque, List, Dict, Sequence, Optional, Callable
+from concurrent.futures import Future, Executor, wait, FIRST_COMPLETED
 
 from dlt.common import logger
-from dlt.common.metrics import DataWriterMetrics
-from dlt.common.runtime.signals import sleep
+from dlt.common.metrics import DataWriterMetrics, NormalizeWorkerMetrics
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.data_writers.writers import EMPTY_DATA_WRITER_METRICS
@@ -30,10 +30,18 @@ from dlt.common.pipeline import (
 )
 from dlt.common.storages.exceptions import LoadPackageNotFound
 from dlt.common.storages.load_package import LoadPackageInfo
+from dlt.common.time import precise_time
 
 from dlt.normalize.configuration import NormalizeConfiguration
 from dlt.normalize.exceptions import NormalizeJobFailed
-from dlt.normalize.worker import w_normalize_files, group_worker_files, TWorkerRV
+from dlt.normalize.worker import (
+    w_normalize_files,
+    decompress_split_files,
+    split_worker_files,
+    take_worker_units,
+    TWorkerRV,
+    TWorkUnit,
+)
 from dlt.normalize.validate import verify_normalized_table
 
 
@@ -92,64 +100,72 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
 
     def map_parallel(self, schema: Schema, load_id: str, files: Sequence[str]) -> TWorkerRV:
         workers: int = getattr(self.pool, "_max_workers", 1)
-        chunk_files = group_worker_files(files, workers)
+        extracted_storage = self.normalize_storage.extracted_packages.storage
+        file_sizes = decompress_split_files(
+            extracted_storage, files, workers, self.config.split_file_min_bytes
+        )
+        units: Deque[TWorkUnit] = deque(
+            split_worker_files(files, file_sizes, workers, self.config.split_file_min_bytes)
+        )
+        # full schema is sent once per package, later tasks receive updates collected since then
         schema_dict: TStoredSchema = schema.to_dict()
-        param_chunk = [
-            (
+        schema_updates: List[TSchemaUpdate] = []
+        # return stats
+        summary = TWorkerRV([], [], [])
+        tasks: Dict[Future[TWorkerRV], Sequence[TWorkUnit]] = {}
+
+        def _submit(task_units: Sequence[TWorkUnit]) -> None:
+            pending: Future[TWorkerRV] = self.pool.submit(
+                w_normalize_files,
                 self.config,
                 self.normalize_storage.config,
                 self.load_storage.config,
                 schema_dict,
                 load_id,
-                files,
+                task_units,
+                list(schema_updates),
             )
-            for files in chunk_files
-        ]
-        # return stats
-        summary = TWorkerRV([], [])
-        # push all tasks to queue
-        tasks = [(self.pool.submit(w_normalize_files, *params), params) for params in param_chunk]
+            tasks[pending] = task_units
 
-        while len(tasks) > 0:
-            sleep(0.3)
-            # operate on copy of the list
-            for task in list(tasks):
-                pending, params = task
-                if pending.done():
-                    # collect metrics from the exception (if any)
-                    if isinstance(pending.exception(), NormalizeJobFailed):
-                        summary.file_metrics.extend(pending.exception().writer_metrics)  # type: ignore[attr-defined]
-                    # Exception in task (if any) is raised here
-                    result: TWorkerRV = pending.result()
-                    try:
-                        # gather schema from all manifests, validate consistency and combine
-                        self.update_schema(schema, result[0])
-                        summary.schema_updates.extend(result.schema_updates)
-                        summary.file_metrics.extend(result.file_metrics)
-                        # update metrics
-                        self.collector.update("Files", len(result.file_metrics))
-                        self.collector.update(
-                            "Items", sum(result.file_metrics, EMPTY_DATA_WRITER_METRICS).items_count
-                        )
-                    except CannotCoerceColumnException as exc:
-                        # schema conflicts resulting from parallel executing
-                        logger.warning(
-                            f"Parallel schema update conflict, retrying task ({str(exc)}"
-                        )
-                        # delete all files produced by the task
-                        for metrics in result.file_metrics:
-                            os.remove(metrics.file_path)
-                        # schedule the task again
-                        schema_dict = schema.to_dict()
-                        # TODO: it's time for a named tuple
-                        params = params[:3] + (schema_dict,) + params[4:]
-                        retry_pending: Future[TWorkerRV] = self.pool.submit(
-                            w_normalize_files, *params
-                        )
-                        tasks.append((retry_pending, params))
-                    # remove finished tasks
-                    tasks.remove(task)
-                logger.debug(f"{len(tasks)} tasks still remaining for {load_id}...")
+        while units or tasks:
+            # hand out units to idle workers
+            while units and len(tasks) < workers:
+                _submit(take_worker_units(units, workers))
+            # wake up as soon as any of the workers completes
+            done, _ = wait(tasks, timeout=1.0, return_when=FIRST_COMPLETED)
+            signals.raise_if_signalled()
+            for pending in done:
+                task_units = tasks.pop(pending)
+                # collect metrics from the exception (if any)
+                if isinstance(pending.exception(), NormalizeJobFailed):
+                    summary.file_metrics.extend(pending.exception().writer_metrics)  # type: ignore[attr-defined]
+                # Exception in task (if any) is raised here
+                result: TWorkerRV = pending.result()
+                try:
+                    # gather schema from all manifests, validate consistency and combine
+                    self.update_schema(schema, result.schema_updates)
+                    schema_updates.extend(result.schema_updates)
+                    summary.schema_updates.extend(result.schema_updates)
+                    summary.file_metrics.extend(result.file_metrics)
+                    summary.worker_metrics.extend(result.worker_metrics)
+                    # update metrics
+                    self.collector.update("Files", len(result.file_metrics))
+                    self.collector.update(
+                        "Items", sum(result.file_metrics, EMPTY_DATA_WRITER_METRICS).items_count
+                    )
+                except CannotCoerceColumnException as exc:
+                    # schema conflicts resulting from parallel executing
+                    logger.warning(f"Parallel schema update conflict, retrying task ({str(exc)}")
+                    # delete all files produced by the task
+                    for metrics in result.file_metrics:
+                        os.remove(metrics.file_path)
+                    # schedule the task again with current schema
+                    schema_dict = schema.to_dict()
+                    schema_updates.clear()
+                    _submit(task_units)
+            logger.debug(
+                f"{len(tasks)} tasks running and {len(units)} work units remaining for {load_id}..."
+            )
 
         return summary
 
@@ -160,7 +176,7 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
             self.load_storage.config,
             schema.to_dict(),
             load_id,
-            files,
+            [TWorkUnit(file) for file in files],
         )
         self.update_schema(schema, result.schema_updates)
         self.collector.update("Files", len(result.file_metrics))
@@ -173,7 +189,9 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
         self, load_id: str, schema: Schema, map_f: TMapFuncType, files: Sequence[str]
     ) -> None:
         # process files in parallel or in single thread, depending on map_f
-        schema_updates, writer_metrics = map_f(schema, load_id, files)
+        started_at = precise_time()
+        schema_updates, writer_metrics, tasks_metrics = map_f(schema, load_id, files)
+        elapsed = precise_time() - started_at
         # compute metrics
         job_metrics = {ParsedLoadJobFileName.parse(m.file_path): m for m in writer_metrics}
         table_metrics: Dict[str, DataWriterMetrics] = {
@@ -182,6 +200,19 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
                 job_metrics.items(), lambda pair: pair[0].table_name
             )
         }
+        # aggregate tasks by worker
+        worker_metrics: Dict[str, NormalizeWorkerMetrics] = {}
+        for task_metrics in tasks_metrics:
+            units_count, busy_seconds = task_metrics.units_count, task_metrics.busy_seconds
+            if prev_metrics := worker_metrics.get(task_metrics.worker_id):
+                units_count += prev_metrics.units_count
+                busy_seconds += prev_metrics.busy_seconds
+            worker_metrics[task_metrics.worker_id] = NormalizeWorkerMetrics(
+                task_metrics.worker_id,
+                units_count,
+                busy_seconds,
+                min(busy_seconds / elapsed, 1.0) if elapsed > 0 else 1.0,
+            )
         # update normalizer specific info
         for table_name in table_metrics:
             table = schema.tables[table_name]
@@ -227,6 +258,7 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
                 "finished_at": None,
                 "job_metrics": {job.job_id(): metrics for job, metrics in job_metrics.items()},
                 "table_metrics": table_metrics,
+                "worker_metrics": worker_metrics,
             },
         )
 
@@ -1,4 +1,8 @@
-from typing import Callable, List, Dict, NamedTuple, Sequence, Set, Optional, Type
+import os
+import gzip
+import math
+import shutil
+from typing import Callable, Deque, List, Dict, NamedTuple, Sequence, Set, Optional, Type
 
 from dlt.common import logger
 from dlt.common.configuration.container import Container
@@ -9,10 +13,12 @@ from dlt.common.data_writers import (
     get_best_writer_spec,
     is_native_writer,
 )
-from dlt.common.metrics import DataWriterMetrics
-from dlt.common.utils import chunks
+from dlt.common.data_writers.writers import ParquetDataWriter
+from dlt.common.metrics import DataWriterMetrics, NormalizeWorkerMetrics
+from dlt.common.time import precise_time
 from dlt.common.schema.typing import TStoredSchema, TTableSchema
 from dlt.common.storages import (
+    FileStorage,
     NormalizeStorage,
     LoadStorage,
     LoadStorageConfiguration,
@@ -25,6 +31,7 @@ from dlt.normalize.configuration import NormalizeConfiguration
 from dlt.normalize.exceptions import NormalizeJobFailed
 from dlt.normalize.items_normalizers import (
     ArrowItemsNormalizer,
+    ArrowJsonLItemsNormalizer,
     FileImportNormalizer,
     JsonLItemsNormalizer,
     ItemsNormalizer,
@@ -34,24 +41,90 @@ from dlt.normalize.items_normalizers import (
 class TWorkerRV(NamedTuple):
     schema_updates: List[TSchemaUpdate]
     file_metrics: List[DataWriterMetrics]
+    worker_metrics: List[NormalizeWorkerMetrics]
 
 
-def group_worker_files(files: Sequence[str], no_groups: int) -> List[Sequence[str]]:
-    # sort files so the same tables are in the same worker
-    files = list(sorted(files))
+class TWorkUnit(NamedTuple):
+    """Extracted items file or its part made of lines that start in the `part`-th of `parts` equal byte ranges"""
 
-    chunk_size = max(len(files) // no_groups, 1)
-    chunk_files = list(chunks(files, chunk_size))
-    # distribute the remainder files to existing groups starting from the end
-    remainder_l = len(chunk_files) - no_groups
-    l_idx = 0
-    while remainder_l > 0:
-        idx = 0
-        for idx, file in enumerate(reversed(chunk_files.pop())):
-            chunk_files[-l_idx - idx - remainder_l].append(file)  # type: ignore
-        remainder_l -= 1
-        l_idx = idx + 1
-    return chunk_files
+    file: str
+    part: int = 0
+    parts: int = 1
+
+
+def _is_splittable(file: str, no_workers: int, split_file_min_bytes: Optional[int]) -> bool:
+    # only json lines may be split, each line holds a chunk of items
+    file_format = ParsedLoadJobFileName.parse(file).file_format
+    return (
+        bool(split_file_min_bytes)
+        and no_workers > 1
+        and DataWriter.item_format_from_file_extension(file_format) == "object"
+    )
+
+
+def _gzip_uncompressed_size(path: str) -> int:
+    """Estimates uncompressed size from the gzip trailer which keeps it modulo 4 GB"""
+    compressed_size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        f.seek(-4, os.SEEK_END)
+        size = int.from_bytes(f.read(4), "little")
+    while size < compressed_size:
+        size += 2**32
+    return size
+
+
+def decompress_split_files(
+    storage: FileStorage,
+    files: Sequence[str],
+    no_workers: int,
+    split_file_min_bytes: Optional[int],
+) -> List[int]:
+    """Decompresses in place gzipped json `files` that are big enough to be split, so workers may seek to
+    their parts. Returns sizes of `files` as they are stored after decompression.
+    """
+    file_sizes: List[int] = []
+    for file in files:
+        path = storage.make_full_path(file)
+        if (
+            _is_splittable(file, no_workers, split_file_min_bytes)
+            and FileStorage.is_gzipped(path)
+            and _gzip_uncompressed_size(path) > split_file_min_bytes
+        ):
+            # readers open compressed and uncompressed files transparently
+            with gzip.open(path, "rb") as f_in, open(path + ".tmp", "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+            os.replace(path + ".tmp", path)
+        file_sizes.append(os.path.getsize(path))
+    return file_sizes
+
+
+def split_worker_files(
+    files: Sequence[str],
+    file_sizes: Sequence[int],
+    no_workers: int,
+    split_file_min_bytes: Optional[int],
+) -> List[TWorkUnit]:
+    """Creates work units from extracted `files`. Json files bigger than `split_file_min_bytes` are split
+    into up to `no_workers` parts. Files must not be compressed (see `decompress_split_files`). Units are
+    sorted so the same tables stay together and parts of the same file are far apart.
+    """
+    units: List[TWorkUnit] = []
+    for file, file_size in zip(files, file_sizes):
+        parts = 1
+        if file_size > (split_file_min_bytes or 0) and _is_splittable(
+            file, no_workers, split_file_min_bytes
+        ):
+            parts = min(no_workers, math.ceil(file_size / split_file_min_bytes))
+        units.extend(TWorkUnit(file, part, parts) for part in range(parts))
+    return sorted(units, key=lambda unit: (unit.part, unit.file))
+
+
+def take_worker_units(units: Deque[TWorkUnit], no_workers: int) -> List[TWorkUnit]:
+    """Takes a batch of units for an idle worker. Batches get smaller as the queue drains so
+    all workers finish at roughly the same time.
+    """
+    batch_size = math.ceil(len(units) / no_workers)
+    return [units.popleft() for _ in range(batch_size)]
 
 
 def w_normalize_files(
@@ -60,8 +133,10 @@ def w_normalize_files(
     loader_storage_config: LoadStorageConfiguration,
     stored_schema: TStoredSchema,
     load_id: str,
-    extracted_items_files: Sequence[str],
+    work_units: Sequence[TWorkUnit],
+    stored_schema_updates: Sequence[TSchemaUpdate] = (),
 ) -> TWorkerRV:
+    started_at = precise_time()
     destination_caps = config.destination_capabilities
     schema_updates: List[TSchemaUpdate] = []
     # normalizers are cached per table name
@@ -77,6 +152,11 @@ def w_normalize_files(
     # process all files with data items and write to buffered item storage
     with Container().injectable_context(destination_caps):
         schema = Schema.from_stored_schema(stored_schema)
+        # apply schema updates that were collected since `stored_schema` was created
+        for schema_update in stored_schema_updates:
+            for partial_tables in schema_update.values():
+                for partial_table in partial_tables:
+                    schema.update_table(partial_table, normalize_identifiers=False)
         normalize_storage = NormalizeStorage(False, normalize_storage_config)
         load_storage = LoadStorage(False, supported_file_formats, loader_storage_config)
 
@@ -140,9 +220,15 @@ def w_normalize_files(
                     )
 
             if best_writer_spec is None:
+                # some formats are used only when requested explicitly
+                possible_file_formats = [
+                    supported_format
+                    for supported_format in items_supported_file_formats
+                    if supported_format not in (destination_caps.explicit_loader_file_formats or ())
+                ] or items_supported_file_formats
                 # find best spec among possible formats taking into account destination preference
                 best_writer_spec = resolve_best_writer_spec(
-                    item_format, items_supported_file_formats, items_preferred_file_format
+                    item_format, possible_file_formats, items_preferred_file_format
                 )
                 # if best_writer_spec.file_format != preferred_file_format:
                 #     logger.warning(
@@ -163,7 +249,13 @@ def w_normalize_files(
             if item_format == "arrow":
                 cls = ArrowItemsNormalizer
             elif item_format == "object":
-                cls = JsonLItemsNormalizer
+                if config.json_normalizer.arrow_batches and issubclass(
+                    item_storage.writer_cls, ParquetDataWriter
+                ):
+                    # parquet writer accepts arrow tables produced by arrow batches normalizer
+                    cls = ArrowJsonLItemsNormalizer
+                else:
+                    cls = JsonLItemsNormalizer
             else:
                 cls = FileImportNormalizer
             logger.info(
@@ -214,7 +306,7 @@ def w_normalize_files(
         parsed_file_name: ParsedLoadJobFileName = None
         try:
             root_tables: Set[str] = set()
-            for extracted_items_file in extracted_items_files:
+            for extracted_items_file, part, parts in work_units:
                 parsed_file_name = ParsedLoadJobFileName.parse(extracted_items_file)
                 # normalize table name in case the normalization changed
                 # NOTE: this is the best we can do, until a full lineage information is in the schema
@@ -222,7 +314,7 @@ def w_normalize_files(
                     parsed_file_name.table_name
                 )
                 root_tables.add(root_table_name)
-                root_table = stored_schema["tables"].get(root_table_name, {"name": root_table_name})
+                root_table = schema.tables.get(root_table_name, {"name": root_table_name})
                 normalizer = _get_items_normalizer(
                     parsed_file_name,
                     root_table,
@@ -231,7 +323,14 @@ def w_normalize_files(
                     f"Processing extracted items in {extracted_items_file} in load_id"
                     f" {load_id} with table name {root_table_name} and schema {schema.name}"
                 )
-                partial_updates = normalizer(extracted_items_file, root_table_name)
+                if parts > 1:
+                    # only json files are split
+                    assert isinstance(normalizer, JsonLItemsNormalizer)
+                    partial_updates = normalizer(
+                        extracted_items_file, root_table_name, part=part, parts=parts
+                    )
+                else:
+                    partial_updates = normalizer(extracted_items_file, root_table_name)
                 schema_updates.extend(partial_updates)
                 logger.debug(f"Processed file {extracted_items_file}")
         except Exception as exc:
@@ -241,5 +340,8 @@ def w_normalize_files(
         else:
             writer_metrics = _gather_metrics_and_close(parsed_file_name, in_exception=False)
 
-        logger.info(f"Processed all items in {len(extracted_items_files)} files")
-        return TWorkerRV(schema_updates, writer_metrics)
+        logger.info(f"Processed all items in {len(work_units)} work units")
+        worker_metrics = NormalizeWorkerMetrics(
+            str(os.getpid()), len(work_units), precise_time() - started_at, 0.0
+        )
+        return TWorkerRV(schema_updates, writer_metrics, [worker_metrics])
@@ -34,6 +34,8 @@ class PipelineConfiguration(BaseConfiguration):
     dev_mode: bool = False
     """When set to True, each instance of the pipeline with the `pipeline_name` starts from scratch when run and loads the data to a separate dataset."""
     progress: Optional[str] = None
+    overlap_normalize_and_load: bool = False
+    """Enables the `run` method to load normalized packages while next packages are still being normalized. Helps only when several packages are processed ie. from a list of sources or pending packages"""
     runtime: RuntimeConfiguration = None
     refresh: Optional[TRefreshMode] = None
     """Refresh mode for the pipeline to fully or partially reset a source during run. See docstring of `dlt.pipeline` for more details."""
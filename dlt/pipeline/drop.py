@@ -129,7 +129,12 @@ def drop_resources(
         # (1) Don't remove _dlt tables (2) Drop all selected tables from the schema
         # (3) Mark tables that seen data to be dropped in destination
         data_tables = {t["name"]: t for t in schema.data_tables(include_incomplete=True)}
-        resource_tables = group_tables_by_resource(data_tables, pattern=resource_pattern)
+        resource_tables = group_tables_by_resource(
+            data_tables,
+            pattern=resource_pattern,
+            nested_tables=schema.nested_tables,
+            resource_tables=schema.resource_tables,
+        )
         resource_names = list(resource_tables.keys())
         tables_to_drop_from_schema = list(chain.from_iterable(resource_tables.values()))
         tables_to_drop_from_schema.reverse()
@@ -1,5 +1,7 @@
 import contextlib
 import os
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from copy import deepcopy, copy
 from functools import wraps
@@ -48,7 +50,7 @@ from dlt.common.schema.typing import (
 from dlt.common.schema.utils import normalize_schema_name
 from dlt.common.storages.exceptions import LoadPackageNotFound
 from dlt.common.typing import ConfigValue, TFun, TSecretStrValue, is_optional_type
-from dlt.common.runners import pool_runner as runner
+from dlt.common.runners import pool_runner as runner, TRunMetrics
 from dlt.common.storages import (
     LiveSchemaStorage,
     NormalizeStorage,
@@ -361,6 +363,7 @@ class Pipeline(SupportsPipeline):
         self._trace: PipelineTrace = None
         self._last_trace: PipelineTrace = None
         self._state_restored: bool = False
+        self._background_load: Tuple[Load, "Future[int]", Tuple[int, bool]] = None
 
         # initialize pipeline working dir
         self._init_working_dir(pipeline_name, pipelines_dir)
@@ -586,25 +589,27 @@ class Pipeline(SupportsPipeline):
         if not self.default_schema_name:
             return None
 
-        # make sure that destination is set and client is importable and can be instantiated
-        client, staging_client = self._get_destination_clients()
-
-        # create default loader config and the loader
-        load_config = LoaderConfiguration(
-            workers=workers,
-            raise_on_failed_jobs=raise_on_failed_jobs,
-            _load_storage_config=self._load_storage_config(),
-        )
-        load_step: Load = Load(
-            self._destination,
-            staging_destination=self._staging,
-            collector=self.collector,
-            is_storage_owner=False,
-            config=load_config,
-            initial_client_config=client.config,
-            initial_staging_client_config=staging_client.config if staging_client else None,
-        )
+        background_load: "Future[int]" = None
+        if self._background_load:
+            # continue the load step that was loading packages while normalizing
+            load_step, background_load, load_args = self._background_load
+            self._background_load = None
+            if (workers, raise_on_failed_jobs) != load_args:
+                # do not leave the background thread running, it loads all normalized packages
+                if load_ex := background_load.exception():
+                    logger.error(f"Loading packages while normalizing failed: {load_ex}")
+                raise ValueError(
+                    f"Packages were loaded with workers={load_args[0]} and"
+                    f" raise_on_failed_jobs={load_args[1]} while normalizing. The load method"
+                    " must be called with the same arguments."
+                )
+            load_step.collector = self.collector
+        else:
+            load_step = self._create_load_step(workers, raise_on_failed_jobs)
         try:
+            if background_load:
+                # wait for packages loaded in the background and re-raise its exception
+                background_load.result()
             with signals.delayed_signals():
                 runner.run_pool(load_step.config, load_step)
             info: LoadInfo = self._get_step_info(load_step)
@@ -720,8 +725,9 @@ class Pipeline(SupportsPipeline):
             self._state_restored = True
         # normalize and load pending data
         if self.list_extracted_load_packages():
-            self.normalize(loader_file_format=loader_file_format)
-        if self.list_normalized_load_packages():
+            with self._load_while_normalizing():
+                self.normalize(loader_file_format=loader_file_format)
+        if self.list_normalized_load_packages() or self._background_load:
             # if there were any pending loads, load them and **exit**
             if data is not None:
                 logger.warn(
@@ -744,7 +750,8 @@ class Pipeline(SupportsPipeline):
                 schema_contract=schema_contract,
                 refresh=refresh or self.refresh,
             )
-            self.normalize(loader_file_format=loader_file_format)
+            with self._load_while_normalizing():
+                self.normalize(loader_file_format=loader_file_format)
             return self.load(destination, dataset_name, credentials=credentials)
         else:
             return None
@@ -1251,6 +1258,75 @@ class Pipeline(SupportsPipeline):
 
         return load_id
 
+    @with_config_section((known_sections.LOAD,))
+    def _create_load_step(
+        self, workers: int = 20, raise_on_failed_jobs: bool = ConfigValue
+    ) -> Load:
+        # make sure that destination is set and client is importable and can be instantiated
+        client, staging_client = self._get_destination_clients()
+
+        # create default loader config and the loader
+        load_config = LoaderConfiguration(
+            workers=workers,
+            raise_on_failed_jobs=raise_on_failed_jobs,
+            _load_storage_config=self._load_storage_config(),
+        )
+        return Load(
+            self._destination,
+            staging_destination=self._staging,
+            collector=self.collector,
+            is_storage_owner=False,
+            config=load_config,
+            initial_client_config=client.config,
+            initial_staging_client_config=staging_client.config if staging_client else None,
+        )
+
+    @contextmanager
+    def _load_while_normalizing(
+        self, workers: int = 20, raise_on_failed_jobs: bool = ConfigValue
+    ) -> Iterator[None]:
+        """Loads packages in a background thread as soon as `normalize` commits them, if enabled in config.
+
+        Packages are still loaded one by one and in order. The started load step is passed to the `load`
+        method which waits for it to complete and must be called with the same `workers` and
+        `raise_on_failed_jobs`. Extraction is not overlapped: pipeline state is committed with the
+        extracted packages so they may be processed only when `extract` completes.
+        """
+        if not self.config.overlap_normalize_and_load or not self.default_schema_name:
+            yield
+            return
+
+        load_step = self._create_load_step(workers, raise_on_failed_jobs)
+        # only progress of normalize is displayed when steps overlap
+        load_step.collector = _NULL_COLLECTOR
+        normalize_done = threading.Event()
+
+        def _load_until_normalized(pool: Executor) -> TRunMetrics:
+            is_last_run = normalize_done.is_set()
+            metrics = load_step.run(pool)
+            if is_last_run:
+                return metrics
+            # keep polling for packages until normalize completes
+            return TRunMetrics(metrics.was_idle, max(metrics.pending_items, 1))
+
+        # pool prefix makes the thread use contexts injected in this thread
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=Container.thread_pool_prefix()
+        )
+        background_load = executor.submit(runner.run_pool, load_step.config, _load_until_normalized)
+        try:
+            yield
+        except Exception:
+            normalize_done.set()
+            # packages normalized so far are fully loaded before the exception is raised
+            if load_ex := background_load.exception():
+                logger.error(f"Loading packages while normalizing failed: {load_ex}")
+            raise
+        finally:
+            normalize_done.set()
+            executor.shutdown(wait=False)
+        self._background_load = (load_step, background_load, (workers, raise_on_failed_jobs))
+
     def _get_destination_clients(
         self,
         schema: Schema = None,
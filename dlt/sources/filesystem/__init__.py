@@ -19,9 +19,12 @@ from dlt.sources.filesystem.helpers import (
 from dlt.sources.filesystem.readers import (
     ReadersSource,
     _read_csv,
+    _read_csv_arrow,
     _read_csv_duckdb,
     _read_jsonl,
+    _read_jsonl_arrow,
     _read_parquet,
+    _read_parquet_arrow,
 )
 from dlt.sources.filesystem.settings import DEFAULT_CHUNK_SIZE
 
@@ -36,6 +39,10 @@ def readers(
        read_csv(chunksize, **pandas_kwargs)
        read_jsonl(chunksize)
        read_parquet(chunksize)
+       read_parquet_arrow(columns, block_size, incremental)
+       read_csv_arrow(columns, block_size, parse_options, convert_options)
+       read_jsonl_arrow(columns, block_size, parse_options)
+       All readers also accept `parallel_files` and `ordered_files` to read many files at once.
 
     Args:
         bucket_url (str): The url to the bucket.
@@ -52,6 +59,12 @@ def readers(
         | dlt.transformer(name="read_parquet")(_read_parquet),
         filesystem(bucket_url, credentials, file_glob=file_glob)
         | dlt.transformer(name="read_csv_duckdb")(_read_csv_duckdb),
+        filesystem(bucket_url, credentials, file_glob=file_glob)
+        | dlt.transformer(name="read_parquet_arrow")(_read_parquet_arrow),
+        filesystem(bucket_url, credentials, file_glob=file_glob)
+        | dlt.transformer(name="read_csv_arrow")(_read_csv_arrow),
+        filesystem(bucket_url, credentials, file_glob=file_glob)
+        | dlt.transformer(name="read_jsonl_arrow")(_read_jsonl_arrow),
     )
 
 
@@ -101,3 +114,6 @@ read_csv = decorators.transformer(standalone=True)(_read_csv)
 read_jsonl = decorators.transformer(standalone=True)(_read_jsonl)
 read_parquet = decorators.transformer(standalone=True)(_read_parquet)
 read_csv_duckdb = decorators.transformer(standalone=True)(_read_csv_duckdb)
+read_parquet_arrow = decorators.transformer(standalone=True)(_read_parquet_arrow)
+read_csv_arrow = decorators.transformer(standalone=True)(_read_csv_arrow)
+read_jsonl_arrow = decorators.transformer(standalone=True)(_read_jsonl_arrow)
@@ -1,10 +1,30 @@
 """Helpers for the filesystem resource."""
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Full, Queue
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from fsspec import AbstractFileSystem
 
 import dlt
 from dlt.common.configuration import resolve_type
-from dlt.common.typing import TDataItem
+from dlt.common.configuration.container import Container
+from dlt.common.pipeline import PipelineContext
+from dlt.common.runtime.collector import NULL_COLLECTOR, Collector
+from dlt.common.storages.fsspec_filesystem import FileItemDict
+from dlt.common.typing import TDataItem, TDataItems
+from dlt.extract.decorators import SourceInjectableContext
 
 from dlt.sources import DltResource
 from dlt.sources.filesystem import fsspec_filesystem
@@ -15,7 +35,7 @@ from dlt.sources.credentials import (
     FileSystemCredentials,
 )
 
-from .settings import DEFAULT_CHUNK_SIZE
+from .settings import DEFAULT_CHUNK_SIZE, PARALLEL_FILES_MAX_CHUNKS
 
 
 @configspec
@@ -96,3 +116,119 @@ def fetch_json(file_data, chunk_size: int) -> List[Dict[str, Any]]:  # type: ign
             break
 
         yield add_columns(file_data.columns, batch)
+
+
+_FILE_READ = object()
+"""Marks the end of file in the queue of data items"""
+
+
+class _FileReadFailed(NamedTuple):
+    exception: Exception
+
+
+def read_files(
+    items: Iterable[FileItemDict],
+    read_file: Callable[[FileItemDict], Iterator[TDataItems]],
+    parallel_files: int = 1,
+    ordered_files: bool = True,
+) -> Iterator[TDataItems]:
+    """Reads `items` with `read_file` and yields the data items of each file.
+
+    With `parallel_files` > 1 up to that many files are opened and read in a thread pool. Each
+    file buffers at most `PARALLEL_FILES_MAX_CHUNKS` data items (ie. chunks of rows or record
+    batches) that are yielded from the calling thread, so memory used grows with `parallel_files`
+    and the size of a single data item, not with the size of the files. Files are yielded in the
+    order of `items` or, if `ordered_files` is False, data items of all files are yielded as
+    soon as they are read.
+    Number of files and bytes read are reported to the collector of the active pipeline.
+
+    Args:
+        items (Iterable[FileItemDict]): Files to read.
+        read_file (Callable[[FileItemDict], Iterator[TDataItems]]): Reads a single file.
+        parallel_files (int, optional): Max number of files read at once. Defaults to 1.
+        ordered_files (bool, optional): Yield files in the order of `items`. Defaults to True.
+
+    Yields:
+        Iterator[TDataItems]: Data items, read from the given files.
+    """
+    collector = _get_collector()
+    if parallel_files <= 1:
+        for file_obj in items:
+            yield from read_file(file_obj)
+            _update_file_counters(collector, file_obj)
+        return
+
+    files = iter(items)
+    # set when the caller stops reading, unblocks the readers
+    stopped = threading.Event()
+    # data items of files being read, in unordered mode all files share a single queue
+    shared_queue: "Queue[Tuple[int, Any]]" = Queue(PARALLEL_FILES_MAX_CHUNKS * parallel_files)
+    # files being read with their queues, in files order
+    in_flight: Dict[int, Tuple[FileItemDict, "Queue[Tuple[int, Any]]"]] = {}
+    futures: List["Future[None]"] = []
+
+    def _put(queue: "Queue[Tuple[int, Any]]", entry: Tuple[int, Any]) -> bool:
+        while not stopped.is_set():
+            try:
+                queue.put(entry, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _read(index: int, file_obj: FileItemDict, queue: "Queue[Tuple[int, Any]]") -> None:
+        try:
+            for item in read_file(file_obj):
+                if not _put(queue, (index, item)):
+                    return
+            _put(queue, (index, _FILE_READ))
+        except Exception as ex:
+            _put(queue, (index, _FileReadFailed(ex)))
+
+    with ThreadPoolExecutor(
+        parallel_files, thread_name_prefix=Container.thread_pool_prefix() + "filesystem_files"
+    ) as pool:
+
+        def _submit_next(index: int) -> int:
+            if file_obj := next(files, None):
+                queue = shared_queue if not ordered_files else Queue(PARALLEL_FILES_MAX_CHUNKS)
+                in_flight[index] = (file_obj, queue)
+                futures.append(pool.submit(_read, index, file_obj, queue))
+                index += 1
+            return index
+
+        next_index = 0
+        try:
+            for _ in range(parallel_files):
+                next_index = _submit_next(next_index)
+            while in_flight:
+                if ordered_files:
+                    # take items from the first file until it is read
+                    index, item = in_flight[next(iter(in_flight))][1].get()
+                else:
+                    index, item = shared_queue.get()
+                if isinstance(item, _FileReadFailed):
+                    raise item.exception
+                if item is _FILE_READ:
+                    file_obj, _ = in_flight.pop(index)
+                    _update_file_counters(collector, file_obj)
+                    next_index = _submit_next(next_index)
+                else:
+                    yield item
+        finally:
+            stopped.set()
+            for future in futures:
+                future.cancel()
+
+
+def _get_collector() -> Collector:
+    # collector is started only when pipeline extracts a source
+    proxy = Container()[PipelineContext]
+    if not proxy.is_active() or SourceInjectableContext not in Container():
+        return NULL_COLLECTOR
+    return getattr(proxy.pipeline(), "collector", NULL_COLLECTOR)
+
+
+def _update_file_counters(collector: Collector, file_obj: FileItemDict) -> None:
+    collector.update("Files read")
+    collector.update("Bytes read", inc=file_obj.get("size_in_bytes") or 0)
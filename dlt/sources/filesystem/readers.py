@@ -1,20 +1,29 @@
-from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence
 
 from dlt.common import json
 from dlt.common.typing import copy_sig_any
+from dlt.extract import Incremental
 from dlt.sources import TDataItems, DltResource, DltSource
 from dlt.sources.filesystem import FileItemDict
 
-from .helpers import fetch_arrow, fetch_json
+from .helpers import fetch_arrow, fetch_json, read_files
+from .settings import DEFAULT_ARROW_BLOCK_SIZE
 
 
 def _read_csv(
-    items: Iterator[FileItemDict], chunksize: int = 10000, **pandas_kwargs: Any
+    items: Iterator[FileItemDict],
+    chunksize: int = 10000,
+    parallel_files: int = 1,
+    ordered_files: bool = True,
+    **pandas_kwargs: Any,
 ) -> Iterator[TDataItems]:
     """Reads csv file with Pandas chunk by chunk.
 
     Args:
         chunksize (int): Number of records to read in one chunk
+        parallel_files (int): Number of files read at once, each buffers a few data items, defaults to 1
+        ordered_files (bool): Yield files in order in which they were listed, otherwise data items
+            of files are interleaved, defaults to True
         **pandas_kwargs: Additional keyword arguments passed to Pandas.read_csv
     Returns:
         TDataItem: The file content
@@ -24,24 +33,34 @@ def _read_csv(
     # apply defaults to pandas kwargs
     kwargs = {**{"header": "infer", "chunksize": chunksize}, **pandas_kwargs}
 
-    for file_obj in items:
+    def _read_file(file_obj: FileItemDict) -> Iterator[TDataItems]:
         # Here we use pandas chunksize to read the file in chunks and avoid loading the whole file
         # in memory.
         with file_obj.open() as file:
             for df in pd.read_csv(file, **kwargs):
                 yield df.to_dict(orient="records")
 
+    yield from read_files(items, _read_file, parallel_files, ordered_files)
+
 
-def _read_jsonl(items: Iterator[FileItemDict], chunksize: int = 1000) -> Iterator[TDataItems]:
+def _read_jsonl(
+    items: Iterator[FileItemDict],
+    chunksize: int = 1000,
+    parallel_files: int = 1,
+    ordered_files: bool = True,
+) -> Iterator[TDataItems]:
     """Reads jsonl file content and extract the data.
 
     Args:
         chunksize (int, optional): The number of JSON lines to load and yield at once, defaults to 1000
+        parallel_files (int, optional): Number of files read at once, defaults to 1
+        ordered_files (bool, optional): Yield files in order in which they were listed, defaults to True
 
     Returns:
         TDataItem: The file content
     """
-    for file_obj in items:
+
+    def _read_file(file_obj: FileItemDict) -> Iterator[TDataItems]:
         with file_obj.open() as f:
             lines_chunk = []
             for line in f:
@@ -52,33 +71,43 @@ def _read_jsonl(items: Iterator[FileItemDict], chunksize: int = 1000) -> Iterato
         if lines_chunk:
             yield lines_chunk
 
+    yield from read_files(items, _read_file, parallel_files, ordered_files)
+
 
 def _read_parquet(
     items: Iterator[FileItemDict],
     chunksize: int = 10,
+    parallel_files: int = 1,
+    ordered_files: bool = True,
 ) -> Iterator[TDataItems]:
     """Reads parquet file content and extract the data.
 
     Args:
         chunksize (int, optional): The number of files to process at once, defaults to 10.
+        parallel_files (int, optional): Number of files read at once, defaults to 1
+        ordered_files (bool, optional): Yield files in order in which they were listed, defaults to True
 
     Returns:
         TDataItem: The file content
     """
     from pyarrow import parquet as pq
 
-    for file_obj in items:
+    def _read_file(file_obj: FileItemDict) -> Iterator[TDataItems]:
         with file_obj.open() as f:
             parquet_file = pq.ParquetFile(f)
             for rows in parquet_file.iter_batches(batch_size=chunksize):
                 yield rows.to_pylist()
 
+    yield from read_files(items, _read_file, parallel_files, ordered_files)
+
 
 def _read_csv_duckdb(
     items: Iterator[FileItemDict],
     chunk_size: Optional[int] = 5000,
     use_pyarrow: bool = False,
-    **duckdb_kwargs: Any
+    parallel_files: int = 1,
+    ordered_files: bool = True,
+    **duckdb_kwargs: Any,
 ) -> Iterator[TDataItems]:
     """A resource to extract data from the given CSV files.
 
@@ -91,6 +120,11 @@ def _read_csv_duckdb(
         use_pyarrow (bool):
             Whether to use `pyarrow` to read the data and designate
             data schema. If set to False (by default), JSON is used.
+        parallel_files (int):
+            The number of files read at once, each buffers a few data items. Defaults to 1.
+        ordered_files (bool):
+            Whether to yield files in order in which they were listed, otherwise data items of
+            files are interleaved. Defaults to True.
         duckdb_kwargs (Dict):
             Additional keyword arguments to pass to the `read_csv()`.
 
@@ -101,12 +135,192 @@ def _read_csv_duckdb(
 
     helper = fetch_arrow if use_pyarrow else fetch_json
 
-    for item in items:
-        with item.open() as f:
-            file_data = duckdb.from_csv_auto(f, **duckdb_kwargs)  # type: ignore
+    def _read_file(item: FileItemDict) -> Iterator[TDataItems]:
+        # each file gets its own connection so files may be read from many threads
+        with item.open() as f, duckdb.connect() as conn:
+            file_data = conn.from_csv_auto(f, **duckdb_kwargs)  # type: ignore
 
             yield from helper(file_data, chunk_size)
 
+    yield from read_files(items, _read_file, parallel_files, ordered_files)
+
+
+def _read_parquet_arrow(
+    items: Iterator[FileItemDict],
+    columns: Optional[Sequence[str]] = None,
+    block_size: int = DEFAULT_ARROW_BLOCK_SIZE,
+    incremental: Optional[Incremental[Any]] = None,
+    parallel_files: int = 1,
+    ordered_files: bool = True,
+) -> Iterator[TDataItems]:
+    """Reads parquet files and yields arrow record batches without converting them to Python objects.
+
+    Args:
+        columns (Optional[Sequence[str]]): Columns to read, by default all columns are read.
+        block_size (int): Approximate size of a record batch in bytes. Number of rows in a batch
+            is estimated from the uncompressed size of row groups.
+        incremental (Optional[Incremental[Any]]): Incremental on a top level column. Row groups which
+            statistics show that they do not contain any new values are skipped.
+        parallel_files (int): Number of files read at once, each buffers a few data items, defaults to 1
+        ordered_files (bool): Yield files in order in which they were listed, otherwise data items
+            of files are interleaved, defaults to True
+
+    Returns:
+        TDataItem: Arrow record batches with the file content
+    """
+    from pyarrow import parquet as pq
+
+    def _read_file(file_obj: FileItemDict) -> Iterator[TDataItems]:
+        with file_obj.open() as f:
+            parquet_file = pq.ParquetFile(f)
+            metadata = parquet_file.metadata
+            if metadata.num_rows == 0:
+                return
+            row_groups = _select_parquet_row_groups(metadata, incremental)
+            if not row_groups:
+                return
+            total_byte_size = sum(metadata.row_group(i).total_byte_size for i in row_groups)
+            total_rows = sum(metadata.row_group(i).num_rows for i in row_groups)
+            batch_size = max(1, int(block_size * total_rows / max(total_byte_size, 1)))
+            yield from parquet_file.iter_batches(
+                batch_size=batch_size,
+                row_groups=row_groups,
+                columns=list(columns) if columns else None,
+            )
+
+    yield from read_files(items, _read_file, parallel_files, ordered_files)
+
+
+def _select_parquet_row_groups(metadata: Any, incremental: Optional[Incremental[Any]]) -> List[int]:
+    """Returns row groups that may contain values in the range of `incremental`. Only simple
+    cursor columns with min/max last value functions are considered.
+    """
+    all_row_groups = list(range(metadata.num_row_groups))
+    if not incremental or incremental.last_value_func not in (max, min):
+        return all_row_groups
+    # start value stays fixed during the extract, last value moves as rows are extracted
+    last_value, end_value = incremental.start_value, incremental.end_value
+    if last_value is None and end_value is None:
+        return all_row_groups
+    column_paths = [metadata.schema.column(i).path for i in range(metadata.num_columns)]
+    if incremental.cursor_path not in column_paths:
+        return all_row_groups
+    cursor_idx = column_paths.index(incremental.cursor_path)
+
+    selected = []
+    for i in all_row_groups:
+        stats = metadata.row_group(i).column(cursor_idx).statistics
+        if stats is None or not stats.has_min_max:
+            selected.append(i)
+            continue
+        if incremental.on_cursor_value_missing == "include" and stats.null_count:
+            selected.append(i)
+            continue
+        try:
+            if incremental.last_value_func is max:
+                skip = (last_value is not None and stats.max < last_value) or (
+                    end_value is not None and stats.min >= end_value
+                )
+            else:
+                skip = (last_value is not None and stats.min > last_value) or (
+                    end_value is not None and stats.max <= end_value
+                )
+        except TypeError:
+            # statistics not comparable with cursor values, let incremental filter rows
+            skip = False
+        if not skip:
+            selected.append(i)
+    return selected
+
+
+def _read_csv_arrow(
+    items: Iterator[FileItemDict],
+    columns: Optional[Sequence[str]] = None,
+    block_size: int = DEFAULT_ARROW_BLOCK_SIZE,
+    parse_options: Optional[Dict[str, Any]] = None,
+    convert_options: Optional[Dict[str, Any]] = None,
+    parallel_files: int = 1,
+    ordered_files: bool = True,
+) -> Iterator[TDataItems]:
+    """Reads csv files with pyarrow streaming reader and yields arrow record batches.
+
+    Args:
+        columns (Optional[Sequence[str]]): Columns to read, by default all columns are read.
+        block_size (int): Size of a block of the file in bytes parsed into a single record batch.
+        parse_options (Optional[Dict[str, Any]]): Arguments of `pyarrow.csv.ParseOptions` ie. delimiter.
+        convert_options (Optional[Dict[str, Any]]): Arguments of `pyarrow.csv.ConvertOptions` to
+            convert csv values to arrow types.
+        parallel_files (int): Number of files read at once, each buffers a few data items, defaults to 1
+        ordered_files (bool): Yield files in order in which they were listed, otherwise data items
+            of files are interleaved, defaults to True
+
+    Returns:
+        TDataItem: Arrow record batches with the file content
+    """
+    from pyarrow import csv
+
+    read_options = csv.ReadOptions(block_size=block_size)
+    csv_parse_options = csv.ParseOptions(**(parse_options or {}))
+    csv_convert_options = csv.ConvertOptions(**(convert_options or {}))
+    if columns:
+        csv_convert_options.include_columns = list(columns)
+
+    def _read_file(file_obj: FileItemDict) -> Iterator[TDataItems]:
+        with file_obj.open() as f:
+            yield from csv.open_csv(
+                f,
+                read_options=read_options,
+                parse_options=csv_parse_options,
+                convert_options=csv_convert_options,
+            )
+
+    yield from read_files(items, _read_file, parallel_files, ordered_files)
+
+
+def _read_jsonl_arrow(
+    items: Iterator[FileItemDict],
+    columns: Optional[Sequence[str]] = None,
+    block_size: int = DEFAULT_ARROW_BLOCK_SIZE,
+    parse_options: Optional[Dict[str, Any]] = None,
+    parallel_files: int = 1,
+    ordered_files: bool = True,
+) -> Iterator[TDataItems]:
+    """Reads jsonl files with pyarrow json reader and yields arrow record batches.
+
+    Args:
+        columns (Optional[Sequence[str]]): Columns to select, by default all columns are returned.
+        block_size (int): Size of a block of the file in bytes parsed into a single record batch.
+        parse_options (Optional[Dict[str, Any]]): Arguments of `pyarrow.json.ParseOptions` ie. explicit schema.
+        parallel_files (int): Number of files read at once, each buffers a few data items, defaults to 1
+        ordered_files (bool): Yield files in order in which they were listed, otherwise data items
+            of files are interleaved, defaults to True
+
+    Returns:
+        TDataItem: Arrow record batches with the file content
+    """
+    from pyarrow import json as pa_json
+
+    read_options = pa_json.ReadOptions(block_size=block_size)
+    json_parse_options = pa_json.ParseOptions(**(parse_options or {}))
+
+    def _read_file(file_obj: FileItemDict) -> Iterator[TDataItems]:
+        with file_obj.open() as f:
+            if hasattr(pa_json, "open_json"):
+                batches: Iterator[Any] = pa_json.open_json(
+                    f, read_options=read_options, parse_options=json_parse_options
+                )
+            else:
+                # older pyarrow parses the whole file at once
+                batches = iter(
+                    pa_json.read_json(
+                        f, read_options=read_options, parse_options=json_parse_options
+                    ).to_batches()
+                )
+            for batch in batches:
+                yield batch.select(list(columns)) if columns else batch
+
+    yield from read_files(items, _read_file, parallel_files, ordered_files)
+
 
 if TYPE_CHECKING:
 
@@ -125,5 +339,14 @@ if TYPE_CHECKING:
         @copy_sig_any(_read_csv_duckdb)
         def read_csv_duckdb(self) -> DltResource: ...
 
+        @copy_sig_any(_read_parquet_arrow)
+        def read_parquet_arrow(self) -> DltResource: ...
+
+        @copy_sig_any(_read_csv_arrow)
+        def read_csv_arrow(self) -> DltResource: ...
+
+        @copy_sig_any(_read_jsonl_arrow)
+        def read_jsonl_arrow(self) -> DltResource: ...
+
 else:
     ReadersSource = DltSource
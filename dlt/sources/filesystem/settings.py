@@ -1 +1,5 @@
 DEFAULT_CHUNK_SIZE = 100
+DEFAULT_ARROW_BLOCK_SIZE = 8 * 1024 * 1024
+"""Approximate size in bytes of record batches produced by arrow readers"""
+PARALLEL_FILES_MAX_CHUNKS = 4
+"""Max number of data items buffered per file when files are read in parallel"""
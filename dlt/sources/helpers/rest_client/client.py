@@ -4,10 +4,12 @@ from typing import (
     List,
     Dict,
     Any,
+    Tuple,
     TypeVar,
     Iterable,
     cast,
 )
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import copy
 from urllib.parse import urlparse
 from requests import Session as BaseSession  # noqa: I251
@@ -15,6 +17,7 @@ from requests import Response, Request
 from requests.auth import AuthBase
 
 from dlt.common import jsonpath, logger
+from dlt.common.configuration.container import Container
 
 from .typing import HTTPMethodBasic, HTTPMethod, Hooks
 from .paginators import BasePaginator
@@ -165,6 +168,8 @@ class RESTClient:
         paginator: Optional[BasePaginator] = None,
         data_selector: Optional[jsonpath.TJsonPath] = None,
         hooks: Optional[Hooks] = None,
+        parallel_pages: int = 1,
+        ordered_pages: bool = True,
         **kwargs: Any,
     ) -> Iterator[PageData[Any]]:
         """Iterates over paginated API responses, yielding pages of data.
@@ -184,6 +189,14 @@ class RESTClient:
             hooks (Optional[Hooks]): Hooks to modify request/response objects. Note that
                 when hooks are not provided, the default behavior is to raise an exception
                 on error status codes.
+            parallel_pages (int): Max number of page requests in flight. When larger than 1
+                and the paginator knows the remaining pages after the first response
+                (ie. `OffsetPaginator` or `PageNumberPaginator` with `total_path` or
+                maximum value), the remaining pages are fetched in a thread pool using
+                the client session and its retry settings. Other paginators fetch
+                pages sequentially. Defaults to 1.
+            ordered_pages (bool): When fetching pages in parallel, yield them in page order.
+                If False, pages are yielded as soon as they are received. Defaults to True.
             **kwargs (Any): Optional arguments to that the Request library accepts, such as
                 `stream`, `verify`, `proxies`, `cert`, `timeout`, and `allow_redirects`.
 
@@ -240,6 +253,89 @@ class RESTClient:
                 logger.info(f"Paginator {str(paginator)} does not have more pages")
                 break
 
+            if parallel_pages > 1:
+                page_requests = paginator.remaining_requests(request)
+                if page_requests is not None:
+                    yield from self._paginate_parallel(
+                        page_requests,
+                        paginator,
+                        data_selector,
+                        auth,
+                        parallel_pages,
+                        ordered_pages,
+                        **kwargs,
+                    )
+                    break
+
+    def _paginate_parallel(
+        self,
+        page_requests: Iterator[Request],
+        paginator: BasePaginator,
+        data_selector: jsonpath.TJsonPath,
+        auth: AuthBase,
+        parallel_pages: int,
+        ordered_pages: bool,
+        **kwargs: Any,
+    ) -> Iterator[PageData[Any]]:
+        """Fetches `page_requests` keeping up to `parallel_pages` requests in flight.
+        Stops at the first ignored response or at the first empty page if the paginator
+        stops after empty pages. Pages past that point are discarded. Paginator state is
+        updated with each received page.
+        """
+        stop_after_empty_page = getattr(paginator, "stop_after_empty_page", False)
+        # index of the page at which pagination stops
+        stop_index: int = None
+        # futures in page order with their requests
+        in_flight: Dict["Future[Response]", Tuple[int, Request]] = {}
+
+        with ThreadPoolExecutor(
+            parallel_pages, thread_name_prefix=Container.thread_pool_prefix() + "rest_client_pages"
+        ) as pool:
+
+            def _submit_next(index: int) -> int:
+                if stop_index is None and (page_request := next(page_requests, None)):
+                    future = pool.submit(self._send_request, page_request, **kwargs)
+                    in_flight[future] = (index, page_request)
+                    index += 1
+                return index
+
+            next_index = 0
+            try:
+                for _ in range(parallel_pages):
+                    next_index = _submit_next(next_index)
+                while in_flight:
+                    if ordered_pages:
+                        future = next(iter(in_flight))
+                    else:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        future = min(done, key=lambda f: in_flight[f][0])
+                    index, page_request = in_flight.pop(future)
+                    if stop_index is not None and index > stop_index:
+                        continue
+                    try:
+                        response = future.result()
+                    except IgnoreResponseException:
+                        stop_index = index
+                        continue
+                    data = self.extract_response(response, data_selector)
+                    # pages are counted in the paginator state like in sequential pagination
+                    paginator.update_state(response, data)
+                    if stop_after_empty_page and not data:
+                        stop_index = index
+                        continue
+                    next_index = _submit_next(next_index)
+                    yield PageData(
+                        data,
+                        request=page_request,
+                        response=response,
+                        paginator=paginator,
+                        auth=auth,
+                    )
+            finally:
+                for future in in_flight:
+                    future.cancel()
+        logger.info(f"Paginator {str(paginator)} does not have more pages")
+
     def extract_response(self, response: Response, data_selector: jsonpath.TJsonPath) -> List[Any]:
         # we should compile data_selector
         data: Any = jsonpath.find_values(data_selector, response.json())
@@ -1,6 +1,7 @@
+import copy
 import warnings
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, cast
 from urllib.parse import urljoin, urlparse
 
 from requests import Request, Response
@@ -67,6 +68,24 @@ class BasePaginator(ABC):
         """
         ...
 
+    def remaining_requests(self, request: Request) -> Optional[Iterator[Request]]:
+        """Returns requests for all remaining pages if they are known without
+        fetching the pages in between. Otherwise returns None.
+
+        `RESTClient.paginate` uses this to fetch pages in parallel. It is called
+        after `update_request`, so `request` is the request for the next page.
+        Paginators that follow a cursor or a link to the next page return None
+        and are always paginated sequentially.
+
+        Args:
+            request (Request): The request object for the next page.
+
+        Returns:
+            Optional[Iterator[Request]]: Requests for the remaining pages in
+                order or None if they are not known ahead of time.
+        """
+        return None
+
     def __str__(self) -> str:
         return f"{type(self).__name__} at {id(self):x}"
 
@@ -136,9 +155,12 @@ class RangePaginator(BasePaginator):
         self.total_path = jsonpath.compile_path(total_path) if total_path else None
         self.error_message_items = error_message_items
         self.stop_after_empty_page = stop_after_empty_page
+        # exclusive upper bound of the numeric parameter, known after the first page
+        self._end_value: Optional[int] = None
 
     def init_request(self, request: Request) -> None:
         self._has_next_page = True
+        self._end_value = None
         self.current_value = self.initial_value
         if request.params is None:
             request.params = {}
@@ -164,9 +186,11 @@ class RangePaginator(BasePaginator):
 
             self.current_value += self.value_step
 
-            if (total is not None and self.current_value >= total + self.base_index) or (
-                self.maximum_value is not None and self.current_value >= self.maximum_value
-            ):
+            end_values = [self.maximum_value]
+            if total is not None:
+                end_values.append(total + self.base_index)
+            self._end_value = min((v for v in end_values if v is not None), default=None)
+            if self._end_value is not None and self.current_value >= self._end_value:
                 self._has_next_page = False
 
     def _stop_after_this_page(self, data: Optional[List[Any]] = None) -> bool:
@@ -190,6 +214,19 @@ class RangePaginator(BasePaginator):
             request.params = {}
         request.params[self.param_name] = self.current_value
 
+    def remaining_requests(self, request: Request) -> Optional[Iterator[Request]]:
+        if not self._has_next_page or self._end_value is None:
+            return None
+
+        def _requests(current_value: int, end_value: int) -> Iterator[Request]:
+            for value in range(current_value, end_value, self.value_step):
+                page_request = copy.copy(request)
+                params = cast(Dict[str, Any], request.params) or {}
+                page_request.params = {**params, self.param_name: value}
+                yield page_request
+
+        return _requests(self.current_value, self._end_value)
+
 
 class PageNumberPaginator(RangePaginator):
     """A paginator that uses page number-based pagination strategy.
@@ -296,6 +296,7 @@ def create_resources(
                 paginator: Optional[BasePaginator],
                 data_selector: Optional[jsonpath.TJsonPath],
                 hooks: Optional[Dict[str, Any]],
+                parallel_pages: int,
                 client: RESTClient = client,
                 incremental_object: Optional[Incremental[Any]] = incremental_object,
                 incremental_param: Optional[IncrementalParam] = incremental_param,
@@ -319,6 +320,7 @@ def create_resources(
                     paginator=paginator,
                     data_selector=data_selector,
                     hooks=hooks,
+                    parallel_pages=parallel_pages,
                 )
 
             resources[resource_name] = dlt.resource(
@@ -332,6 +334,7 @@ def create_resources(
                 paginator=paginator,
                 data_selector=endpoint_config.get("data_selector"),
                 hooks=hooks,
+                parallel_pages=endpoint_config.get("parallel_pages") or 1,
             )
 
             resources[resource_name] = process(resources[resource_name], processing_steps)
@@ -350,6 +353,7 @@ def create_resources(
                 paginator: Optional[BasePaginator],
                 data_selector: Optional[jsonpath.TJsonPath],
                 hooks: Optional[Dict[str, Any]],
+                parallel_pages: int,
                 client: RESTClient = client,
                 resolved_params: List[ResolvedParam] = resolved_params,
                 include_from_parent: List[str] = include_from_parent,
@@ -379,6 +383,7 @@ def create_resources(
                         paginator=paginator,
                         data_selector=data_selector,
                         hooks=hooks,
+                        parallel_pages=parallel_pages,
                     ):
                         if parent_record:
                             for child_record in child_page:
@@ -396,6 +401,7 @@ def create_resources(
                 paginator=paginator,
                 data_selector=endpoint_config.get("data_selector"),
                 hooks=hooks,
+                parallel_pages=endpoint_config.get("parallel_pages") or 1,
             )
 
             resources[resource_name] = process(resources[resource_name], processing_steps)
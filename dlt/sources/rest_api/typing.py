@@ -264,6 +264,7 @@ class Endpoint(TypedDict, total=False):
     response_actions: Optional[List[ResponseAction]]
     incremental: Optional[IncrementalConfig]
     auth: Optional[AuthConfig]
+    parallel_pages: Optional[int]
 
 
 class ProcessingSteps(TypedDict):
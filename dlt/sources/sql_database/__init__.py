@@ -45,6 +45,7 @@ def sql_database(
     query_adapter_callback: Optional[TQueryAdapter] = None,
     resolve_foreign_keys: bool = False,
     engine_adapter_callback: Callable[[Engine], Engine] = None,
+    partitions: Optional[int] = None,
 ) -> Iterable[DltResource]:
     """
     A dlt source which loads data from an SQL database using SQLAlchemy.
@@ -79,6 +80,9 @@ def sql_database(
             May incur additional database calls as all referenced tables are reflected.
         engine_adapter_callback (Callable[[Engine], Engine]): Callback to configure, modify and Engine instance that will be used to open a connection ie. to
             set transaction isolation level.
+        partitions (Optional[int]): Number of partitions each table is split into. Partitions are read concurrently, each on its own connection.
+            At most as many partitions as the engine pool size are read at once.
+            Tables are split into ranges of their single column primary key. Tables without such key are read without partitions.
 
     Returns:
         Iterable[DltResource]: A list of DLT resources for each table to be loaded.
@@ -134,6 +138,7 @@ def sql_database(
             query_adapter_callback=query_adapter_callback,
             resolve_foreign_keys=resolve_foreign_keys,
             engine_adapter_callback=engine_adapter_callback,
+            partitions=partitions,
         )
 
 
@@ -159,6 +164,8 @@ def sql_table(
     resolve_foreign_keys: bool = False,
     engine_adapter_callback: Callable[[Engine], Engine] = None,
     write_disposition: TWriteDispositionConfig = "append",
+    partitions: Optional[int] = None,
+    partition_column: Optional[str] = None,
 ) -> DltResource:
     """
     A dlt resource which loads data from an SQL database table using SQLAlchemy.
@@ -195,6 +202,11 @@ def sql_table(
         engine_adapter_callback (Callable[[Engine], Engine]): Callback to configure, modify and Engine instance that will be used to open a connection ie. to
             set transaction isolation level.
         write_disposition (TWriteDispositionConfig): write disposition of the table resource, defaults to `append`.
+        partitions (Optional[int]): Number of partitions the table is split into. Partitions are read concurrently, each on its own connection,
+            and chunks are yielded as they arrive. At most as many partitions as the engine pool size are read at once.
+            Works with all backends and `incremental` without `row_order`.
+        partition_column (Optional[str]): Numeric, date or datetime column used to split the table into ranges of equal width.
+            Boundaries are computed with MIN/MAX query. Single column primary key is used if not specified.
 
     Returns:
         DltResource: The dlt resource for loading data from the SQL database table.
@@ -248,6 +260,8 @@ def sql_table(
         included_columns=included_columns,
         query_adapter_callback=query_adapter_callback,
         resolve_foreign_keys=resolve_foreign_keys,
+        partitions=partitions,
+        partition_column=partition_column,
     )
 
 
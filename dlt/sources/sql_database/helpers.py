@@ -1,6 +1,10 @@
 """SQL database source helpers"""
 
 import warnings
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date  # noqa: I251
+from queue import Full, Queue
 from typing import (
     Callable,
     Any,
@@ -15,6 +19,7 @@ from typing import (
 import operator
 
 import dlt
+from dlt.common import Decimal, logger
 from dlt.common.configuration.specs import (
     BaseConfiguration,
     ConnectionStringCredentials,
@@ -55,6 +60,25 @@ TQueryAdapter = Union[
 ]
 TTableAdapter = Callable[[Table], Optional[Union[SelectAny, Table]]]
 
+_PARTITION_DONE = object()
+"""Sent by partition reader when all its rows were queued"""
+
+
+def _partition_cut(low: Any, high: Any, part: int, partitions: int) -> Any:
+    """Returns value at `part` / `partitions` of the range between `low` and `high` of the same type"""
+    if isinstance(low, int) and isinstance(high, int):
+        return low + (high - low) * part // partitions
+    if isinstance(low, float) and isinstance(high, float):
+        return low + (high - low) * part / partitions
+    if isinstance(low, Decimal) and isinstance(high, Decimal):
+        return low + (high - low) * part / partitions
+    if isinstance(low, date) and isinstance(high, date):
+        # also datetime
+        return low + (high - low) * part / partitions
+    raise ValueError(
+        f"Cannot split range between {low!r} and {high!r} of different types into partitions"
+    )
+
 
 class TableLoader:
     def __init__(
@@ -66,6 +90,8 @@ class TableLoader:
         chunk_size: int = 1000,
         incremental: Optional[Incremental[Any]] = None,
         query_adapter_callback: Optional[TQueryAdapter] = None,
+        partitions: Optional[int] = None,
+        partition_column: Optional[str] = None,
     ) -> None:
         self.engine = engine
         self.backend = backend
@@ -100,6 +126,35 @@ class TableLoader:
             self.end_value = None
             self.row_order = None
             self.on_cursor_value_missing = None
+        self.partitions = partitions
+        if partitions and partitions > 1:
+            if self.row_order:
+                raise ValueError(
+                    f"Table '{table.name}' cannot be read in partitions because incremental"
+                    f" row_order '{self.row_order}' cannot be preserved across partitions"
+                )
+            self.partition_column = self._get_partition_column(partition_column)
+        else:
+            self.partition_column = None
+
+    def _get_partition_column(self, column_name: Optional[str]) -> Optional[Any]:
+        if column_name is None:
+            # use single column primary key by default
+            primary_key = getattr(self.table, "primary_key", None)
+            pk_columns = list(primary_key.columns) if primary_key is not None else []
+            if len(pk_columns) != 1:
+                logger.warning(
+                    f"Table '{self.table.name}' does not have single column primary key and no"
+                    " partition column was specified. Table will be read without partitions."
+                )
+                return None
+            return pk_columns[0]
+        try:
+            return self.table.c[column_name]
+        except KeyError as e:
+            raise KeyError(
+                f"Partition column '{column_name}' does not exist in table '{self.table.name}'"
+            ) from e
 
     def _make_query(self) -> SelectAny:
         table = self.table
@@ -149,30 +204,137 @@ class TableLoader:
 
         return query  # type: ignore[no-any-return]
 
-    def make_query(self) -> SelectClause:
+    def make_query(self, partition_clause: Optional[Any] = None) -> SelectClause:
+        query = self._make_query()
+        if partition_clause is not None:
+            query = query.where(partition_clause)
         if self.query_adapter_callback:
             try:
                 return self.query_adapter_callback(  # type: ignore[call-arg]
-                    self._make_query(), self.table, self.incremental, self.engine
+                    query, self.table, self.incremental, self.engine
                 )
             except TypeError as type_err:
                 if not is_typeerror_due_to_wrong_call(type_err, self.query_adapter_callback):
                     raise
-                return self.query_adapter_callback(  # type: ignore[call-arg]
-                    self._make_query(), self.table
-                )
+                return self.query_adapter_callback(query, self.table)  # type: ignore[call-arg]
 
-        return self._make_query()
+        return query
+
+    def make_partition_clauses(self) -> List[Any]:
+        """Splits range of partition column values into `partitions` clauses that select disjoint row sets.
+
+        Boundaries are computed with MIN/MAX query on the incremental query so only the loaded range is split.
+        Returns empty list if table cannot be split ie. it is empty or has single partition column value.
+        """
+        column = self.partition_column
+        bounds_query = (
+            self._make_query()
+            .with_only_columns(sa.func.min(column), sa.func.max(column))
+            .order_by(None)
+        )
+        with self.engine.connect() as conn:
+            low, high = conn.execute(bounds_query).one()
+        if low is None or low == high:
+            return []
+        if isinstance(low, bool) or not isinstance(low, (int, float, Decimal, date)):
+            raise ValueError(
+                f"Partition column '{column.name}' in table '{self.table.name}' has values of type"
+                f" {type(low).__name__}. Only numeric, date and datetime columns can be"
+                " partitioned."
+            )
+        cuts: List[Any] = []
+        for i in range(1, self.partitions):
+            cut = _partition_cut(low, high, i, self.partitions)
+            if low < cut <= high and (not cuts or cut > cuts[-1]):
+                cuts.append(cut)
+        if not cuts:
+            return []
+        # rows with NULL values go to the first partition
+        clauses = [sa.or_(column < cuts[0], column.is_(None))]
+        for lower, upper in zip(cuts, cuts[1:]):
+            clauses.append(sa.and_(column >= lower, column < upper))
+        clauses.append(column >= cuts[-1])
+        return clauses
 
     def load_rows(self, backend_kwargs: Dict[str, Any] = None) -> Iterator[TDataItem]:
         # make copy of kwargs
         backend_kwargs = dict(backend_kwargs or {})
-        query = self.make_query()
+        partition_clauses = []
+        if self.partition_column is not None:
+            partition_clauses = self.make_partition_clauses()
+        if len(partition_clauses) > 1:
+            yield from self._load_partitions(partition_clauses, backend_kwargs)
+        else:
+            yield from self._load_query(self.make_query(), backend_kwargs)
+
+    def _load_query(
+        self, query: SelectClause, backend_kwargs: Dict[str, Any]
+    ) -> Iterator[TDataItem]:
         if self.backend == "connectorx":
             yield from self._load_rows_connectorx(query, backend_kwargs)
         else:
             yield from self._load_rows(query, backend_kwargs)
 
+    def _load_partitions(
+        self, partition_clauses: List[Any], backend_kwargs: Dict[str, Any]
+    ) -> Iterator[TDataItem]:
+        """Reads partitions concurrently, each on its own connection, and yields chunks as they arrive.
+        At most as many partitions as the size of the engine connection pool are read at once.
+        Chunks are yielded from the calling thread so incremental and other pipe steps see a single stream.
+        """
+        queries = [self.make_query(clause) for clause in partition_clauses]
+        if any(isinstance(query, TextClause) for query in queries):
+            raise ValueError(
+                f"Table '{self.table.name}' cannot be read in partitions because query adapter"
+                " returned text query that cannot be filtered"
+            )
+        # bound the number of chunks kept in memory
+        items: "Queue[Any]" = Queue(maxsize=2 * len(queries))
+        stop = threading.Event()
+
+        def _put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    items.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    pass
+            return False
+
+        def _read_partition(query: SelectClause) -> None:
+            try:
+                # copy kwargs, connectorx modifies them
+                for item in self._load_query(query, dict(backend_kwargs)):
+                    if not _put(item):
+                        return
+            except Exception as ex:
+                _put(ex)
+            finally:
+                _put(_PARTITION_DONE)
+
+        # do not take more connections than the pool holds, remaining partitions wait for a reader
+        max_workers = len(queries)
+        if isinstance(self.engine.pool, sa.pool.QueuePool):
+            max_workers = max(1, min(max_workers, self.engine.pool.size()))
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"dlt-sql-{self.table.name}"
+        ) as pool:
+            for query in queries:
+                pool.submit(_read_partition, query)
+            try:
+                pending = len(queries)
+                while pending:
+                    item = items.get()
+                    if item is _PARTITION_DONE:
+                        pending -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                # stop readers when done, failed or generator was closed
+                stop.set()
+
     def _load_rows(self, query: SelectClause, backend_kwargs: Dict[str, Any]) -> TDataItem:
         with self.engine.connect() as conn:
             result = conn.execution_options(yield_per=self.chunk_size).execute(query)
@@ -245,6 +407,8 @@ def table_rows(
     included_columns: Optional[List[str]] = None,
     query_adapter_callback: Optional[TQueryAdapter] = None,
     resolve_foreign_keys: bool = False,
+    partitions: Optional[int] = None,
+    partition_column: Optional[str] = None,
 ) -> Iterator[TDataItem]:
     if isinstance(table, str):  # Reflection is deferred
         table = Table(
@@ -292,6 +456,8 @@ def table_rows(
         incremental=incremental,
         chunk_size=chunk_size,
         query_adapter_callback=query_adapter_callback,
+        partitions=partitions,
+        partition_column=partition_column,
     )
     try:
         yield from loader.load_rows(backend_kwargs)
@@ -402,3 +568,5 @@ class SqlTableResourceConfiguration(BaseConfiguration):
     defer_table_reflect: Optional[bool] = False
     reflection_level: Optional[ReflectionLevel] = "full"
     included_columns: Optional[List[str]] = None
+    partitions: Optional[int] = None
+    partition_column: Optional[str] = None
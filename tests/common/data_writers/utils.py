@@ -20,6 +20,7 @@ def get_writer(
     buffer_max_items: int = 10,
     file_max_items: Optional[int] = 10,
     file_max_bytes: Optional[int] = None,
+    buffer_max_bytes: Optional[int] = None,
     disable_compression: bool = False,
     caps: DestinationCapabilitiesContext = None,
 ) -> BufferedDataWriter[TWriter]:
@@ -33,6 +34,7 @@ def get_writer(
         buffer_max_items=buffer_max_items,
         file_max_items=file_max_items,
         file_max_bytes=file_max_bytes,
+        buffer_max_bytes=buffer_max_bytes,
         disable_compression=disable_compression,
         _caps=caps,
     )
@@ -1,5 +1,6 @@
 import pytest
 
+from dlt.common import json
 from dlt.common.typing import StrAny, DictStrAny
 from dlt.common.normalizers.naming import NamingConvention
 from dlt.common.schema.typing import TColumnName, TSimpleRegex
@@ -12,6 +13,7 @@ from dlt.common.normalizers.json.relational import (
     DataItemNormalizer as RelationalNormalizer,
     DLT_ID_LENGTH_BYTES,
 )
+from dlt.common.normalizers.utils import get_nested_row_hashes
 
 # _flatten, _get_child_row_hash, _normalize_row, normalize_data_item,
 
@@ -472,6 +474,28 @@ def test_child_row_deterministic_hash(norm: RelationalNormalizer) -> None:
     assert all(ch[0][1]["_dlt_id"] != ch[1][1]["_dlt_id"] for ch in zip(children, children_3))
 
 
+@pytest.mark.parametrize("id_length", [DLT_ID_LENGTH_BYTES, 8, 9, 11, 16])
+def test_nested_row_hashes_batch(id_length: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("dlt.common.normalizers.utils.DLT_ID_LENGTH_BYTES", id_length)
+    parent_ids = ["abc", "abc", "abc", "żółw", "abc", "x" * 200]
+    list_idxs = [0, 1, 10000, 0, 3, 7]
+    assert get_nested_row_hashes(parent_ids, "table__f", list_idxs) == [
+        digest128(f"{parent_id}_table__f_{idx}", id_length)
+        for parent_id, idx in zip(parent_ids, list_idxs)
+    ]
+    assert get_nested_row_hashes([], "table__f", []) == []
+
+
+def test_key_hash_same_as_row_subset_hash() -> None:
+    row = {"id": 1, "name": "a", "_dlt_load_id": "1234", "z": {"a": [1, 2]}, "b": None}
+    for subset in (["id"], ["name", "id"], ["z", "b", "_dlt_load_id"], ["missing", "id"], []):
+        expected = digest128(
+            json.dumps({k: v for k, v in row.items() if k in subset}, sort_keys=True),
+            DLT_ID_LENGTH_BYTES,
+        )
+        assert RelationalNormalizer.get_row_hash(row, subset) == expected
+
+
 def test_keeps_dlt_id(norm: RelationalNormalizer) -> None:
     h = uniq_id()
     row = {"a": "b", "_dlt_id": h}
@@ -895,6 +919,33 @@ def test_caching_perf(norm: RelationalNormalizer) -> None:
     print(f"{time() - start}")
 
 
+def test_identifier_cache_info(norm: RelationalNormalizer) -> None:
+    row = {"f-1": "a", "f!3": {"f4": "b", "": "c"}}
+    flattened_row, _ = norm._flatten("mock_table", row, 1000)
+    assert flattened_row == {"f_1": "a", "f_3__f4": "b", "f_3___empty": "c"}
+    info = norm.get_identifier_cache_info()
+    assert set(info.keys()) == {
+        "normalize_path_fragment",
+        "shorten_fragments",
+        "normalize_table_identifier",
+        "is_nested_type",
+    }
+    hits = info["normalize_path_fragment"]["hits"]
+    misses = info["normalize_path_fragment"]["misses"]
+    assert info["normalize_path_fragment"]["maxsize"] > 0
+    # same keys are served from cache
+    assert norm._flatten("mock_table", row, 1000)[0] == flattened_row
+    info = norm.get_identifier_cache_info()
+    assert info["normalize_path_fragment"]["hits"] == hits + 4
+    assert info["normalize_path_fragment"]["misses"] == misses
+
+    # caches are keyed by naming convention
+    other_norm: RelationalNormalizer = Schema("other").data_item_normalizer  # type: ignore[assignment]
+    other_norm._flatten("mock_table", row, 1000)
+    info = norm.get_identifier_cache_info()
+    assert info["normalize_path_fragment"]["misses"] == misses + 4
+
+
 def set_max_nesting(norm: RelationalNormalizer, max_nesting: int) -> None:
     RelationalNormalizer.update_normalizer_config(norm.schema, {"max_nesting": max_nesting})
     norm._reset()
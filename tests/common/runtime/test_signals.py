@@ -2,6 +2,7 @@ import os
 import pytest
 import time
 from multiprocessing.dummy import Process as DummyProcess
+from threading import Event
 from typing import Iterator
 
 from dlt.common import sleep
@@ -126,3 +127,33 @@ def test_signalling() -> None:
 def test_cleanup() -> None:
     # this must happen after all forked tests (problems with tests teardowns in other tests)
     pass
+
+
+def test_sleep_wake_event() -> None:
+    wake_event = Event()
+    wake_event.set()
+    start = time.time()
+    # set event ends sleep immediately
+    signals.sleep(1000000, wake_event)
+    assert time.time() - start < 1.0
+    assert not signals._wake_events
+
+    # signal wakes thread sleeping on its own event
+    wake_event.clear()
+    thread_signal = 0
+
+    def _thread() -> None:
+        nonlocal thread_signal
+
+        try:
+            signals.sleep(1000000, wake_event)
+        except SignalReceivedException as siex:
+            thread_signal = siex.signal_code
+
+    p = DummyProcess(target=_thread)
+    p.start()
+    sleep(0.1)
+    signals.signal_receiver(2, None)
+    p.join(5)
+    assert thread_signal == 2
+    assert not signals._wake_events
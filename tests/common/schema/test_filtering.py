@@ -56,6 +56,26 @@ def test_whole_row_filter_with_exception(schema: Schema) -> None:
     assert filtered_case == {}
 
 
+def test_filter_plan_cache(schema: Schema) -> None:
+    _add_excludes(schema)
+    bot_case: DictStrAny = load_json_case("mod_bot_case")
+    schema.filter_row("event_bot", deepcopy(bot_case))
+    filter_plan = schema._filter_plans["event_bot"]
+    assert filter_plan["is_flagged"] is False
+    assert filter_plan["data__custom"] is True
+    # plan is reused for subsequent rows
+    filtered_case = schema.filter_row("event_bot", {"is_flagged": True, "data__custom": "remains"})
+    assert filtered_case == {"data__custom": "remains"}
+    assert schema._filter_plans["event_bot"] is filter_plan
+
+    # plans are dropped when filters are compiled again
+    schema.get_table("event_bot")["filters"]["includes"].append(TSimpleRegex("re:^is_flagged$"))
+    schema._compile_settings()
+    assert schema._filter_plans == {}
+    filtered_case = schema.filter_row("event_bot", {"is_flagged": True, "data__custom": "remains"})
+    assert filtered_case == {"is_flagged": True, "data__custom": "remains"}
+
+
 def test_filter_parent_table_schema_update(schema: Schema) -> None:
     # filter out parent table and leave just child one. that should break the child-parent relationship and reject schema update
     _add_excludes(schema)
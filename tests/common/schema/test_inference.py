@@ -30,6 +30,31 @@ def test_get_preferred_type(schema: Schema) -> None:
     assert schema.get_preferred_type("_timestamp") is None
 
 
+def test_inferred_hints_and_preferred_types_cache(schema: Schema) -> None:
+    _add_preferred_types(schema)
+    column = schema._infer_column("_dlt_id", "a")
+    assert column["nullable"] is False
+    assert column["unique"] is True
+    assert schema._inferred_hints["_dlt_id"] == {"nullable": False, "unique": True, "row_key": True}
+    # cached hints are not shared with inferred columns
+    column["unique"] = False
+    assert schema._infer_column("_dlt_id", "a")["unique"] is True
+    assert schema.get_preferred_type("confidence_x") == "double"
+    assert schema._inferred_preferred_types["confidence_x"] == "double"
+    assert schema.get_preferred_type("x") is None
+    assert schema._inferred_preferred_types["x"] is None
+
+    # hints are combined into single regex
+    assert all(len(patterns) == 1 for patterns in schema._compiled_hints.values())
+    # caches are dropped when settings change
+    schema.merge_hints({"unique": [TSimpleRegex("re:^x$")]})
+    assert schema._inferred_hints == {}
+    assert schema._inferred_preferred_types == {}
+    assert schema._infer_column("x", "a")["unique"] is True
+    assert schema._infer_column("_dlt_id", "a")["unique"] is True
+    assert schema._infer_column("y", "a").get("unique") is None
+
+
 def test_map_column_preferred_type(schema: Schema) -> None:
     _add_preferred_types(schema)
     # preferred type match
@@ -188,6 +213,45 @@ def test_coerce_row_iso_timestamp(schema: Schema) -> None:
     assert new_columns[0]["name"] == "timestamp__v_text"
 
 
+def test_coerce_row_with_coercion_plan(schema: Schema) -> None:
+    _add_preferred_types(schema)
+    row_1 = {"timestamp": "2022-05-10T00:17:15.300000+00:00", "name": "A", "count": 1}
+    _, new_table = schema.coerce_row("event_user", None, row_1)
+    schema.update_table(new_table)
+    # update table invalidates plan
+    assert "event_user" not in schema._coercion_plans
+
+    new_row, new_table = schema.coerce_row("event_user", None, row_1)
+    assert new_table is None
+    plan = schema._coercion_plans["event_user"]
+    # types match, no coercion needed
+    assert plan[("name", str)] == ("text", None)
+    assert plan[("count", int)] == ("bigint", None)
+    assert plan[("timestamp", str)] == ("timestamp", "text")
+
+    # rows coerced with plan are identical to rows coerced without it
+    row_2 = {"timestamp": "2022-05-11T00:17:15.300000+00:00", "name": "B", "count": 2}
+    new_row_plan, new_table = schema.coerce_row("event_user", None, dict(row_2))
+    assert new_table is None
+    schema._coercion_plans.clear()
+    new_row_no_plan, _ = schema.coerce_row("event_user", None, dict(row_2))
+    assert new_row_plan == new_row_no_plan
+    assert new_row_plan["timestamp"] == pendulum.parse("2022-05-11T00:17:15.300000+00:00")
+
+    # planned coercion fails and variant is generated
+    _, new_table = schema.coerce_row("event_user", None, {"timestamp": "übermorgen"})
+    assert list(new_table["columns"].keys()) == ["timestamp__v_text"]
+    # new python type is added to plan
+    new_row, new_table = schema.coerce_row("event_user", None, {"count": "12"})
+    assert new_table is None
+    assert new_row["count"] == 12
+    assert schema._coercion_plans["event_user"][("count", str)] == ("bigint", "text")
+
+    # dropping the table drops the plan
+    schema.drop_tables(["event_user"])
+    assert "event_user" not in schema._coercion_plans
+
+
 def test_shorten_variant_column(schema: Schema) -> None:
     schema.naming.max_length = 9
     _add_preferred_types(schema)
@@ -844,6 +844,52 @@ def test_group_tables_by_resource(schema: Schema) -> None:
     }
 
 
+def test_tables_index(schema: Schema) -> None:
+    schema.update_table(utils.new_table("a_events", columns=[]))
+    schema.update_table(utils.new_table("c_products", columns=[], resource="products"))
+    schema.update_table(utils.new_table("a_events___1", columns=[], parent_table_name="a_events"))
+    schema.update_table(
+        utils.new_table("a_events___1___2", columns=[], parent_table_name="a_events___1")
+    )
+    schema.update_table(utils.new_table("a_events___2", columns=[], parent_table_name="a_events"))
+    schema.update_table(utils.new_table("mc_products", columns=[], resource="products"))
+    assert schema.nested_tables == {
+        "a_events": ["a_events___1", "a_events___2"],
+        "a_events___1": ["a_events___1___2"],
+    }
+    assert schema.resource_tables["products"] == ["c_products", "mc_products"]
+    assert schema.resource_tables["a_events"] == ["a_events"]
+
+    # index gives the same results as scanning all tables
+    assert utils.get_nested_tables(
+        schema.tables, "a_events", schema.nested_tables
+    ) == utils.get_nested_tables(schema.tables, "a_events")
+    assert list(
+        utils.group_tables_by_resource(
+            schema.tables,
+            nested_tables=schema.nested_tables,
+            resource_tables=schema.resource_tables,
+        ).items()
+    ) == list(utils.group_tables_by_resource(schema.tables).items())
+
+    # index is rebuilt when schema is loaded
+    loaded = Schema.from_dict(schema.to_dict())
+    assert loaded.nested_tables == schema.nested_tables
+    assert loaded.resource_tables == schema.resource_tables
+
+    # resource changed
+    schema.update_table(utils.new_table("a_events", columns=[], resource="events"))
+    assert "a_events" not in schema.resource_tables
+    assert schema.resource_tables["events"] == ["a_events"]
+
+    # dropped tables are removed from the index
+    schema.drop_tables(["a_events___1___2", "mc_products"])
+    assert "a_events___1" not in schema.nested_tables
+    assert schema.resource_tables["products"] == ["c_products"]
+    nested_tables = utils.get_nested_tables(schema.tables, "a_events", schema.nested_tables)
+    assert [t["name"] for t in nested_tables] == ["a_events", "a_events___1", "a_events___2"]
+
+
 def test_remove_processing_hints() -> None:
     eth_V9 = load_yml_case("schemas/eth/ethereum_schema_v9")
     # here tables contain processing hints
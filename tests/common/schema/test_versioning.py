@@ -44,6 +44,28 @@ def test_content_hash() -> None:
     assert utils.generate_version_hash(eth_v4) != hash2
 
 
+def test_version_hash_held_table_reference() -> None:
+    eth_v10: TStoredSchema = load_yml_case("schemas/eth/ethereum_schema_v10")
+    schema = Schema.from_dict(eth_v10)  # type: ignore[arg-type]
+
+    # tables modified in place after the hash was computed change the hash
+    blocks = schema.tables["blocks"]
+    version_hash = schema.version_hash
+    blocks["columns"]["new_col"] = {"name": "new_col", "data_type": "text"}
+    assert schema.version_hash != version_hash
+
+    table = schema.get_table("blocks__transactions")
+    version_hash = schema.version_hash
+    table["description"] = "changed in place"
+    assert schema.version_hash != version_hash
+
+    columns = schema.get_table_columns("blocks", include_incomplete=True)
+    version_hash = schema.version_hash
+    columns["number"]["description"] = "changed in place"
+    assert schema.version_hash != version_hash
+    assert schema.version_hash == utils.generate_version_hash(schema.to_dict(bump_version=False))
+
+
 def test_bump_version_no_stored_hash() -> None:
     eth_v3: TStoredSchema = load_yml_case("schemas/eth/ethereum_schema_v3")
     assert "version_hash" not in eth_v3
@@ -279,9 +279,12 @@ def test_build_parse_job_path(load_storage: LoadStorage) -> None:
         ParsedLoadJobFileName.parse("tab.id.wrong_retry.jsonl")
 
 
-def test_load_package_listings(load_storage: LoadStorage) -> None:
+@pytest.mark.parametrize("indexed", (False, True), ids=("storage", "index"))
+def test_load_package_listings(load_storage: LoadStorage, indexed: bool) -> None:
     # 100 csv files
     load_id = create_load_package(load_storage.new_packages, 100)
+    if indexed:
+        load_storage.new_packages.index_jobs(load_id)
     new_jobs = load_storage.new_packages.list_new_jobs(load_id)
     assert len(new_jobs) == 100
     assert len(load_storage.new_packages.list_job_with_states_for_table(load_id, "items_1")) == 100
@@ -368,6 +371,17 @@ def test_load_package_listings(load_storage: LoadStorage) -> None:
     assert len(package_info.jobs["started_jobs"]) == 0
     assert len(package_info.jobs["completed_jobs"]) == 1
     assert len(package_info.jobs["failed_jobs"]) == 2
+    # listings are the same as in storage
+    unindexed_packages = PackageStorage(load_storage.new_packages.storage, "new")
+    for state, jobs in unindexed_packages.get_load_package_jobs(load_id).items():
+        assert sorted(jobs) == sorted(package_jobs[state])
+    assert sorted(unindexed_packages.list_new_jobs(load_id)) == sorted(
+        load_storage.new_packages.list_new_jobs(load_id)
+    )
+    for table_name in ("items_1", "items_2"):
+        assert sorted(
+            unindexed_packages.list_job_with_states_for_table(load_id, table_name)
+        ) == sorted(load_storage.new_packages.list_job_with_states_for_table(load_id, table_name))
 
     # complete package
     load_storage.new_packages.complete_loading_package(load_id, "aborted")
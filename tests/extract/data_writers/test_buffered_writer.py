@@ -4,6 +4,7 @@ import time
 from typing import Iterator, Type
 from uuid import uuid4
 
+from dlt.common.data_writers.buffered import estimate_item_bytes
 from dlt.common.data_writers.exceptions import BufferedDataWriterClosed
 from dlt.common.data_writers.writers import (
     DataWriter,
@@ -318,6 +319,64 @@ def test_gather_metrics(disable_compression: bool, writer_type: Type[DataWriter]
     assert len(writer.closed_files) == 2
 
 
+@pytest.mark.parametrize("writer_type", ALL_OBJECT_WRITERS)
+def test_flush_on_buffer_max_bytes(writer_type: Type[DataWriter]) -> None:
+    c1 = new_column("col1", "text")
+    t1 = {"col1": c1}
+    item = {"col1": "A" * 1000}
+    item_bytes = estimate_item_bytes(item)
+    assert item_bytes > 1000
+    with get_writer(
+        writer_type, buffer_max_items=100, file_max_items=None, buffer_max_bytes=item_bytes * 3
+    ) as writer:
+        writer.write_data_item([item, item], t1)
+        assert writer.buffered_bytes == item_bytes * 2
+        assert writer._writer is None
+        # third item exceeds the buffer
+        writer.write_data_item(item, t1)
+        assert writer.buffered_bytes == 0
+        assert writer._writer.items_count == 3
+        writer.write_data_item(item, t1)
+        assert writer.buffered_bytes == item_bytes
+    # peak buffer size is reported in metrics
+    assert len(writer.closed_files) == 1
+    assert writer.closed_files[0].items_count == 4
+    assert writer.closed_files[0].peak_buffer_bytes == item_bytes * 3
+
+
+@pytest.mark.parametrize("writer_type", ALL_OBJECT_WRITERS)
+def test_flush_rotates_on_file_max_bytes(writer_type: Type[DataWriter]) -> None:
+    t1 = {"col1": new_column("col1", "text")}
+    item = {"col1": "A" * 1000}
+    with get_writer(
+        writer_type, buffer_max_items=100, file_max_items=None, file_max_bytes=1
+    ) as writer:
+        writer.write_data_item([item, item], t1)
+        assert writer.closed_files == []
+        # flush forced by the storage buffer budget checks the file size
+        writer.flush()
+        assert writer.buffered_bytes == 0
+        assert len(writer.closed_files) == 1
+        assert writer.closed_files[0].items_count == 2
+        writer.write_data_item(item, t1)
+    assert len(writer.closed_files) == 2
+
+
+def test_estimate_item_bytes() -> None:
+    import pyarrow as pa
+
+    from dlt.common.libs.pandas import pandas as pd
+
+    item = {"col1": 1, "col2": "A" * 100}
+    assert estimate_item_bytes(item) >= 100
+    assert estimate_item_bytes([item, item]) == 2 * estimate_item_bytes(item)
+    table = pa.table({"col1": list(range(1000))})
+    assert estimate_item_bytes(table) == table.nbytes
+    assert estimate_item_bytes(table.to_batches()[0]) == table.nbytes
+    df = pd.DataFrame({"col1": list(range(1000))})
+    assert estimate_item_bytes(df) == 8000
+
+
 @pytest.mark.parametrize(
     "disable_compression", [True, False], ids=["no_compression", "compression"]
 )
@@ -3,10 +3,12 @@ from typing import Type
 import pytest
 
 from dlt.common.configuration.container import Container
+from dlt.common.data_writers.buffered import estimate_item_bytes
 from dlt.common.data_writers.writers import DataWriter
 from dlt.common.destination.capabilities import DestinationCapabilitiesContext
 from dlt.common.metrics import DataWriterMetrics
 from dlt.common.schema.utils import new_column
+from dlt.common.utils import custom_environ
 from dlt.common.storages.data_item_storage import DataItemStorage
 
 from tests.utils import TEST_STORAGE_ROOT
@@ -53,3 +55,40 @@ def test_write_items(writer_type: Type[DataWriter]) -> None:
         assert len(item_storage.closed_files("load_2")) == 1
         item_storage.close_writers("load_2")
         assert len(item_storage.closed_files("load_2")) == 2
+
+
+def test_flush_largest_buffers_on_total_max_bytes() -> None:
+    item = {"col1": "A" * 1000}
+    item_bytes = estimate_item_bytes(item)
+    t1 = {"col1": new_column("col1", "text")}
+    writer_spec = ALL_OBJECT_WRITERS[0].writer_spec()
+    with Container().injectable_context(
+        DestinationCapabilitiesContext.generic_capabilities(writer_spec.file_format)
+    ), custom_environ(
+        {
+            "DATA_WRITER__TOTAL_BUFFER_MAX_BYTES": str(item_bytes * 10),
+            "DATA_WRITER__BUFFER_MAX_ITEMS": "100",
+        }
+    ):
+        item_storage = ItemTestStorage(writer_spec)
+        item_storage.write_data_item("load_1", "schema", "t1", [item] * 5, t1)
+        item_storage.write_data_item("load_1", "schema", "t2", [item] * 2, t1)
+        item_storage.write_data_item("load_1", "schema", "t3", [item] * 2, t1)
+        writers = list(item_storage.buffered_writers.values())
+        # budget not exceeded yet
+        assert [w.buffered_bytes for w in writers] == [
+            item_bytes * 5,
+            item_bytes * 2,
+            item_bytes * 2,
+        ]
+        # exceeds the budget: largest buffers are flushed until half of the budget is free
+        item_storage.write_data_item("load_1", "schema", "t3", [item] * 2, t1)
+        assert [w.buffered_bytes for w in writers] == [0, item_bytes * 2, 0]
+        assert item_storage._buffered_bytes == item_bytes * 2
+        item_storage.close_writers("load_1")
+        assert [w.closed_files[0].items_count for w in writers] == [5, 2, 4]
+        assert [w.closed_files[0].peak_buffer_bytes for w in writers] == [
+            item_bytes * 5,
+            item_bytes * 2,
+            item_bytes * 4,
+        ]
@@ -13,6 +13,7 @@ from dlt.common.storages.schema_storage import SchemaStorage
 from dlt.extract import DltResource, DltSource
 from dlt.extract.exceptions import DataItemRequiredForDynamicTableHints, ResourceExtractionError
 from dlt.extract.extract import ExtractStorage, Extract
+from dlt.extract.extractors import ObjectExtractor
 from dlt.extract.hints import make_hints
 
 from dlt.extract.items import TableNameMeta
@@ -90,6 +91,64 @@ def test_extract_select_tables_lambda(extract_step: Extract) -> None:
     assert "table_name_with_lambda" not in schema.tables
 
 
+def test_extract_dynamic_table_name_grouped(extract_step: Extract) -> None:
+    page = [{"event type": "Click" if i % 3 else "Page View", "id": i} for i in range(10)]
+
+    @dlt.resource(table_name=lambda item: item["event type"])
+    def events():
+        yield page
+
+    source = DltSource(dlt.Schema("events"), "module", [events])
+    load_id = extract_step.extract_storage.create_load_package(source.discover_schema())
+    extractor = ObjectExtractor(
+        load_id, extract_step.extract_storage.item_storages["object"], source.schema
+    )
+    written = []
+    write_item = extractor._write_item
+
+    def _write_item(table_name, resource_name, items, columns=None):
+        written.append((table_name, items))
+        write_item(table_name, resource_name, items, columns)
+
+    extractor._write_item = _write_item  # type: ignore[method-assign]
+    extractor.write_items(source.resources["events"], page, None)
+    # one write per table, order of items preserved
+    assert [(t, [i["id"] for i in items]) for t, items in written] == [
+        ("page_view", [0, 3, 6, 9]),
+        ("click", [1, 2, 4, 5, 7, 8]),
+    ]
+    assert extractor._dynamic_table_names == {"Page View": "page_view", "Click": "click"}
+    assert set(source.schema.data_table_names(include_incomplete=True)) == {"page_view", "click"}
+    extract_step.extract_storage.close_writers(load_id)
+
+
+def test_extract_dynamic_table_name_with_other_dynamic_hints(extract_step: Extract) -> None:
+    @dlt.resource(
+        table_name=lambda item: item["type"],
+        primary_key=lambda item: "id" if item["type"] == "a" else "key",
+    )
+    def items():
+        yield [{"type": "a", "id": 1, "key": 1}, {"type": "b", "id": 2, "key": 2}]
+
+    source = DltSource(dlt.Schema("items"), "module", [items])
+    extract_step.extract(source, 20, 1)
+    assert source.schema.tables["a"]["columns"]["id"]["primary_key"] is True
+    assert source.schema.tables["b"]["columns"]["key"]["primary_key"] is True
+
+
+def test_extract_arrow_dynamic_table_name(extract_step: Extract) -> None:
+    import pyarrow as pa
+
+    @dlt.resource(table_name=lambda tbl: f"rows_{tbl.num_rows}")
+    def arrow_items():
+        yield pa.table({"id": [1, 2]})
+        yield [pa.table({"id": [3]}), pa.table({"id": [4, 5]})]
+
+    source = DltSource(dlt.Schema("arrow"), "module", [arrow_items])
+    extract_step.extract(source, 20, 1)
+    assert set(source.schema.data_table_names(include_incomplete=True)) == {"rows_1", "rows_2"}
+
+
 def test_make_hints_default() -> None:
     hints = make_hints()
     assert hints == {"columns": {}}
@@ -316,6 +375,27 @@ def test_extract_renamed_clone_and_parent(extract_step: Extract):
     assert source.tx_clone._pipe.parent.name == "input_gen_tx_clone"
 
 
+def test_extract_native_async(extract_step: Extract) -> None:
+    os.environ["EXTRACT__NATIVE_ASYNC"] = "true"
+    # write in small batches in the writer thread
+    extract_step.write_batch_size = 3
+
+    @dlt.resource(table_name=lambda item: "even_table" if item % 2 == 0 else "odd_table")
+    async def async_items():
+        for i in range(10):
+            yield i
+
+    source = DltSource(dlt.Schema("selectables"), "module", [async_items])
+    load_id = extract_step.extract(source, 20, 1)
+    extract_step.extract_storage.commit_new_load_package(load_id, source.schema)
+    expect_extracted_file(
+        extract_step.extract_storage, "selectables", "odd_table", json.dumps([1, 3, 5, 7, 9])
+    )
+    expect_extracted_file(
+        extract_step.extract_storage, "selectables", "even_table", json.dumps([0, 2, 4, 6, 8])
+    )
+
+
 def expect_tables(extract_step: Extract, resource: DltResource) -> dlt.Schema:
     source = DltSource(dlt.Schema("selectables"), "module", [resource(10)])
     load_id = extract_step.extract_storage.create_load_package(source.discover_schema())
@@ -697,6 +697,102 @@ def test_explicit_close_pipe() -> None:
     assert inspect.getgeneratorstate(gen_pipe.gen) == "GEN_CLOSED"  # type: ignore[arg-type]
 
 
+def test_futures_pool_ready_queue() -> None:
+    import threading
+    from concurrent.futures import TimeoutError as FutureTimeoutError
+    from dlt.extract.concurrency import FuturesPool
+    from dlt.extract.items import ResolvablePipeItem
+
+    pool = FuturesPool(workers=6, poll_interval=0.01, max_parallel_items=6)
+    pipe_a, pipe_b = Pipe("a"), Pipe("b")
+    events = [threading.Event() for _ in range(6)]
+
+    def _item(i: int):
+        def _wait() -> int:
+            events[i].wait()
+            return i
+
+        return _wait
+
+    try:
+        # a gets 4 items, b gets 2 items
+        for i in range(6):
+            pipe = pipe_a if i < 4 else pipe_b
+            pool.submit(ResolvablePipeItem(_item(i), 0, pipe, None))
+        assert pool.free_slots == 0
+        assert pool.resolve_next_future_no_wait() is None
+        with pytest.raises(FutureTimeoutError):
+            pool.resolve_next_future(use_configured_timeout=True)
+
+        # complete in reverse order
+        for event in reversed(events):
+            event.set()
+            time.sleep(0.01)
+        # wait until all are queued
+        pool._wait_for_free_slot()
+        while pool.ready_count < 6:
+            time.sleep(0.01)
+        assert pool.max_ready_count == 6
+
+        # insertion order within pipe, round robin across pipes starting with first done
+        resolved = [pool.resolve_next_future().item for _ in range(6)]
+        assert resolved == [4, 0, 5, 1, 2, 3]
+        assert pool.ready_count == 0
+        assert pool.resolved_counts == {"a": 4, "b": 2}
+        assert pool.empty
+        assert pool.resolve_next_future() is None
+    finally:
+        for event in events:
+            event.set()
+        pool.close()
+
+
+def test_native_async_pipe_iterator() -> None:
+    import threading
+
+    loop_threads = set()
+
+    async def async_gen():
+        for i in range(20):
+            await asyncio.sleep(0.001)
+            loop_threads.add(threading.get_ident())
+            yield i
+
+    async def async_step(item: int) -> int:
+        await asyncio.sleep(0.01)
+        loop_threads.add(threading.get_ident())
+        return item * 2
+
+    @dlt.defer
+    def deferred_step(item: int) -> int:
+        return item + 1
+
+    p = Pipe.from_data("async_gen", async_gen())
+    p.append_step(async_step)  # type: ignore[arg-type]
+    p.append_step(deferred_step)  # type: ignore[arg-type]
+
+    with PipeIterator.from_pipe(p, native_async=True, max_parallel_items=5) as pit:
+        assert pit.native_async is True
+        items = _f_items(list(pit))
+        assert pit._futures_pool.resolved_counts["async_gen"] > 0
+    assert sorted(items) == [i * 2 + 1 for i in range(20)]
+    # all coroutines were evaluated in the iterating thread
+    assert loop_threads == {threading.get_ident()}
+
+    # falls back to background loop if a loop already runs in this thread
+    async def _iterate_in_loop() -> List[TDataItems]:
+        p = Pipe.from_data("async_gen", async_gen())
+        p.append_step(async_step)  # type: ignore[arg-type]
+        with PipeIterator.from_pipe(p, native_async=True) as pit:
+            items = _f_items(list(pit))
+            assert pit.native_async is False
+            return items
+
+    loop_threads.clear()
+    assert sorted(asyncio.run(_iterate_in_loop())) == [i * 2 for i in range(20)]
+    assert threading.get_ident() not in loop_threads
+
+
 close_pipe_got_exit = False
 close_pipe_yielding = False
 
@@ -728,6 +824,7 @@ def test_close_on_async_exception() -> None:
         return item
 
     assert_pipes_closed(raise_gen, long_gen)
+    assert_pipes_closed(raise_gen, long_gen, native_async=True)
 
 
 def test_close_on_thread_pool_exception() -> None:
@@ -812,9 +909,10 @@ def test_close_on_async_generator() -> None:
         return item
 
     assert_pipes_closed(raise_gen, long_gen)
+    assert_pipes_closed(raise_gen, long_gen, native_async=True)
 
 
-def assert_pipes_closed(raise_gen, long_gen) -> None:
+def assert_pipes_closed(raise_gen, long_gen, native_async: bool = False) -> None:
     global close_pipe_got_exit, close_pipe_yielding
 
     close_pipe_got_exit = False
@@ -822,7 +920,8 @@ def assert_pipes_closed(raise_gen, long_gen) -> None:
 
     pit: PipeIterator = None
     with PipeIterator.from_pipe(
-        Pipe.from_data("failing", raise_gen, parent=Pipe.from_data("endless", long_gen()))
+        Pipe.from_data("failing", raise_gen, parent=Pipe.from_data("endless", long_gen())),
+        native_async=native_async,
     ) as pit:
         with pytest.raises(ResourceExtractionError) as py_ex:
             list(pit)
@@ -836,7 +935,8 @@ def assert_pipes_closed(raise_gen, long_gen) -> None:
     close_pipe_got_exit = False
     close_pipe_yielding = False
     pit = ManagedPipeIterator.from_pipe(
-        Pipe.from_data("failing", raise_gen, parent=Pipe.from_data("endless", long_gen()))
+        Pipe.from_data("failing", raise_gen, parent=Pipe.from_data("endless", long_gen())),
+        native_async=native_async,
     )
     with pytest.raises(ResourceExtractionError) as py_ex:
         list(pit)
@@ -3568,3 +3568,90 @@ def test_warning_large_deduplication_state(item_type: TestDataItemFormat, primar
         call for call in logger_spy.call_args_list if "Large number of records" in call.args[0]
     ]
     assert len(warning_calls) == 1
+
+
+@pytest.mark.parametrize("last_value_func", [min, max])
+@pytest.mark.parametrize("on_cursor_value_missing", ["include", "exclude"])
+@pytest.mark.parametrize("with_end_value", [True, False])
+@pytest.mark.parametrize("primary_key", [None, "id", ()])
+@pytest.mark.parametrize("cursor_type", ["int", "naive_datetime"])
+def test_json_incremental_batch_same_as_rows(
+    last_value_func: Any,
+    on_cursor_value_missing: Any,
+    with_end_value: bool,
+    primary_key: Any,
+    cursor_type: str,
+) -> None:
+    from dlt.extract.incremental.transform import JsonIncremental
+
+    random.seed(42)
+    base_date = pendulum.datetime(2024, 1, 1)
+
+    def make_value(i: int, naive: bool = True) -> Any:
+        if cursor_type == "int":
+            return i
+        # naive datetimes in rows are compared with tz aware state
+        value = base_date + timedelta(days=i)
+        return value.naive() if naive else value
+
+    start_value = make_value(20, naive=False)
+    end_value = None
+    if with_end_value:
+        end_value = make_value(40 if last_value_func is max else 0, naive=False)
+
+    def make_transform() -> JsonIncremental:
+        return JsonIncremental(
+            "resource",
+            "updated_at",
+            start_value,
+            start_value,
+            end_value,
+            last_value_func,
+            primary_key,
+            # rows with id 1 and cursor equal to start value were already loaded
+            {digest128(json.dumps(1 if primary_key else {"id": 1, "updated_at": make_value(20)}))},
+            on_cursor_value_missing,
+        )
+
+    row_transform = make_transform()
+    batch_transform = make_transform()
+    for page in range(5):
+        rows = [
+            {"id": i, "updated_at": make_value(random.randrange(0, 60))} for i in range(page * 50)
+        ]
+        # already loaded and new row with cursor equal to start value
+        rows.append({"id": 1, "updated_at": make_value(20)})
+        rows.append({"id": 2, "updated_at": make_value(20)})
+        rows.append({"id": 3, "updated_at": None})
+        rows.append({"id": 4})
+        random.shuffle(rows)
+
+        row_results = [row_transform(row) for row in rows]
+        expected_rows = [row for row, _, _ in row_results if row is not None]
+        batch_rows, start_out_of_range, end_out_of_range = batch_transform.transform_batch(rows)
+
+        assert batch_rows == expected_rows
+        assert start_out_of_range == any(start_out for _, start_out, _ in row_results)
+        assert end_out_of_range == any(end_out for _, _, end_out in row_results)
+        assert batch_transform.last_value == row_transform.last_value
+        assert batch_transform.last_rows == row_transform.last_rows
+        assert batch_transform.unique_hashes == row_transform.unique_hashes
+
+
+def test_json_incremental_batch_fallback() -> None:
+    from dlt.extract.incremental.transform import JsonIncremental
+
+    def make_transform(last_value_func: Any) -> JsonIncremental:
+        return JsonIncremental(
+            "resource", "updated_at", 1, 1, None, last_value_func, None, set(), "raise"
+        )
+
+    # custom last value function is applied row by row
+    assert make_transform(lambda values: max(values)).transform_batch([{"updated_at": 1}]) is None
+    # values that cannot be compared are processed row by row to raise detailed exception
+    assert make_transform(max).transform_batch([{"updated_at": "a"}]) is None
+    # missing cursor values raise
+    with pytest.raises(IncrementalCursorPathMissing):
+        make_transform(max).transform_batch([{"updated_at": 2}, {"id": 1}])
+    with pytest.raises(IncrementalCursorPathHasValueNone):
+        make_transform(max).transform_batch([{"updated_at": 2}, {"updated_at": None}])
@@ -106,6 +106,31 @@ def test_parquet_writer_json_serialization() -> None:
         ]
 
 
+def test_parquet_writer_rows_and_arrow_tables() -> None:
+    c1 = new_column("col1", "bigint")
+    c2 = new_column("col2", "text")
+    c3 = new_column("col3", "decimal")
+
+    with get_writer(ParquetDataWriter) as writer:
+        writer.write_data_item([{"col1": 1, "col2": "a"}], {"col1": c1, "col2": c2, "col3": c3})
+        # arrow table with subset of columns, different order and types that need cast
+        writer.write_data_item(
+            pa.table({"col3": [Decimal("1.5"), None], "col1": pa.array([2, 3], pa.int32())}),
+            {"col1": c1, "col2": c2, "col3": c3},
+        )
+        writer.write_data_item(
+            [{"col1": 4, "col2": "d", "col3": Decimal("4.0")}],
+            {"col1": c1, "col2": c2, "col3": c3},
+        )
+
+    assert writer.closed_files[0].items_count == 4
+    with open(writer.closed_files[0].file_path, "rb") as f:
+        table = pq.read_table(f)
+        assert table.column("col1").to_pylist() == [1, 2, 3, 4]
+        assert table.column("col2").to_pylist() == ["a", None, None, "d"]
+        assert table.column("col3").to_pylist() == [None, Decimal("1.5"), None, Decimal("4.0")]
+
+
 def test_parquet_writer_all_data_fields() -> None:
     data = dict(TABLE_ROW_ALL_DATA_TYPES_DATETIMES)
 
@@ -41,6 +41,24 @@ def test_mssql_factory() -> None:
     assert client.capabilities.casefold_identifier is str
 
 
+def test_mssql_parametrized_insert() -> None:
+    from dlt.destinations.insert_job_client import ParametrizedInsertLoadJob
+
+    schema = Schema("schema")
+    client = mssql().client(schema, MsSqlClientConfiguration()._bind_dataset_name("dataset"))
+    assert client.insert_batch_size == 10000
+    assert client.capabilities.parametrized_insert_file_formats == ["typed-jsonl", "parquet"]
+
+    os.environ["DESTINATION__INSERT_BATCH_SIZE"] = "500"
+    client = mssql().client(schema, MsSqlClientConfiguration()._bind_dataset_name("dataset"))
+    assert client.insert_batch_size == 500
+
+    table = client.prepare_load_table("_dlt_loads")
+    job = client.create_load_job(table, "/tmp/_dlt_loads.1234.0.typed-jsonl", "1234")
+    assert isinstance(job, ParametrizedInsertLoadJob)
+    assert job.batch_size == 500
+
+
 def test_mssql_credentials_defaults() -> None:
     creds = MsSqlCredentials()
     assert creds.port == 1433
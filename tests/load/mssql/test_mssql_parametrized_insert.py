@@ -0,0 +1,69 @@
+import os
+import pytest
+from typing import Any, Iterator
+
+import dlt
+from dlt.common import pendulum, Decimal
+
+from tests.cases import arrow_table_all_data_types
+from tests.pipeline.utils import assert_load_info
+
+# mark all tests as essential, do not remove
+pytestmark = pytest.mark.essential
+
+
+@pytest.mark.parametrize("file_format", ["typed-jsonl", "parquet"])
+def test_parametrized_insert(file_format: str) -> None:
+    @dlt.resource(columns={"payload": {"data_type": "json"}})
+    def items() -> Iterator[Any]:
+        for i in range(25):
+            yield {
+                "id": i,
+                "name": f"name_{i}",
+                "created_at": pendulum.datetime(2024, 1, 1, 12, i),
+                "amount": Decimal("10.25") + i,
+                "payload": {"tags": ["a", "b"], "i": i},
+                # column missing in every second item
+                **({"optional": "value"} if i % 2 else {}),
+            }
+
+    # bind rows in several batches
+    os.environ["DESTINATION__MSSQL__INSERT_BATCH_SIZE"] = "10"
+    pipeline = dlt.pipeline(
+        pipeline_name=f"test_parametrized_insert_{file_format.replace('-', '_')}",
+        destination="mssql",
+        dataset_name="test_parametrized_insert",
+        dev_mode=True,
+    )
+    info = pipeline.run(items(), loader_file_format=file_format)  # type: ignore[arg-type]
+    assert_load_info(info)
+
+    with pipeline.sql_client() as client:
+        table_name = client.make_qualified_table_name("items")
+        rows = client.execute_sql(
+            f"SELECT id, name, amount, payload, optional FROM {table_name} ORDER BY id"
+        )
+    assert len(rows) == 25
+    assert rows[3][1] == "name_3"
+    assert rows[3][2] == Decimal("13.25")
+    assert rows[3][3] == '{"tags":["a","b"],"i":3}'
+    assert [row[4] for row in rows[:2]] == [None, "value"]
+
+
+@pytest.mark.parametrize("loader_file_format", [None, "parquet"])
+def test_arrow_items_file_format(loader_file_format: str) -> None:
+    item, _, _ = arrow_table_all_data_types("arrow-table", include_json=True)
+
+    pipeline = dlt.pipeline(
+        pipeline_name="test_arrow_items_file_format", destination="mssql", dev_mode=True
+    )
+    pipeline.extract(dlt.resource(item, name="items"))
+    pipeline.normalize(loader_file_format=loader_file_format)  # type: ignore[arg-type]
+
+    load_id = pipeline.list_normalized_load_packages()[0]
+    jobs = pipeline._get_load_storage().normalized_packages.list_new_jobs(load_id)
+    items_jobs = [job for job in jobs if "items" in job]
+    # parquet is not selected for arrow items unless requested explicitly
+    expected_format = loader_file_format or "insert_values"
+    assert len(items_jobs) == 1
+    assert items_jobs[0].endswith(expected_format)
@@ -56,6 +56,38 @@ def test_postgres_encoded_binary(
     assert data["table"][0]["hash"].tobytes() == blob
 
 
+@pytest.mark.parametrize(
+    "destination_config",
+    destinations_configs(default_sql_configs=True, subset=["postgres"]),
+    ids=lambda x: x.name,
+)
+def test_postgres_parquet_binary_copy(destination_config: DestinationTestConfiguration) -> None:
+    from tests.cases import arrow_table_all_data_types
+
+    os.environ["RESTORE_FROM_DESTINATION"] = "False"
+    table, records, _ = arrow_table_all_data_types(
+        "arrow-table", include_json=False, include_not_normalized_name=False, num_rows=100
+    )
+
+    pipeline = destination_config.setup_pipeline("postgres_" + uniq_id(), dev_mode=True)
+    # arrow tables are written as parquet and loaded with binary COPY
+    load_info = pipeline.run(table, table_name="table")
+    assert_load_info(load_info)
+    job = load_info.load_packages[0].jobs["completed_jobs"][0].file_path
+    assert job.endswith("parquet")
+
+    rows = load_tables_to_dicts(pipeline, "table")["table"]
+    assert len(rows) == 100
+    expected = {record["string"]: record for record in records}
+    for row in rows:
+        record = expected[row["string"]]
+        for column in ("float", "int", "bool", "string_null", "float_null", "decimal", "date"):
+            assert row[column] == record[column]
+        assert row["datetime"] == record["datetime"]
+        assert row["time"] == record["time"]
+        assert row["binary"].tobytes() == record["binary"]
+
+
 # do not remove - it allows us to filter tests by destination
 @pytest.mark.parametrize(
     "destination_config",
@@ -2,7 +2,7 @@ import os
 from typing import Iterator
 import pytest
 
-from dlt.common import pendulum, Wei
+from dlt.common import pendulum, Decimal, Wei
 from dlt.common.configuration.resolve import resolve_configuration, ConfigFieldMissingException
 from dlt.common.storages import FileStorage
 from dlt.common.utils import uniq_id
@@ -112,3 +112,114 @@ def test_wei_value(client: PostgresClient, file_storage: FileStorage) -> None:
         f" '{str(pendulum.now())}', {Wei.from_int256(2*256-1, 78)});"
     )
     expect_load_file(client, file_storage, insert_sql + insert_values, user_table_name)
+
+
+def test_binary_copy_encode_numeric() -> None:
+    from dlt.destinations.impl.postgres.binary_copy import encode_numeric
+
+    # ndigits, weight, sign, dscale followed by base 10000 digits
+    assert encode_numeric(Decimal("123.45")).hex() == "0002000000000002007b1194"
+    assert encode_numeric(Decimal("0.0001")).hex() == "0001ffff000000040001"
+    assert encode_numeric(Decimal("-10000")).hex() == "0001000140000000" + "0001"
+    assert encode_numeric(Decimal("0")).hex() == "0000000000000000"
+    assert encode_numeric(Decimal("NaN")).hex() == "00000000c0000000"
+
+
+def test_binary_copy_encode_record_batch() -> None:
+    import struct
+    import pyarrow as pa
+    from dlt.destinations.impl.postgres.binary_copy import (
+        COPY_HEADER,
+        COPY_TRAILER,
+        CopyDataStream,
+        get_field_encoder,
+        iter_copy_data,
+    )
+
+    timestamps = [pendulum.datetime(2000, 1, 1, 0, 0, 1), pendulum.datetime(1999, 12, 31)]
+    columns = {
+        "id": pa.array([1, None], pa.int64()),
+        "name": pa.array(["a", "żó"]),
+        "flag": pa.array([True, False]),
+        "day": pa.array([pendulum.date(2000, 1, 2), None], pa.date32()),
+        "ts": pa.array(timestamps, pa.timestamp("ms", tz="UTC")),
+    }
+    batch = pa.RecordBatch.from_pydict(columns)
+    db_types = ["bigint", "varchar", "boolean", "date", "timestamp (3) with time zone"]
+    encoders = [get_field_encoder(db_type) for db_type in db_types]
+    stream = CopyDataStream(iter_copy_data([batch], encoders))
+    # read in small chunks to check if stream reassembles
+    chunks = []
+    while chunk := stream.read(7):
+        chunks.append(chunk)
+    data = b"".join(chunks)
+    assert data.startswith(COPY_HEADER)
+    assert data.endswith(COPY_TRAILER)
+
+    null = struct.pack(">i", -1)
+    row_1 = (
+        struct.pack(">h", 5)
+        + struct.pack(">iq", 8, 1)
+        + struct.pack(">i", 1)
+        + b"a"
+        + struct.pack(">i?", 1, True)
+        + struct.pack(">ii", 4, 1)
+        + struct.pack(">iq", 8, 1000000)
+    )
+    row_2 = (
+        struct.pack(">h", 5)
+        + null
+        + struct.pack(">i", 4)
+        + "żó".encode("utf-8")
+        + struct.pack(">i?", 1, False)
+        + null
+        + struct.pack(">iq", 8, -86400 * 1000000)
+    )
+    assert data[len(COPY_HEADER) : -len(COPY_TRAILER)] == row_1 + row_2
+
+
+def test_binary_copy_unsupported_type() -> None:
+    from dlt.common.exceptions import TerminalValueError
+    from dlt.destinations.impl.postgres.binary_copy import get_field_encoder
+
+    with pytest.raises(TerminalValueError):
+        get_field_encoder("geometry")
+    # time with time zone has different binary representation
+    with pytest.raises(TerminalValueError):
+        get_field_encoder("time with time zone")
+
+
+def test_binary_copy_type_mapper_types() -> None:
+    from dlt.destinations.impl.postgres.binary_copy import get_field_encoder
+    from dlt.destinations.impl.postgres.factory import PostgresTypeMapper
+
+    # all types generated by type mapper, with and without precision, can be encoded
+    db_types = list(PostgresTypeMapper.sct_to_unbound_dbt.values()) + [
+        db_type % ((3,) * db_type.count("%i")) for db_type in PostgresTypeMapper.sct_to_dbt.values()
+    ]
+    db_types += ["timestamp without time zone", "smallint", "integer"]
+    for db_type in db_types:
+        get_field_encoder(db_type)
+
+
+def test_binary_copy_encode_timestamp_and_time() -> None:
+    import struct
+    import pyarrow as pa
+    from dlt.destinations.impl.postgres.binary_copy import get_field_encoder
+
+    ts = pa.array([pendulum.datetime(2000, 1, 1, 0, 0, 1), None], pa.timestamp("us", tz="UTC"))
+    for db_type in (
+        "timestamp with time zone",
+        "timestamp without time zone",
+        "timestamp (3) with time zone",
+    ):
+        assert get_field_encoder(db_type)(ts) == [
+            struct.pack(">iq", 8, 1000000),
+            struct.pack(">i", -1),
+        ]
+    t = pa.array([pendulum.time(1, 0, 0, 500), None], pa.time64("us"))
+    for db_type in ("time without time zone", "time (6) without time zone"):
+        assert get_field_encoder(db_type)(t) == [
+            struct.pack(">iq", 8, 3600 * 1000000 + 500),
+            struct.pack(">i", -1),
+        ]
@@ -270,3 +270,158 @@ def test_file_chunking() -> None:
         assert len(pipe_item.item) == 2
         # no need to test more chunks
         break
+
+
+@pytest.mark.parametrize("bucket_url", TESTS_BUCKET_URLS)
+def test_arrow_readers(bucket_url: str) -> None:
+    import pyarrow as pa
+
+    from dlt.sources.filesystem import read_csv_arrow, read_jsonl_arrow, read_parquet_arrow
+
+    parquet_batches = list(
+        filesystem(bucket_url, file_glob="parquet/*.parquet") | read_parquet_arrow()
+    )
+    jsonl_batches = list(filesystem(bucket_url, file_glob="jsonl/*.jsonl") | read_jsonl_arrow())
+    assert all(isinstance(batch, pa.RecordBatch) for batch in parquet_batches + jsonl_batches)
+    assert sum(batch.num_rows for batch in parquet_batches) == 1034
+    assert sum(batch.num_rows for batch in jsonl_batches) == 1034
+
+    # projection pushdown
+    csv_batches = list(
+        filesystem(bucket_url, file_glob="met_csv/A801/*.csv")
+        | read_csv_arrow(columns=["code", "date"])
+    )
+    assert sum(batch.num_rows for batch in csv_batches) == 24
+    assert all(batch.schema.names == ["code", "date"] for batch in csv_batches)
+
+    # pyarrow options are passed as arguments, caller options are not modified
+    convert_options = {"strings_can_be_null": True}
+    csv_batches = list(
+        filesystem(bucket_url, file_glob="met_csv/A801/*.csv")
+        | read_csv_arrow(columns=["code"], convert_options=convert_options)
+    )
+    assert sum(batch.num_rows for batch in csv_batches) == 24
+    assert all(batch.schema.names == ["code"] for batch in csv_batches)
+    assert convert_options == {"strings_can_be_null": True}
+
+
+def test_parquet_arrow_skips_row_groups() -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from dlt.sources.filesystem import read_parquet_arrow
+
+    file_path = os.path.join(TEST_STORAGE_ROOT, "row_groups", "ids.parquet")
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    pq.write_table(pa.table({"id": list(range(100))}), file_path, row_group_size=10)
+
+    opened_row_groups: List[List[int]] = []
+    orig_iter_batches = pq.ParquetFile.iter_batches
+
+    def _iter_batches(self, *args, **kwargs):
+        opened_row_groups.append(kwargs["row_groups"])
+        return orig_iter_batches(self, *args, **kwargs)
+
+    reader = filesystem(
+        "file://" + os.path.abspath(os.path.dirname(file_path)), file_glob="*.parquet"
+    ) | read_parquet_arrow(incremental=dlt.sources.incremental("id", initial_value=45))
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pq.ParquetFile, "iter_batches", _iter_batches)
+        rows = pa.Table.from_batches(list(reader))
+
+    # row groups with ids below 40 are not read, incremental filters the rest
+    assert opened_row_groups == [[4, 5, 6, 7, 8, 9]]
+    assert rows["id"].to_pylist() == list(range(45, 100))
+
+
+@pytest.mark.parametrize("ordered_files", [True, False])
+def test_parallel_files(ordered_files: bool) -> None:
+    from dlt.common.runtime.collector import DictCollector
+
+    bucket_url = os.path.join(TEST_STORAGE_ROOT, "standard_source", "samples")
+
+    serial = list(filesystem(bucket_url, file_glob="csv/*.csv") | read_csv())
+    parallel = list(
+        filesystem(bucket_url, file_glob="csv/*.csv")
+        | read_csv(parallel_files=3, ordered_files=ordered_files)
+    )
+    # compare as strings, csvs contain nan values
+    if ordered_files:
+        assert str(parallel) == str(serial)
+    else:
+        assert sorted(map(str, parallel)) == sorted(map(str, serial))
+
+    class _KeepCountersCollector(DictCollector):
+        # pipeline state is extracted in a separate step, keep counters across steps
+        def _start(self, step: str) -> None:
+            if self.counters is None:
+                super()._start(step)
+
+        def _stop(self) -> None:
+            pass
+
+    # files and bytes read are reported to the pipeline collector
+    collector = _KeepCountersCollector()
+    pipeline = dlt.pipeline(
+        "test_parallel_files", destination="duckdb", progress=collector, dev_mode=True
+    )
+    files = filesystem(bucket_url, file_glob="csv/*.csv")
+    # incremental on modification date works with parallel readers
+    files.apply_hints(incremental=dlt.sources.incremental("modification_date"))
+    pipeline.extract(
+        (files | read_csv(parallel_files=3, ordered_files=ordered_files)).with_name("csv")
+    )
+    assert collector.counters["Files read"] == 4
+    assert collector.counters["Bytes read"] == sum(
+        item["size_in_bytes"] for item in filesystem(bucket_url, file_glob="csv/*.csv")
+    )
+    # nothing new to read
+    collector.counters.clear()
+    files = filesystem(bucket_url, file_glob="csv/*.csv")
+    files.apply_hints(incremental=dlt.sources.incremental("modification_date"))
+    pipeline.extract(
+        (files | read_csv(parallel_files=3, ordered_files=ordered_files)).with_name("csv")
+    )
+    assert collector.counters["Files read"] == 0
+
+
+@pytest.mark.parametrize("ordered_files", [True, False])
+def test_read_files_buffers_limited_items(ordered_files: bool) -> None:
+    from collections import Counter
+    from time import sleep
+
+    from dlt.sources.filesystem.helpers import read_files
+    from dlt.sources.filesystem.settings import PARALLEL_FILES_MAX_CHUNKS
+
+    produced: Counter[str] = Counter()
+
+    def _read_file(file_obj: FileItemDict) -> Any:
+        for idx in range(100):
+            produced[file_obj["file_name"]] += 1
+            yield [file_obj["file_name"], idx]
+
+    items: List[Any] = [{"file_name": f"f{idx}", "size_in_bytes": 0} for idx in range(4)]
+    expected = [[f"f{f_idx}", idx] for f_idx in range(4) for idx in range(100)]
+    result = list(read_files(items, _read_file, parallel_files=4, ordered_files=ordered_files))
+    if ordered_files:
+        assert result == expected
+    else:
+        assert sorted(result) == expected
+
+    # files are not read into memory ahead of the caller
+    produced.clear()
+    reader = read_files(items, _read_file, parallel_files=4, ordered_files=ordered_files)
+    next(reader)
+    sleep(0.5)
+    assert sum(produced.values()) <= PARALLEL_FILES_MAX_CHUNKS * 4 + 4 + 1
+    # closing the reader stops reading threads
+    reader.close()
+
+    def _fail_file(file_obj: FileItemDict) -> Any:
+        yield from _read_file(file_obj)
+        if file_obj["file_name"] == "f2":
+            raise ValueError(file_obj["file_name"])
+
+    with pytest.raises(ValueError):
+        list(read_files(items, _fail_file, parallel_files=4, ordered_files=ordered_files))
@@ -324,6 +324,87 @@ def test_cursor_path_complex_expression(
     assert "must be a simple column name" in str(excinfo.value)
 
 
+def test_make_partition_clauses(sql_source_db: SQLAlchemySourceDB) -> None:
+    table = sql_source_db.get_table("chat_message")
+    ids = sql_source_db.table_infos["chat_message"]["ids"]
+
+    # primary key is used by default
+    loader = TableLoader(
+        sql_source_db.engine, "sqlalchemy", table, table_to_columns(table), partitions=4
+    )
+    assert loader.partition_column is table.c.id
+    clauses = loader.make_partition_clauses()
+    assert len(clauses) == 4
+    # partitions select disjoint rows that sum up to the whole table
+    with sql_source_db.engine.connect() as conn:
+        partition_ids = [
+            [row.id for row in conn.execute(loader.make_query(clause))] for clause in clauses
+        ]
+    assert all(partition_ids)
+    assert sorted(sum(partition_ids, [])) == sorted(ids)
+
+    # datetime column is split as well
+    loader = TableLoader(
+        sql_source_db.engine,
+        "sqlalchemy",
+        table,
+        table_to_columns(table),
+        partitions=3,
+        partition_column="created_at",
+    )
+    assert len(loader.make_partition_clauses()) == 3
+
+    with pytest.raises(KeyError):
+        TableLoader(
+            sql_source_db.engine,
+            "sqlalchemy",
+            table,
+            table_to_columns(table),
+            partitions=2,
+            partition_column="not_a_column",
+        )
+
+    # text columns cannot be split into ranges
+    loader = TableLoader(
+        sql_source_db.engine,
+        "sqlalchemy",
+        table,
+        table_to_columns(table),
+        partitions=2,
+        partition_column="content",
+    )
+    with pytest.raises(ValueError):
+        loader.make_partition_clauses()
+
+
+def test_partitions_capped_at_pool_size(sql_source_db: SQLAlchemySourceDB) -> None:
+    table = sql_source_db.get_table("chat_message")
+    ids = sql_source_db.table_infos["chat_message"]["ids"]
+    # pool without overflow times out quickly if more partitions were read at once
+    engine = sa.create_engine(sql_source_db.engine.url, pool_size=2, max_overflow=0, pool_timeout=1)
+    try:
+        loader = TableLoader(engine, "sqlalchemy", table, table_to_columns(table), partitions=8)
+        assert len(loader.make_partition_clauses()) == 8
+        rows = [row["id"] for chunk in loader.load_rows() for row in chunk]
+        assert sorted(rows) == sorted(ids)
+    finally:
+        engine.dispose()
+
+
+def test_partitions_with_row_order(sql_source_db: SQLAlchemySourceDB) -> None:
+    table = sql_source_db.get_table("chat_message")
+
+    with pytest.raises(ValueError):
+        TableLoader(
+            sql_source_db.engine,
+            "sqlalchemy",
+            table,
+            table_to_columns(table),
+            incremental=dlt.sources.incremental("id", row_order="asc"),
+            partitions=2,
+        )
+
+
 def mock_json_column(field: str) -> TDataItem:
     """"""
     import pyarrow as pa
@@ -406,6 +406,38 @@ def test_load_sql_table_resource_incremental_end_value(
             assert rows[-1]["id"] == start_id
 
 
+@pytest.mark.parametrize("backend", ["sqlalchemy", "pyarrow", "pandas", "connectorx"])
+def test_load_sql_table_resource_partitions(
+    sql_source_db: SQLAlchemySourceDB, backend: TableBackend
+) -> None:
+    ids = sql_source_db.table_infos["chat_message"]["ids"]
+    start_id = ids[len(ids) // 4]
+    expected_count = len([id_ for id_ in ids if id_ >= start_id])
+
+    def make_source():
+        return sql_table(
+            credentials=sql_source_db.credentials,
+            schema=sql_source_db.schema,
+            table="chat_message",
+            backend=backend,
+            chunk_size=100,
+            incremental=dlt.sources.incremental("id", initial_value=start_id),
+            partitions=4,
+        )
+
+    pipeline = dlt.pipeline(pipeline_name=uniq_id(), destination="duckdb", dev_mode=True)
+    load_info = pipeline.run(make_source())
+    assert_load_info(load_info)
+    # all partitions advance the same cursor
+    assert load_table_counts(pipeline, "chat_message")["chat_message"] == expected_count
+    state = pipeline.state["sources"][pipeline.default_schema_name]["resources"]["chat_message"]
+    assert state["incremental"]["id"]["last_value"] == max(ids)
+
+    # nothing new to load
+    pipeline.run(make_source())
+    assert load_table_counts(pipeline, "chat_message")["chat_message"] == expected_count
+
+
 @pytest.mark.parametrize("backend", ["sqlalchemy", "pyarrow", "pandas", "connectorx"])
 @pytest.mark.parametrize("defer_table_reflect", (False, True))
 def test_load_sql_table_resource_select_columns(
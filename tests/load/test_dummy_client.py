@@ -129,15 +129,32 @@ def test_big_loadpackages() -> None:
         load.run(pool)
     duration = float(time() - start_time)
 
-    # sanity check
-    assert duration > 2
-    # we want 1000 empty processed jobs to need less than 15 seconds total (locally it runs in 5)
+    # we want 1000 empty processed jobs to need less than 15 seconds total (locally it runs in 1)
     assert duration < 15
 
     # we should have 1000 jobs processed
     assert len(dummy_impl.JOBS) == 1000
 
 
+def test_load_loop_wakes_on_finished_jobs() -> None:
+    load = setup_loader()
+    # finished jobs must wake up the loop, it should never wait that long
+    load._run_loop_sleep_duration = 60.0
+    load_id, schema = prepare_load_package(load.load_storage, SMALL_FILES, jobs_per_case=50)
+    start_time = time()
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        load.run(pool)
+    assert time() - start_time < 30
+    assert len(dummy_impl.JOBS) == 100
+
+    scheduler_metrics = load._step_info_metrics(load_id)[0]["scheduler_metrics"]
+    assert scheduler_metrics.jobs_count == 100
+    assert scheduler_metrics.slots == load.config.workers
+    assert 0 < scheduler_metrics.max_queue_wait_seconds < 30
+    assert scheduler_metrics.queue_wait_seconds <= scheduler_metrics.max_queue_wait_seconds
+    assert 0 < scheduler_metrics.utilization <= 1.0
+
+
 def test_get_new_jobs_info() -> None:
     load = setup_loader()
     load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
@@ -335,6 +335,51 @@ def test_schema_update_alter_table(client: SqlJobClientBase) -> None:
         assert storage_table_cols["col4"]["data_type"] == "timestamp"
 
 
+@pytest.mark.parametrize(
+    "client", destinations_configs(default_sql_configs=True), indirect=True, ids=lambda x: x.name
+)
+def test_schema_update_parallel_sync(client: SqlJobClientBase) -> None:
+    schema = client.schema
+    table_names = ["event_test_table" + uniq_id() for _ in range(5)]
+    for table_name in table_names:
+        schema.update_table(new_table(table_name, columns=[schema._infer_column("col1", "a")]))
+    schema._bump_version()
+
+    # fetch 2 tables per information schema query and create tables concurrently
+    client.config.schema_sync_workers = 3
+    with patch.object(SqlJobClientBase, "INFO_TABLES_QUERY_THRESHOLD", 2), patch.object(
+        client.capabilities, "supports_ddl_transactions", False
+    ), patch.object(
+        client, "get_storage_tables", wraps=client.get_storage_tables
+    ) as get_storage_tables:
+        schema_update = client.update_stored_schema()
+    assert set(table_names).issubset(schema_update.keys())
+    # information schema was queried in batches of 2 tables
+    batches = [call.args[0] for call in get_storage_tables.call_args_list]
+    assert all(len(batch) <= 2 for batch in batches)
+    assert sorted(name for batch in batches for name in batch) == sorted(schema.tables.keys())
+    for table_name in table_names:
+        exists, storage_columns = client.get_storage_table(table_name)
+        assert exists
+        assert len(storage_columns) == 1
+
+    # alter tables in parallel
+    for table_name in table_names:
+        schema.update_table(new_table(table_name, columns=[schema._infer_column("col2", 1)]))
+    schema._bump_version()
+    with patch.object(client.capabilities, "supports_ddl_transactions", False):
+        schema_update = client.update_stored_schema()
+    assert set(schema_update.keys()) == set(table_names)
+    for table_name in table_names:
+        _, storage_columns = client.get_storage_table(table_name)
+        assert len(storage_columns) == 2
+
+    # unchanged schema is found by its hash, storage is not queried
+    with patch.object(SqlJobClientBase, "_get_storage_tables_for_update") as storage_tables:
+        assert client.update_stored_schema() == {}
+    storage_tables.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "client", destinations_configs(default_sql_configs=True), indirect=True, ids=lambda x: x.name
 )
@@ -1,4 +1,7 @@
+import os
+import gzip
 import pytest
+from collections import deque
 from fnmatch import fnmatch
 from typing import Dict, Iterator, List, Sequence, Tuple
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
@@ -10,13 +13,24 @@ from dlt.common.schema.utils import new_table
 from dlt.common.storages.exceptions import SchemaNotFoundError
 from dlt.common.typing import StrAny
 from dlt.common.data_types import TDataType
-from dlt.common.storages import NormalizeStorage, LoadStorage, ParsedLoadJobFileName, PackageStorage
+from dlt.common.storages import (
+    FileStorage,
+    NormalizeStorage,
+    LoadStorage,
+    ParsedLoadJobFileName,
+    PackageStorage,
+)
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.configuration.container import Container
 
 from dlt.extract.extract import ExtractStorage
 from dlt.normalize import Normalize
-from dlt.normalize.worker import group_worker_files
+from dlt.normalize.worker import (
+    decompress_split_files,
+    split_worker_files,
+    take_worker_units,
+    TWorkUnit,
+)
 from dlt.normalize.exceptions import NormalizeJobFailed
 
 from tests.cases import JSON_TYPED_DICT, JSON_TYPED_DICT_TYPES
@@ -25,6 +39,7 @@ from tests.utils import (
     MockPipeline,
     assert_no_dict_key_starts_with,
     clean_test_storage,
+    test_storage,
     init_test_logging,
 )
 from tests.normalize.utils import (
@@ -298,6 +313,36 @@ def test_multiprocessing_row_counting(
     assert row_counts == step_info.row_counts
 
 
+@pytest.mark.parametrize("disable_compression", [False, True])
+def test_multiprocessing_split_files(raw_normalize: Normalize, disable_compression: bool) -> None:
+    # write many lines in extracted file
+    os.environ["DATA_WRITER__BUFFER_MAX_ITEMS"] = "10"
+    os.environ["DATA_WRITER__DISABLE_COMPRESSION"] = str(disable_compression)
+    load_id = extract_cases(raw_normalize, ["github.events.load_page_1_duck"])
+    extracted_storage = raw_normalize.normalize_storage.extracted_packages
+    files = extracted_storage.list_new_jobs(load_id)
+    for file in files:
+        path = extracted_storage.storage.make_full_path(file)
+        assert FileStorage.is_gzipped(path) is not disable_compression
+    # split every file
+    raw_normalize.config.split_file_min_bytes = 1
+    with ProcessPoolExecutor(max_workers=4) as p:
+        raw_normalize.run(p)
+    step_info = raw_normalize.get_step_info(MockPipeline("multiprocessing_pipeline", True))  # type: ignore[abstract]
+    assert step_info.row_counts["events"] == 100
+    assert step_info.row_counts["events__payload__pull_request__requested_reviewers"] == 24
+    metrics = step_info.metrics[step_info.loads_ids[0]][0]
+    # each part was written to separate file(s)
+    events_jobs = [job_id for job_id in metrics["job_metrics"] if job_id.startswith("events.")]
+    assert len(events_jobs) >= 4
+    # all parts were processed by workers
+    worker_metrics = metrics["worker_metrics"]
+    assert sum(m.units_count for m in worker_metrics.values()) == 4
+    for m in worker_metrics.values():
+        assert m.busy_seconds > 0
+        assert 0 < m.utilization <= 1.0
+
+
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
 def test_normalize_many_packages(
     caps: DestinationCapabilitiesContext, rasa_normalize: Normalize
@@ -508,43 +553,66 @@ def test_collect_metrics_on_exception(raw_normalize: Normalize) -> None:
     raw_normalize.get_step_info(MockPipeline("multiprocessing_pipeline", True))  # type: ignore[abstract]
 
 
-def test_group_worker_files() -> None:
-    files = ["f%03d" % idx for idx in range(0, 100)]
+def test_split_worker_files() -> None:
+    files = ["tab1.1.0.typed-jsonl", "chd.3.0.typed-jsonl", "tab1.2.0.parquet"]
+    sizes = [1000, 100, 1000]
 
-    assert group_worker_files([], 4) == []
-    assert group_worker_files(["f001"], 1) == [["f001"]]
-    assert group_worker_files(["f001"], 100) == [["f001"]]
-    assert group_worker_files(files[:4], 4) == [["f000"], ["f001"], ["f002"], ["f003"]]
-    assert group_worker_files(files[:5], 4) == [
-        ["f000"],
-        ["f001"],
-        ["f002"],
-        ["f003", "f004"],
+    assert split_worker_files([], [], 4, 10) == []
+    # single worker does not split
+    assert split_worker_files(files, sizes, 1, 10) == [
+        TWorkUnit("chd.3.0.typed-jsonl"),
+        TWorkUnit("tab1.1.0.typed-jsonl"),
+        TWorkUnit("tab1.2.0.parquet"),
     ]
-    assert group_worker_files(files[:8], 4) == [
-        ["f000", "f001"],
-        ["f002", "f003"],
-        ["f004", "f005"],
-        ["f006", "f007"],
+    # disabled split
+    assert len(split_worker_files(files, sizes, 4, None)) == 3
+    # only json files are split, parts of the same file are far apart
+    assert split_worker_files(files, sizes, 3, 300) == [
+        TWorkUnit("chd.3.0.typed-jsonl", 0, 1),
+        TWorkUnit("tab1.1.0.typed-jsonl", 0, 3),
+        TWorkUnit("tab1.2.0.parquet", 0, 1),
+        TWorkUnit("tab1.1.0.typed-jsonl", 1, 3),
+        TWorkUnit("tab1.1.0.typed-jsonl", 2, 3),
     ]
-    assert group_worker_files(files[:8], 3) == [
-        ["f000", "f001"],
-        ["f002", "f003", "f006"],
-        ["f004", "f005", "f007"],
-    ]
-    assert group_worker_files(files[:5], 3) == [
-        ["f000"],
-        ["f001", "f003"],
-        ["f002", "f004"],
+    # number of parts depends on file size
+    assert split_worker_files(files[:1], sizes[:1], 8, 500) == [
+        TWorkUnit("tab1.1.0.typed-jsonl", 0, 2),
+        TWorkUnit("tab1.1.0.typed-jsonl", 1, 2),
     ]
 
-    # check if sorted
-    files = ["tab1.1", "chd.3", "tab1.2", "chd.4", "tab1.3"]
-    assert group_worker_files(files, 3) == [
-        ["chd.3"],
-        ["chd.4", "tab1.2"],
-        ["tab1.1", "tab1.3"],
-    ]
+
+def test_decompress_split_files(test_storage: FileStorage) -> None:
+    content = b"".join(b'{"id": %d}\n' % idx for idx in range(1000))
+    files = ["big.1.0.typed-jsonl", "small.2.0.typed-jsonl", "big.3.0.parquet"]
+    for file in files:
+        with gzip.open(test_storage.make_full_path(file), "wb") as f:
+            f.write(content[:200] if file.startswith("small.") else content)
+    compressed_sizes = [os.path.getsize(test_storage.make_full_path(file)) for file in files]
+
+    # single worker does not split so nothing is decompressed
+    assert decompress_split_files(test_storage, files, 1, 500) == compressed_sizes
+    # only big json files are decompressed in place
+    sizes = decompress_split_files(test_storage, files, 4, 500)
+    assert sizes == [len(content), compressed_sizes[1], compressed_sizes[2]]
+    assert not FileStorage.is_gzipped(test_storage.make_full_path(files[0]))
+    assert FileStorage.is_gzipped(test_storage.make_full_path(files[1]))
+    assert FileStorage.is_gzipped(test_storage.make_full_path(files[2]))
+    assert test_storage.load(files[0]) == content.decode()
+    assert len(os.listdir(test_storage.storage_path)) == 3
+    # decompressed files are kept
+    assert decompress_split_files(test_storage, files, 4, 500) == sizes
+
+
+def test_take_worker_units() -> None:
+    units = deque(TWorkUnit(f"f{idx}") for idx in range(10))
+    # batches get smaller
+    batches = []
+    while units:
+        batches.append(len(take_worker_units(units, 4)))
+    assert batches == [3, 2, 2, 1, 1, 1]
+    units = deque([TWorkUnit("f0")])
+    assert take_worker_units(units, 4) == [TWorkUnit("f0")]
+    assert len(units) == 0
 
 
 EXPECTED_ETH_TABLES = [
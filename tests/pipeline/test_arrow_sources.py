@@ -155,6 +155,22 @@ def test_normalize_jsonl(item_type: TPythonTableFormat, is_list: bool):
         assert res_item == exp_item
 
 
+@pytest.mark.parametrize("loader_file_format", [None, "parquet"])
+def test_explicit_loader_file_format(loader_file_format: str) -> None:
+    # postgres loads parquet with binary COPY only when requested
+    item, _, _ = arrow_table_all_data_types("arrow-table", include_json=False)
+
+    pipeline = dlt.pipeline("arrow_" + uniq_id(), destination="postgres")
+    pipeline.extract(dlt.resource(item, name="some_data"))
+    pipeline.normalize(loader_file_format=loader_file_format)  # type: ignore[arg-type]
+
+    load_id = pipeline.list_normalized_load_packages()[0]
+    jobs = pipeline._get_load_storage().normalized_packages.list_new_jobs(load_id)
+    data_jobs = [job for job in jobs if "some_data" in job]
+    assert len(data_jobs) == 1
+    assert data_jobs[0].endswith(loader_file_format or "csv")
+
+
 @pytest.mark.parametrize("item_type", ["arrow-table", "arrow-batch"])
 def test_add_map(item_type: TPythonTableFormat):
     item, _, _ = arrow_table_all_data_types(item_type, num_rows=200)
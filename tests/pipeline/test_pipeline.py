@@ -45,6 +45,7 @@ from dlt.extract.exceptions import InvalidResourceDataTypeBasic, PipeGenInvalid,
 from dlt.extract.extract import ExtractStorage
 from dlt.extract import DltResource, DltSource
 from dlt.extract.extractors import MaterializedEmptyList
+from dlt.load import Load
 from dlt.load.exceptions import LoadClientJobFailed
 from dlt.normalize.exceptions import NormalizeJobFailed
 from dlt.pipeline.exceptions import InvalidPipelineName, PipelineNotActive, PipelineStepFailed
@@ -59,6 +60,7 @@ from tests.pipeline.utils import (
     assert_load_info,
     airtable_emojis,
     assert_only_table_columns,
+    assert_table,
     load_data_table_counts,
     load_tables_to_dicts,
     many_delayed,
@@ -287,7 +289,7 @@ def test_file_format_resolution() -> None:
     with pytest.raises(DestinationIncompatibleLoaderFileFormatException):
         pipeline = dlt.pipeline(pipeline_name="managed_state_pipeline", destination="postgres")
         pipeline.config.restore_from_destination = False
-        pipeline.run([1, 2, 3], table_name="numbers", loader_file_format="parquet")
+        pipeline.run([1, 2, 3], table_name="numbers", loader_file_format="jsonl")
 
     # check invalid input
     with pytest.raises(DestinationIncompatibleLoaderFileFormatException):
@@ -936,6 +938,58 @@ def test_run_load_pending() -> None:
     assert len(load_info.loads_ids) == 1
 
 
+def test_run_overlap_normalize_and_load(monkeypatch) -> None:
+    os.environ["OVERLAP_NORMALIZE_AND_LOAD"] = "True"
+    loading_threads: List[str] = []
+    load_single_package = Load.load_single_package
+
+    def _load_single_package(self, load_id, schema):
+        loading_threads.append(threading.current_thread().name)
+        return load_single_package(self, load_id, schema)
+
+    monkeypatch.setattr(Load, "load_single_package", _load_single_package)
+
+    @dlt.source
+    def source_a():
+        return dlt.resource([1, 2, 3], name="numbers")
+
+    @dlt.source
+    def source_b():
+        return dlt.resource(["a", "b"], name="letters")
+
+    p = dlt.pipeline(pipeline_name="pipe_" + uniq_id(), destination="duckdb", dev_mode=True)
+    # each source is extracted into a separate package
+    load_info = p.run([source_a(), source_b()])
+    assert_load_info(load_info, expected_load_packages=2)
+    # packages were loaded in the background while normalizing
+    assert len(loading_threads) == 2
+    assert all(name.startswith("dlt-pool-") for name in loading_threads)
+    assert_table(p, "numbers", [1, 2, 3], schema_name="source_a")
+    assert_table(p, "letters", ["a", "b"], schema_name="source_b")
+    assert p._background_load is None
+    assert "normalize" in [step.step for step in p.last_trace.steps]
+
+    # pending packages are also loaded while normalizing
+    loading_threads.clear()
+    p.extract([source_a(), source_b()])
+    load_info = p.run()
+    assert_load_info(load_info, expected_load_packages=2)
+    assert len(loading_threads) == 2
+    assert p.list_extracted_load_packages() == []
+    assert p.list_normalized_load_packages() == []
+
+    # load must use the same arguments as the load step started while normalizing
+    p.extract([source_a(), source_b()])
+    with p._load_while_normalizing():
+        p.normalize()
+    with pytest.raises(ValueError):
+        p.load(workers=5)
+    # background load was joined and loaded all normalized packages
+    assert p._background_load is None
+    assert p.list_normalized_load_packages() == []
+    assert len(p.list_completed_load_packages()) == 6
+
+
 def test_retry_load() -> None:
     os.environ["COMPLETED_PROB"] = "1.0"
     retry_count = 2
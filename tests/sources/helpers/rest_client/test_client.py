@@ -23,7 +23,12 @@ from dlt.sources.helpers.rest_client.auth import (
 )
 from dlt.sources.helpers.rest_client.client import Hooks
 from dlt.sources.helpers.rest_client.exceptions import IgnoreResponseException
-from dlt.sources.helpers.rest_client.paginators import JSONLinkPaginator, BaseReferencePaginator
+from dlt.sources.helpers.rest_client.paginators import (
+    JSONLinkPaginator,
+    BaseReferencePaginator,
+    OffsetPaginator,
+    PageNumberPaginator,
+)
 
 from .conftest import DEFAULT_PAGE_SIZE, DEFAULT_TOTAL_PAGES, assert_pagination
 
@@ -156,6 +161,61 @@ class TestRESTClient:
         pages = list(pages_iter)
         assert pages == []
 
+    @pytest.mark.parametrize("ordered_pages", (True, False))
+    def test_paginate_parallel_pages(self, rest_client: RESTClient, ordered_pages: bool) -> None:
+        paginator = PageNumberPaginator(base_page=1, total_path="total_pages")
+        pages = list(
+            rest_client.paginate(
+                "/posts",
+                paginator=paginator,
+                parallel_pages=4,
+                ordered_pages=ordered_pages,
+            )
+        )
+        # paginator state is the same as after sequential pagination
+        assert paginator.current_value == DEFAULT_TOTAL_PAGES + 1
+        assert paginator.has_next_page is False
+        if not ordered_pages:
+            pages = sorted(pages, key=lambda page: page[0]["id"])
+        assert_pagination(pages)
+        # each prefetched page has its own request
+        assert [page.request.params["page"] for page in pages[1:]] == list(
+            range(2, DEFAULT_TOTAL_PAGES + 1)
+        )
+
+        pages = list(
+            rest_client.paginate(
+                "/posts_offset_limit",
+                paginator=OffsetPaginator(limit=5, total_path="total_records"),
+                parallel_pages=4,
+                ordered_pages=ordered_pages,
+            )
+        )
+        if not ordered_pages:
+            pages = sorted(pages, key=lambda page: page[0]["id"])
+        assert_pagination(pages)
+
+    def test_paginate_parallel_pages_stops_on_empty_page(self, rest_client: RESTClient) -> None:
+        # maximum offset is past the last record so pages after the first empty page are dropped
+        pages = list(
+            rest_client.paginate(
+                "/posts_offset_limit",
+                paginator=OffsetPaginator(limit=5, total_path=None, maximum_offset=1000),
+                parallel_pages=8,
+            )
+        )
+        assert_pagination(pages)
+
+    def test_paginate_parallel_pages_sequential_for_cursors(self, rest_client: RESTClient) -> None:
+        pages = list(
+            rest_client.paginate(
+                "/posts",
+                paginator=JSONLinkPaginator(next_url_path="next_page"),
+                parallel_pages=4,
+            )
+        )
+        assert_pagination(pages)
+
     def test_basic_auth_success(self, rest_client: RESTClient):
         response = rest_client.get(
             "/protected/posts/basic-auth",
@@ -305,6 +305,36 @@ class TestOffsetPaginator:
         assert paginator.current_value == 100
         assert paginator.has_next_page is False
 
+    def test_remaining_requests(self):
+        paginator = OffsetPaginator(offset=0, limit=10)
+        request = Request(params={"foo": "bar"})
+        paginator.init_request(request)
+        # not known before the first response
+        assert paginator.remaining_requests(request) is None
+
+        paginator.update_state(Mock(Response, json=lambda: {"total": 35}), data=NON_EMPTY_PAGE)
+        paginator.update_request(request)
+        requests = list(paginator.remaining_requests(request))
+        assert [r.params for r in requests] == [
+            {"foo": "bar", "offset": offset, "limit": 10} for offset in (10, 20, 30)
+        ]
+        # original request is not modified
+        assert request.params["offset"] == 10
+
+        # stops at maximum offset if smaller than total
+        paginator = OffsetPaginator(offset=0, limit=10, maximum_offset=20)
+        paginator.init_request(request)
+        paginator.update_state(Mock(Response, json=lambda: {"total": 35}), data=NON_EMPTY_PAGE)
+        paginator.update_request(request)
+        assert [r.params["offset"] for r in paginator.remaining_requests(request)] == [10]
+
+        # unknown end
+        paginator = OffsetPaginator(offset=0, limit=10, total_path=None)
+        paginator.init_request(request)
+        paginator.update_state(Mock(Response, json=lambda: {}), data=NON_EMPTY_PAGE)
+        assert paginator.has_next_page is True
+        assert paginator.remaining_requests(request) is None
+
     def test_client_pagination(self, rest_client):
         pages_iter = rest_client.paginate(
             "/posts_offset_limit",
@@ -213,6 +213,34 @@ def test_posts_without_key(mock_api_server):
     ]
 
 
+def test_posts_parallel_pages(mock_api_server):
+    mock_source = rest_api_source(
+        {
+            "client": {"base_url": "https://api.example.com"},
+            "resources": [
+                {
+                    "name": "posts",
+                    "endpoint": {
+                        "path": "posts_offset_limit",
+                        "paginator": {
+                            "type": "offset",
+                            "limit": 5,
+                            "total_path": "total_records",
+                        },
+                        "parallel_pages": 4,
+                    },
+                },
+            ],
+        }
+    )
+
+    res = list(mock_source.with_resources("posts"))
+
+    assert res == [
+        {"id": i, "title": f"Post {i}"} for i in range(DEFAULT_PAGE_SIZE * DEFAULT_TOTAL_PAGES)
+    ]
+
+
 def test_load_mock_api_typeddict_config(mock_api_server):
     pipeline = dlt.pipeline(
         pipeline_name="rest_api_mock",
@@ -4,6 +4,8 @@ from uuid import uuid4
 import pyarrow as pa
 import pytest
 
+from dlt.common import Decimal
+from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.sources.sql_database.arrow_helpers import row_tuples_to_arrow
 
 
@@ -112,3 +114,43 @@ def test_row_tuples_to_arrow_detects_range_type() -> None:
     assert pa.types.is_int64(range_fields["upper"].type)
     assert pa.types.is_boolean(range_fields["empty"].type)
     assert pa.types.is_string(range_fields["bounds"].type)
+
+
+def test_row_tuples_to_arrow_converts_whole_chunk() -> None:
+    # mismatched values are not in the first row
+    rows = [
+        (1, Decimal("1.10"), "{}", None),
+        (2, 2.2, {"a": 1}, "x"),
+        (3, "3.30", {1, 2}, "y"),
+    ]
+    columns = {
+        "id": {"name": "id", "data_type": "bigint", "nullable": False},
+        "amount": {"name": "amount", "data_type": "decimal", "precision": 10, "scale": 2},
+        "payload": {"name": "payload", "data_type": "json"},
+        "label": {"name": "label"},
+    }
+    result = row_tuples_to_arrow(rows, columns=columns, tz="UTC")  # type: ignore
+
+    assert result.column_names == ["id", "amount", "payload", "label"]
+    assert pa.types.is_decimal(result["amount"].type)
+    assert [str(v) for v in result["amount"].to_pylist()] == ["1.10", "2.20", "3.30"]
+    assert result["payload"].to_pylist() == ["{}", '{"a":1}', "[1,2]"]
+    assert pa.types.is_string(result["label"].type)
+
+    # empty chunk keeps the schema of known columns
+    empty = row_tuples_to_arrow([], columns=columns, tz="UTC")  # type: ignore
+    assert empty.num_rows == 0
+    assert empty.column_names == ["id", "amount", "payload"]
+
+
+def test_row_tuples_to_arrow_caps_precision() -> None:
+    columns = {"ts": {"name": "ts", "data_type": "timestamp"}}
+    rows = [(datetime(2024, 1, 1, tzinfo=timezone.utc),)]
+    caps = DestinationCapabilitiesContext.generic_capabilities()
+    result = row_tuples_to_arrow(rows, caps, columns=columns, tz="UTC")  # type: ignore
+    assert result["ts"].type == pa.timestamp("us", tz="UTC")
+    # other caps with different precision do not reuse the cached arrow schema
+    caps = DestinationCapabilitiesContext.generic_capabilities()
+    caps.timestamp_precision = 3
+    result = row_tuples_to_arrow(rows, caps, columns=columns, tz="UTC")  # type: ignore
+    assert result["ts"].type == pa.timestamp("ms", tz="UTC")